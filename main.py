@@ -1,31 +1,167 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
 import logging
 import sys
+from contextlib import nullcontext
+from pathlib import Path
 
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 
-from scraper.config import get_config
-from scraper.extractors.course import extract_course
-from scraper.output import write_course
-from scraper.setup import run_setup_wizard
+from scraper.batch import load_jobs, log_batch_report, run_batch_async
+from scraper.browser import (
+    apply_profile,
+    apply_profile_async,
+    context_options,
+    launch_options,
+    viewport,
+)
+from scraper.config import DEFAULT_CHECKPOINT_DIR, Config, OutputFormat, get_config
+from scraper.daemon import DEFAULT_DAEMON_HOST, DEFAULT_DAEMON_PORT, serve
+from scraper.extractors.async_course import download_course_assets_async, extract_course_async
+from scraper.extractors.course import checkpoint_store, extract_course
+from scraper.formats.pdf import ThemeRegistry
+from scraper.har import HarArchive, record_options, replay_har, replay_har_async
+from scraper.network import asset_capture
+from scraper.output import assets_dir_for, write_course
+from scraper.package import ScormPackage
+from scraper.selection import has_selection, merge_unselected
+from scraper.session import (
+    SavedSession,
+    load_session,
+    open_scorm_page,
+    open_scorm_page_async,
+    save_session,
+)
+from scraper.setup import normalize_course_name, run_setup_wizard
+from scraper.snapshot import SNAPSHOT_FILENAME, CourseSnapshot, write_snapshot
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def main() -> None:
-    run_setup_wizard()
-    settings = get_config()
+def _write(course, settings: Config, *, snapshot: bool = True) -> None:
+    write_course(
+        course,
+        settings.output_path,
+        output_formats=settings.output_formats,
+        pdf_theme=settings.pdf_theme,
+    )
+    if snapshot and settings.write_snapshot:
+        write_snapshot(
+            course,
+            Path(settings.output_path) / SNAPSHOT_FILENAME,
+            assets_dir=assets_dir_for(settings.output_path),
+        )
 
-    if not settings.base_url:
-        logger.error('Base URL is not set.')
-        sys.exit(1)
 
+def _write_scraped(course, settings: Config) -> None:
+    """Write a scraped course; after a partial scrape the other lessons come from the last output."""
+    if not has_selection(settings):
+        _write(course, settings)
+        return
+    snapshot_path = Path(settings.output_path) / SNAPSHOT_FILENAME
+    # The previous snapshot also serves its assets while the merged course is rendered.
+    with CourseSnapshot(snapshot_path) if snapshot_path.exists() else nullcontext() as previous:
+        base = previous.to_course() if previous else None
+        merge_unselected(course, settings, base=base, store=checkpoint_store(course.title))
+        _write(course, settings, snapshot=False)
+    if settings.write_snapshot:
+        write_snapshot(course, snapshot_path, assets_dir=assets_dir_for(settings.output_path))
+
+
+def _scrape_context_options(settings: Config, session: SavedSession | None) -> dict:
+    options = context_options(settings)
+    if session:
+        options['storage_state'] = session.storage_state_path
+    if settings.har_record:
+        options.update(record_options(settings.har_record))
+    return options
+
+
+async def main_async(settings: Config, session: SavedSession | None = None) -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(**launch_options(settings))
+        context = await browser.new_context(**_scrape_context_options(settings, session))
+        await apply_profile_async(context, settings)
+        if settings.har_replay:
+            await replay_har_async(context, settings.har_replay)
+        if session or settings.har_replay:
+            scorm_page = await open_scorm_page_async(context, settings.scorm_url)
+        else:
+            page = await context.new_page()
+            await page.goto(settings.base_url)
+
+            logger.info('Log in to Blackboard and open the SCORM in pop-up mode.')
+            async with page.expect_popup() as popup_info:
+                await asyncio.to_thread(input, 'Press ENTER after the SCORM popup is open.')
+
+            scorm_page = await popup_info.value
+            await scorm_page.set_viewport_size(viewport(settings))
+            await scorm_page.wait_for_load_state()
+
+        capture = asset_capture(settings)
+        try:
+            course = await extract_course_async(scorm_page, capture=capture)
+            await download_course_assets_async(scorm_page, course, assets_dir_for(settings.output_path))
+        finally:
+            if capture:
+                capture.release()
+        await context.close()  # Writes the HAR archive when recording.
+
+    # Blocks hold offline snapshots and their assets are on disk, so rendering needs no browser.
+    _write_scraped(course, settings)
+
+
+def run_scrape(settings: Config, session: SavedSession | None = None) -> None:
+    """Scrape one course: with a saved `session` unattended, otherwise after a manual login.
+
+    When replaying a HAR archive no session is needed, and assets are read from the archive.
+    """
+    with HarArchive(settings.har_replay) if settings.har_replay else nullcontext():
+        if settings.async_engine:
+            asyncio.run(main_async(settings, session))
+        else:
+            _run_scrape_sync(settings, session)
+
+
+def _run_scrape_sync(settings: Config, session: SavedSession | None) -> None:
+    with sync_playwright() as p:
+        browser = p.chromium.launch(**launch_options(settings))
+        context = browser.new_context(**_scrape_context_options(settings, session))
+        apply_profile(context, settings)
+        if settings.har_replay:
+            replay_har(context, settings.har_replay)
+        if session or settings.har_replay:
+            scorm_page = open_scorm_page(context, settings.scorm_url)
+        else:
+            page = context.new_page()
+            page.goto(settings.base_url)
+
+            logger.info('Log in to Blackboard and open the SCORM in pop-up mode.')
+            with page.expect_popup() as popup_info:
+                input('Press ENTER after the SCORM popup is open.')
+
+            scorm_page = popup_info.value
+            scorm_page.set_viewport_size(viewport(settings))
+            scorm_page.wait_for_load_state()
+
+        capture = asset_capture(settings)
+        try:
+            course = extract_course(scorm_page, capture=capture)
+            _write_scraped(course, settings)
+        finally:
+            if capture:
+                capture.release()
+        context.close()  # Writes the HAR archive when recording.
+
+
+def run_login(settings: Config) -> None:
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)
-        context = browser.new_context(
-            viewport={'width': settings.viewport_width, 'height': settings.viewport_height},
-            screen={'width': settings.viewport_width, 'height': settings.viewport_height},
-        )
+        context = browser.new_context(**context_options(settings, lean=False))
         page = context.new_page()
         page.goto(settings.base_url)
 
@@ -34,16 +170,230 @@ def main() -> None:
             input('Press ENTER after the SCORM popup is open.')
 
         scorm_page = popup_info.value
-        scorm_page.set_viewport_size({'width': settings.viewport_width, 'height': settings.viewport_height})
         scorm_page.wait_for_load_state()
+        save_session(context, settings.session_dir, scorm_url=settings.scorm_url or scorm_page.url)
 
-        course = extract_course(scorm_page)
-        write_course(
-            course,
-            settings.output_path,
-            output_formats=settings.output_formats,
-            pdf_theme=settings.pdf_theme,
+
+def run_package(settings: Config, package_path: str, *, name_from_title: bool = False) -> None:
+    """Render a downloaded SCORM `.zip` export without a browser."""
+    with ScormPackage(package_path) as package:
+        course = package.to_course()
+        if name_from_title:
+            settings.course_name = normalize_course_name(course.title)
+            settings.output_path = f'./output/{settings.course_name}'
+        _write(course, settings)
+
+
+def run_render(settings: Config, snapshot_path: str, *, name_from_title: bool = False) -> None:
+    """Re-render a saved course snapshot without a browser."""
+    with CourseSnapshot(snapshot_path) as snapshot:
+        course = snapshot.to_course()
+        if name_from_title:
+            settings.course_name = normalize_course_name(course.title)
+            settings.output_path = f'./output/{settings.course_name}'
+        _write(course, settings, snapshot=False)
+
+
+FULL_RENDERING_HELP = 'Keep animations and the display viewport instead of the lean scraping profile.'
+SECTIONS_HELP = 'Only scrape these sections, e.g. "2" or "1-3, 5"; the rest is kept from the last output.'
+LESSONS_HELP = 'Only scrape these lessons, numbered across the course; the rest is kept from the last output.'
+CHECKPOINTS_HELP = (
+    f'Checkpoint finished lessons under DIR (default {DEFAULT_CHECKPOINT_DIR}) to resume or refresh.'
+)
+NO_INCREMENTAL_HELP = 'Extract every lesson again instead of restoring or reusing checkpoints.'
+PROCESSES_HELP = 'Extract lessons in this many processes, each with its own browser (sync engine only).'
+
+
+def _parse_formats(raw: str) -> list[OutputFormat]:
+    return [OutputFormat.from_extension(ext) for ext in raw.split(',') if ext.strip()]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Scrape SCORM content from Blackboard.')
+    subparsers = parser.add_subparsers(dest='command')
+
+    login = subparsers.add_parser('login', help='Log in once and save the session for unattended runs.')
+    login.add_argument('--base-url')
+    login.add_argument('--scorm-url', help='Launch URL to store instead of the opened pop-up URL.')
+    login.add_argument('--session-dir')
+
+    scrape = subparsers.add_parser('scrape', help='Scrape a course unattended with a saved session.')
+    scrape.add_argument('--course-name')
+    scrape.add_argument('--output', dest='output_path')
+    scrape.add_argument('--formats', type=_parse_formats, help='Comma-separated, e.g. md,pdf.')
+    scrape.add_argument('--theme', choices=ThemeRegistry.list_themes())
+    scrape.add_argument('--scorm-url', help='SCORM pop-up or launch URL (default: the saved one).')
+    scrape.add_argument('--session-dir')
+    scrape.add_argument('--headed', action='store_true', help='Show the browser window.')
+    scrape.add_argument('--async-engine', action='store_true')
+    scrape.add_argument('--workers', type=int, dest='lesson_workers')
+    scrape.add_argument('--processes', type=int, dest='lesson_processes', help=PROCESSES_HELP)
+    scrape.add_argument('--full-rendering', action='store_true', help=FULL_RENDERING_HELP)
+    scrape.add_argument('--sections', dest='section_selection', help=SECTIONS_HELP)
+    scrape.add_argument('--lessons', dest='lesson_selection', help=LESSONS_HELP)
+    scrape.add_argument(
+        '--checkpoints', nargs='?', const=DEFAULT_CHECKPOINT_DIR, metavar='DIR', help=CHECKPOINTS_HELP
+    )
+    scrape.add_argument('--no-incremental', action='store_true', help=NO_INCREMENTAL_HELP)
+    har = scrape.add_mutually_exclusive_group()
+    har.add_argument('--record-har', dest='har_record', help='Record network traffic to this .har or .zip.')
+    har.add_argument('--replay-har', dest='har_replay', help='Scrape offline from a recorded archive.')
+
+    package = subparsers.add_parser('package', help='Render a SCORM .zip export offline, without a browser.')
+    package.add_argument('package', help='Path to the SCORM .zip file.')
+    package.add_argument('--course-name')
+    package.add_argument('--output', dest='output_path')
+    package.add_argument('--formats', type=_parse_formats, help='Comma-separated, e.g. md,pdf.')
+    package.add_argument('--theme', choices=ThemeRegistry.list_themes())
+
+    render = subparsers.add_parser(
+        'render',
+        aliases=['render-from-snapshot'],
+        help='Render a saved course snapshot again, e.g. with other formats or theme.',
+    )
+    render.add_argument('snapshot', help=f'Path to a {SNAPSHOT_FILENAME} file.')
+    render.add_argument('--course-name')
+    render.add_argument('--output', dest='output_path')
+    render.add_argument('--formats', type=_parse_formats, help='Comma-separated, e.g. md,pdf.')
+    render.add_argument('--theme', choices=ThemeRegistry.list_themes())
+
+    batch = subparsers.add_parser('batch', help='Scrape several courses in one browser process.')
+    batch.add_argument('jobs', help='JSON list of {name, scorm_url, formats, theme, output}.')
+    batch.add_argument('--concurrency', type=int, default=2, help='Courses in flight at once.')
+    batch.add_argument('--session-dir')
+    batch.add_argument('--headed', action='store_true', help='Show the browser window.')
+    batch.add_argument('--workers', type=int, dest='lesson_workers')
+    batch.add_argument('--full-rendering', action='store_true', help=FULL_RENDERING_HELP)
+    batch.add_argument(
+        '--checkpoints', nargs='?', const=DEFAULT_CHECKPOINT_DIR, metavar='DIR', help=CHECKPOINTS_HELP
+    )
+    batch.add_argument('--no-incremental', action='store_true', help=NO_INCREMENTAL_HELP)
+
+    daemon = subparsers.add_parser(
+        'serve', help='Keep a logged-in browser warm and take jobs over a local API.'
+    )
+    daemon.add_argument('--host', default=DEFAULT_DAEMON_HOST)
+    daemon.add_argument('--port', type=int, default=DEFAULT_DAEMON_PORT)
+    daemon.add_argument('--socket', dest='socket_path', help='Listen on this Unix socket instead of TCP.')
+    daemon.add_argument('--concurrency', type=int, default=2, help='Jobs running at once.')
+    daemon.add_argument('--session-dir')
+    daemon.add_argument('--headed', action='store_true', help='Show the browser window.')
+    daemon.add_argument('--workers', type=int, dest='lesson_workers')
+    daemon.add_argument('--full-rendering', action='store_true', help=FULL_RENDERING_HELP)
+    daemon.add_argument(
+        '--checkpoints', nargs='?', const=DEFAULT_CHECKPOINT_DIR, metavar='DIR', help=CHECKPOINTS_HELP
+    )
+    daemon.add_argument('--no-incremental', action='store_true', help=NO_INCREMENTAL_HELP)
+    return parser
+
+
+def _apply_args(settings: Config, args: argparse.Namespace) -> None:
+    for name in (
+        'base_url',
+        'scorm_url',
+        'session_dir',
+        'lesson_workers',
+        'lesson_processes',
+        'har_record',
+        'har_replay',
+        'section_selection',
+        'lesson_selection',
+    ):
+        value = getattr(args, name, None)
+        if value is not None:
+            setattr(settings, name, value)
+
+    if getattr(args, 'course_name', None):
+        settings.course_name = normalize_course_name(args.course_name)
+        settings.output_path = f'./output/{settings.course_name}'
+    if getattr(args, 'output_path', None):
+        settings.output_path = args.output_path
+    if getattr(args, 'formats', None):
+        settings.output_formats = args.formats
+    if getattr(args, 'theme', None):
+        settings.pdf_theme = ThemeRegistry.from_name(args.theme).get_theme()
+    if getattr(args, 'async_engine', False):
+        settings.async_engine = True
+    if getattr(args, 'full_rendering', False):
+        settings.lean_profile = False
+    if getattr(args, 'checkpoints', None):
+        settings.checkpoint_dir = args.checkpoints
+    if getattr(args, 'no_incremental', False):
+        settings.incremental = False
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _build_parser().parse_args(argv)
+    settings = get_config()
+    _apply_args(settings, args)
+
+    if args.command == 'login':
+        run_login(settings)
+        return
+
+    if args.command == 'package':
+        run_package(settings, args.package, name_from_title=not (args.course_name or args.output_path))
+        return
+
+    if args.command in ('render', 'render-from-snapshot'):
+        run_render(settings, args.snapshot, name_from_title=not (args.course_name or args.output_path))
+        return
+
+    if args.command in ('scrape', 'batch', 'serve'):
+        session = load_session(settings.session_dir)
+        if not session and not (args.command == 'scrape' and settings.har_replay):
+            logger.error('No saved session in %s. Run `python main.py login` first.', settings.session_dir)
+            sys.exit(1)
+
+    if args.command == 'batch':
+        results = asyncio.run(
+            run_batch_async(
+                load_jobs(args.jobs),
+                session=session,
+                concurrency=args.concurrency,
+                headless=not args.headed,
+            )
         )
+        log_batch_report(results)
+        if not all(r.ok for r in results):
+            sys.exit(1)
+        return
+
+    if args.command == 'serve':
+        try:
+            asyncio.run(
+                serve(
+                    session,
+                    host=args.host,
+                    port=args.port,
+                    socket_path=args.socket_path,
+                    concurrency=args.concurrency,
+                    headless=not args.headed,
+                )
+            )
+        except KeyboardInterrupt:
+            logger.info('Scraper daemon stopped.')
+        return
+
+    if args.command == 'scrape':
+        settings.scorm_url = settings.scorm_url or (session.scorm_url if session else None)
+        if not settings.scorm_url and settings.har_replay:
+            with HarArchive(settings.har_replay) as archive:
+                settings.scorm_url = next(iter(archive.documents), None)
+        if not settings.scorm_url:
+            logger.error('SCORM URL is not set. Pass --scorm-url or save one with `login`.')
+            sys.exit(1)
+        settings.headless = not args.headed
+        run_scrape(settings, session)
+        return
+
+    run_setup_wizard()
+
+    if not settings.base_url:
+        logger.error('Base URL is not set.')
+        sys.exit(1)
+
+    run_scrape(settings)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from playwright.async_api import Browser, async_playwright
+
+from scraper.browser import apply_profile_async, context_options, launch_options
+from scraper.config import OutputFormat, get_config
+from scraper.extractors.async_course import (
+    LessonProgress,
+    download_course_assets_async,
+    extract_course_async,
+)
+from scraper.formats.pdf import PDFTheme, ThemeRegistry
+from scraper.network import asset_capture
+from scraper.output import assets_dir_for, write_course
+from scraper.session import SavedSession, open_scorm_page_async
+from scraper.setup import normalize_course_name
+from scraper.snapshot import SNAPSHOT_FILENAME, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CourseJob:
+    name: str
+    scorm_url: str
+    output_path: str
+    output_formats: list[OutputFormat] = field(default_factory=lambda: [OutputFormat.MD])
+    pdf_theme: PDFTheme | None = None
+
+
+@dataclass
+class CourseJobResult:
+    job: CourseJob
+    ok: bool
+    seconds: float
+    lessons: int = 0
+    error: str | None = None
+
+
+def parse_job(raw: dict) -> CourseJob:
+    name = normalize_course_name(raw.get('name') or '')
+    scorm_url = (raw.get('scorm_url') or raw.get('url') or '').strip()
+    if not scorm_url:
+        raise ValueError(f'Course {name!r} has no scorm_url.')
+
+    formats = raw.get('formats') or [f.extension for f in get_config().output_formats]
+    if isinstance(formats, str):
+        formats = formats.split(',')
+    theme = raw.get('theme')
+
+    return CourseJob(
+        name=name,
+        scorm_url=scorm_url,
+        output_path=raw.get('output') or f'./output/{name}',
+        output_formats=[OutputFormat.from_extension(ext) for ext in formats],
+        pdf_theme=ThemeRegistry.from_name(theme).get_theme() if theme else None,
+    )
+
+
+def load_jobs(path: str | Path) -> list[CourseJob]:
+    """Read course definitions from a JSON list of {name, scorm_url, formats, theme, output}."""
+    data = json.loads(Path(path).read_text(encoding='utf-8'))
+    if isinstance(data, dict):
+        data = data.get('courses', [])
+    return [parse_job(raw) for raw in data]
+
+
+async def run_course_job(
+    browser: Browser,
+    job: CourseJob,
+    session: SavedSession | None,
+    *,
+    progress: LessonProgress | None = None,
+) -> CourseJobResult:
+    """Scrape and render one course in a fresh context of `browser`; failures are returned."""
+    settings = get_config()
+    started = time.perf_counter()
+    capture = asset_capture(settings)
+    context = await browser.new_context(
+        storage_state=session.storage_state_path if session else None, **context_options(settings)
+    )
+    try:
+        await apply_profile_async(context, settings)
+        logger.info('[%s] Starting.', job.name)
+        scorm_page = await open_scorm_page_async(context, job.scorm_url)
+        course = await extract_course_async(scorm_page, progress=progress, capture=capture)
+        await download_course_assets_async(scorm_page, course, assets_dir_for(job.output_path))
+    except Exception as exc:
+        logger.exception('[%s] Failed.', job.name)
+        return CourseJobResult(job=job, ok=False, seconds=time.perf_counter() - started, error=str(exc))
+    finally:
+        if capture:
+            capture.release()
+        await context.close()
+
+    try:
+        # Rendering is CPU-bound and offline; keep the event loop free for other courses.
+        await asyncio.to_thread(
+            write_course,
+            course,
+            job.output_path,
+            output_formats=job.output_formats,
+            pdf_theme=job.pdf_theme or settings.pdf_theme,
+        )
+        if settings.write_snapshot:
+            await asyncio.to_thread(
+                write_snapshot,
+                course,
+                Path(job.output_path) / SNAPSHOT_FILENAME,
+                assets_dir=assets_dir_for(job.output_path),
+            )
+    except Exception as exc:
+        logger.exception('[%s] Failed writing output.', job.name)
+        return CourseJobResult(job=job, ok=False, seconds=time.perf_counter() - started, error=str(exc))
+
+    lessons = sum(len(s.lessons) for s in course.sections)
+    seconds = time.perf_counter() - started
+    logger.info('[%s] Done: %s lessons in %.1fs.', job.name, lessons, seconds)
+    return CourseJobResult(job=job, ok=True, seconds=seconds, lessons=lessons)
+
+
+async def run_batch_async(
+    jobs: list[CourseJob],
+    *,
+    session: SavedSession | None,
+    concurrency: int = 2,
+    headless: bool = True,
+) -> list[CourseJobResult]:
+    """Scrape `jobs` in one Chromium process, each in its own context, `concurrency` at a time."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(**launch_options(get_config(), headless=headless))
+
+        async def bounded(job: CourseJob) -> CourseJobResult:
+            async with semaphore:
+                return await run_course_job(browser, job, session)
+
+        results = await asyncio.gather(*(bounded(job) for job in jobs))
+        await browser.close()
+
+    return list(results)
+
+
+def log_batch_report(results: list[CourseJobResult]) -> None:
+    width = max((len(r.job.name) for r in results), default=0)
+    logger.info('Batch report:')
+    for r in results:
+        status = 'ok' if r.ok else 'FAILED'
+        detail = f'{r.lessons} lessons' if r.ok else (r.error or '')
+        logger.info('  %s  %-6s %7.1fs  %s', r.job.name.ljust(width), status, r.seconds, detail)
+    failed = sum(1 for r in results if not r.ok)
+    logger.info('%s/%s courses succeeded.', len(results) - failed, len(results))
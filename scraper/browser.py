@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.sync_api import BrowserContext
+
+from scraper.config import Config
+
+# Chromium flags for a DOM-extraction session: keep pages that are not in front (worker
+# pages, the opener behind the SCORM pop-up) running at full speed, and skip background
+# services and audio the scraper never uses.
+LEAN_LAUNCH_ARGS = (
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-extensions',
+    '--disable-sync',
+    '--disable-smooth-scrolling',
+    '--disable-features=Translate,MediaRouter,OptimizationHints,CalculateNativeWinOcclusion',
+    '--mute-audio',
+    '--no-first-run',
+)
+
+# Finish every animation and transition at once instead of removing them, so end-state
+# styles (`animation-fill-mode: forwards`) and `animationend`/`transitionend` handlers that
+# Rise relies on to reveal blocks still apply.
+LEAN_STYLE = """
+*, *::before, *::after {
+    animation-delay: 0s !important;
+    animation-duration: 0s !important;
+    animation-iteration-count: 1 !important;
+    transition-delay: 0s !important;
+    transition-duration: 0s !important;
+    scroll-behavior: auto !important;
+}
+"""
+
+# Runs in every frame before its own scripts, so the SCORM content frame gets the style too,
+# including after the player reloads it.
+LEAN_INIT_JS = r"""
+(() => {
+    const id = '__scraper-lean-style';
+    const install = () => {
+        if (document.getElementById(id)) return;
+        const style = document.createElement('style');
+        style.id = id;
+        style.textContent = %s;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) install();
+    else document.addEventListener('DOMContentLoaded', install, { once: true });
+})();
+""" % json.dumps(LEAN_STYLE)
+
+
+def viewport(settings: Config) -> dict:
+    if settings.lean_profile:
+        return {'width': settings.lean_viewport_width, 'height': settings.lean_viewport_height}
+    return {'width': settings.viewport_width, 'height': settings.viewport_height}
+
+
+def launch_options(settings: Config, *, headless: bool | None = None) -> dict:
+    """Keyword arguments for `chromium.launch` under the configured profile."""
+    options: dict = {'headless': settings.headless if headless is None else headless}
+    if settings.lean_profile:
+        options['args'] = list(LEAN_LAUNCH_ARGS)
+    return options
+
+
+def context_options(settings: Config, *, lean: bool | None = None) -> dict:
+    """Keyword arguments for `browser.new_context`; pass `lean=False` for interactive pages."""
+    lean = settings.lean_profile if lean is None else lean
+    if not lean:
+        size = {'width': settings.viewport_width, 'height': settings.viewport_height}
+        return {'viewport': size, 'screen': size}
+    size = viewport(settings)
+    return {'viewport': size, 'screen': size, 'device_scale_factor': 1, 'reduced_motion': 'reduce'}
+
+
+def apply_profile(context: BrowserContext, settings: Config) -> None:
+    """Install the lean profile's stylesheet in every frame `context` loads from now on."""
+    if settings.lean_profile:
+        context.add_init_script(script=LEAN_INIT_JS)
+
+
+async def apply_profile_async(context: AsyncBrowserContext, settings: Config) -> None:
+    if settings.lean_profile:
+        await context.add_init_script(script=LEAN_INIT_JS)
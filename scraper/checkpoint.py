@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from scraper.models.course_scheme import CourseSchemeLesson
+from scraper.parsers.blocks import LessonBlock
+from scraper.parsers.serialize import deserialize_blocks, serialize_blocks
+from scraper.utils.assets import safe_filename
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+MANIFEST_FILENAME = 'manifest.json'
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+def _lesson_key(lesson: CourseSchemeLesson) -> str:
+    return safe_filename(lesson.lesson_id or f'lesson-{lesson.index:04d}')
+
+
+class CheckpointStore:
+    """Finished lessons of one course on disk, one JSON file per lesson.
+
+    Blocks are stored with `serialize_blocks`, so restored lessons render like fresh ones.
+    `manifest.json` records when the current run started and whether it finished, which tells
+    an interrupted run (resume) apart from a new one over a finished course (refresh).
+    """
+
+    def __init__(self, root: str | Path, course_key: str) -> None:
+        self.directory = Path(root) / safe_filename(course_key)
+
+    def _path(self, lesson: CourseSchemeLesson) -> Path:
+        return self.directory / f'{_lesson_key(lesson)}.json'
+
+    def _write_json(self, path: Path, data: dict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, path)
+
+    def _read_json(self, path: Path) -> dict | None:
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            logger.warning('Ignoring unreadable checkpoint %s', path)
+            return None
+
+    def begin_run(self) -> str:
+        """Start a run, or continue an unfinished one; return the time it started."""
+        manifest = self._read_json(self.directory / MANIFEST_FILENAME) or {}
+        if manifest.get('started_at') and not manifest.get('finished_at'):
+            logger.info('Resuming the run started at %s', manifest['started_at'])
+            return manifest['started_at']
+        started_at = _now()
+        self._write_json(self.directory / MANIFEST_FILENAME, {'started_at': started_at, 'finished_at': None})
+        return started_at
+
+    def finish_run(self) -> None:
+        path = self.directory / MANIFEST_FILENAME
+        manifest = self._read_json(path) or {}
+        manifest['finished_at'] = _now()
+        self._write_json(path, manifest)
+
+    def save(self, lesson: CourseSchemeLesson, blocks: list[LessonBlock]) -> None:
+        record = {
+            'version': CHECKPOINT_VERSION,
+            'lesson_id': lesson.lesson_id,
+            'index': lesson.index,
+            'title': lesson.title,
+            'fingerprint': lesson.fingerprint,
+            'saved_at': _now(),
+            'blocks': serialize_blocks(blocks),
+        }
+        self._write_json(self._path(lesson), record)
+
+    def _record(self, lesson: CourseSchemeLesson) -> dict | None:
+        record = self._read_json(self._path(lesson))
+        if not record or record.get('version') != CHECKPOINT_VERSION:
+            return None
+        return record
+
+    @staticmethod
+    def _blocks(record: dict, page: Any) -> list[LessonBlock]:
+        return deserialize_blocks(record.get('blocks') or [], page=page)
+
+    def load(self, lesson: CourseSchemeLesson, *, page: Any = None) -> list[LessonBlock] | None:
+        """Rebuild a checkpointed lesson's blocks, or return None if it was never finished."""
+        record = self._record(lesson)
+        return self._blocks(record, page) if record else None
+
+    def reuse(self, lesson: CourseSchemeLesson, *, page: Any = None) -> list[LessonBlock] | None:
+        """Return the stored blocks if `lesson.fingerprint` matches the one saved with them."""
+        record = self._record(lesson)
+        if not record or not lesson.fingerprint or record.get('fingerprint') != lesson.fingerprint:
+            return None
+        return self._blocks(record, page)
+
+    def restore(
+        self, lessons: list[CourseSchemeLesson], *, page: Any = None, since: str | None = None
+    ) -> list[CourseSchemeLesson]:
+        """Fill in checkpointed lessons and return the ones still to extract.
+
+        With `since`, only lessons saved at or after that time are restored; older checkpoints
+        are left for `reuse` to validate against the live lesson. Only incremental runs restore.
+        """
+        remaining: list[CourseSchemeLesson] = []
+        for lesson in lessons:
+            record = self._record(lesson)
+            if not record or (since and (record.get('saved_at') or '') < since):
+                remaining.append(lesson)
+                continue
+            lesson.fingerprint = record.get('fingerprint')
+            lesson.blocks = self._blocks(record, page)
+        restored = len(lessons) - len(remaining)
+        if restored:
+            logger.info(
+                'Restored %s of %s lessons from checkpoints in %s', restored, len(lessons), self.directory
+            )
+        return remaining
@@ -29,12 +29,39 @@ class OutputFormat(Enum):
         raise ValueError(f'Unknown output format: {ext!r}')
 
 
+class ExtractionMode(Enum):
+    LIVE = 'live'  # Query every block through live locators.
+    SNAPSHOT = 'snapshot'  # Pull each lesson's HTML once and parse it offline.
+
+
+class HtmlParser(Enum):
+    AUTO = 'auto'  # lxml for larger fragments when it is installed, html.parser otherwise.
+    LXML = 'lxml'  # libxml2-backed, several times faster on large fragments.
+    HTML_PARSER = 'html.parser'  # The standard library's pure-Python parser.
+
+
+class LessonNavigation(Enum):
+    HASH = 'hash'  # Drive the Rise router through the frame's location hash.
+    SIDEBAR = 'sidebar'  # Click the lesson's sidebar link.
+
+
 DEFAULT_BASE_URL = 'https://u-tad.blackboard.com/'
 DEFAULT_VIEWPORT_WIDTH = 1440
 DEFAULT_VIEWPORT_HEIGHT = 900
+DEFAULT_LEAN_VIEWPORT_WIDTH = 1280  # Still above Rise's desktop breakpoint, so the sidebar stays.
+DEFAULT_LEAN_VIEWPORT_HEIGHT = 720
 DEFAULT_COURSE_NAME = 'course'
 DEFAULT_OUTPUT_FORMAT = OutputFormat.MD
 DEFAULT_PDF_THEME = _get_default_pdf_theme()
+DEFAULT_EXTRACTION_MODE = ExtractionMode.SNAPSHOT
+DEFAULT_LESSON_WORKERS = 1
+DEFAULT_LESSON_PROCESSES = 1
+DEFAULT_LESSON_NAVIGATION = LessonNavigation.HASH
+DEFAULT_READINESS_QUIET_MS = 150
+DEFAULT_HTML_PARSER = HtmlParser.AUTO
+DEFAULT_SESSION_DIR = './.session'
+DEFAULT_CHECKPOINT_DIR = './.checkpoints'
+DEFAULT_LESSON_RETRIES = 2
 
 
 class Config:
@@ -47,6 +74,32 @@ class Config:
         self.output_path = f'./output/{self.course_name}'
         self.pdf_theme = DEFAULT_PDF_THEME
         self.download_videos = False
+        self.extraction_mode = DEFAULT_EXTRACTION_MODE
+        self.layout_free_text = True  # Derive text from HTML instead of `inner_text()`.
+        self.html_parser = DEFAULT_HTML_PARSER  # BeautifulSoup backend for snapshots and rendering.
+        self.lesson_workers = DEFAULT_LESSON_WORKERS  # Pages extracting lessons in parallel.
+        self.lesson_processes = DEFAULT_LESSON_PROCESSES  # Worker processes, each with its own browser.
+        self.async_engine = False  # Run extraction on `playwright.async_api`.
+        self.lesson_navigation = DEFAULT_LESSON_NAVIGATION
+        self.use_course_data = True  # Build lessons from Rise's embedded course JSON when present.
+        self.event_readiness = True  # Wait for lessons with a MutationObserver, not a fixed poll.
+        self.readiness_quiet_ms = DEFAULT_READINESS_QUIET_MS
+        self.block_resources = True  # Skip fonts, media, analytics and tracking while extracting.
+        self.capture_assets = True  # Reuse image bodies the page loads instead of re-downloading.
+        self.lean_profile = True  # Reduced motion, no animations, extraction launch flags and viewport.
+        self.lean_viewport_width = DEFAULT_LEAN_VIEWPORT_WIDTH
+        self.lean_viewport_height = DEFAULT_LEAN_VIEWPORT_HEIGHT
+        self.headless = False
+        self.session_dir = DEFAULT_SESSION_DIR  # Saved storage state for unattended runs.
+        self.scorm_url: str | None = None  # SCORM pop-up or launch URL opened without a human.
+        self.checkpoint_dir: str | None = None  # Finished lessons, for resuming; off unless set.
+        self.lesson_retries = DEFAULT_LESSON_RETRIES  # Extra attempts for a lesson that fails.
+        self.incremental = True  # Resume from checkpoints and reuse lessons whose DOM has not changed.
+        self.write_snapshot = True  # Save the scraped course next to the output for re-rendering.
+        self.section_selection = ''  # Only extract these sections, e.g. '2' or '1-3, 5'.
+        self.lesson_selection = ''  # Only extract these lessons, numbered across the course.
+        self.har_record: str | None = None  # Record the scrape's network traffic to this HAR archive.
+        self.har_replay: str | None = None  # Serve the scrape from this HAR archive, with no network.
 
 
 _CONFIG = Config()
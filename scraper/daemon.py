@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+from scraper.batch import CourseJob, parse_job, run_course_job
+from scraper.browser import launch_options
+from scraper.config import OutputFormat, get_config
+from scraper.formats.pdf import PDFTheme, ThemeRegistry
+from scraper.output import write_course
+from scraper.session import SavedSession
+from scraper.setup import normalize_course_name
+from scraper.snapshot import CourseSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAEMON_HOST = '127.0.0.1'
+DEFAULT_DAEMON_PORT = 8765
+MAX_REQUEST_BYTES = 1 << 20
+
+
+class JobKind(Enum):
+    SCRAPE = 'scrape'  # Scrape a course with the warm browser, then render it.
+    RENDER = 'render'  # Render a saved course snapshot again; no browser needed.
+
+
+class JobState(Enum):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+
+@dataclass
+class RenderJob:
+    snapshot: str
+    output_path: str | None = None  # Default: ./output/<course title>
+    output_formats: list[OutputFormat] | None = None
+    pdf_theme: PDFTheme | None = None
+
+
+def parse_render_job(raw: dict) -> RenderJob:
+    snapshot = (raw.get('snapshot') or '').strip()
+    if not snapshot:
+        raise ValueError('Render job has no snapshot.')
+    formats = raw.get('formats')
+    if isinstance(formats, str):
+        formats = formats.split(',')
+    theme = raw.get('theme')
+    return RenderJob(
+        snapshot=snapshot,
+        output_path=raw.get('output'),
+        output_formats=[OutputFormat.from_extension(ext) for ext in formats] if formats else None,
+        pdf_theme=ThemeRegistry.from_name(theme).get_theme() if theme else None,
+    )
+
+
+@dataclass
+class DaemonJob:
+    id: int
+    kind: JobKind
+    spec: CourseJob | RenderJob
+    state: JobState = JobState.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    lessons_done: int = 0
+    lessons_total: int | None = None
+    output_path: str | None = None
+    error: str | None = None
+
+    def progress(self, done: int, total: int) -> None:
+        self.lessons_done, self.lessons_total = done, total
+
+    def to_dict(self) -> dict[str, Any]:
+        name = self.spec.name if isinstance(self.spec, CourseJob) else self.spec.snapshot
+        end = self.finished_at or time.time()
+        return {
+            'id': self.id,
+            'kind': self.kind.value,
+            'name': name,
+            'state': self.state.value,
+            'lessons_done': self.lessons_done,
+            'lessons_total': self.lessons_total,
+            'output': self.output_path,
+            'error': self.error,
+            'queued_seconds': round((self.started_at or end) - self.submitted_at, 3),
+            'run_seconds': round(end - self.started_at, 3) if self.started_at else None,
+        }
+
+
+class ScraperDaemon:
+    """Long-running scraper: one warm Chromium and a local JSON job API.
+
+    The browser is launched once and relaunched only if it disconnects; each scrape job
+    gets a fresh context from the saved session, as in `batch`. Up to `concurrency` jobs
+    run at once and the rest wait in submission order, so a job submitted while a slot is
+    free starts at once.
+
+    API (HTTP/1.1, JSON bodies, over TCP or a Unix socket):
+        POST /jobs        {"kind": "scrape", "name", "scorm_url", "formats", "theme", "output"}
+                          {"kind": "render", "snapshot", "formats", "theme", "output"}
+        GET  /jobs        every job, newest last
+        GET  /jobs/<id>   one job's state, lesson progress and output
+        GET  /health      browser status and job counts
+    """
+
+    def __init__(self, session: SavedSession, *, concurrency: int = 2, headless: bool = True) -> None:
+        self.session = session
+        self.headless = headless
+        self.jobs: dict[int, DaemonJob] = {}
+        self._ids = itertools.count(1)
+        self._slots = asyncio.Semaphore(max(1, concurrency))
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._browser_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._playwright = await async_playwright().start()
+        await self._ensure_browser()
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._browser and self._browser.is_connected():
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+
+    async def _ensure_browser(self) -> Browser:
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._browser is not None:
+                    logger.warning('Browser disconnected; launching a new one.')
+                options = launch_options(get_config(), headless=self.headless)
+                self._browser = await self._playwright.chromium.launch(**options)
+            return self._browser
+
+    def submit(self, raw: dict) -> DaemonJob:
+        """Validate and queue a job; raises ValueError for a malformed one."""
+        kind = JobKind(raw.get('kind') or JobKind.SCRAPE.value)
+        spec = parse_job(raw) if kind is JobKind.SCRAPE else parse_render_job(raw)
+        job = DaemonJob(id=next(self._ids), kind=kind, spec=spec)
+        self.jobs[job.id] = job
+        task = asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        logger.info('Queued %s job %s.', kind.value, job.id)
+        return job
+
+    async def _run(self, job: DaemonJob) -> None:
+        async with self._slots:
+            job.state, job.started_at = JobState.RUNNING, time.time()
+            try:
+                if job.kind is JobKind.SCRAPE:
+                    job.error = await self._scrape(job)
+                else:
+                    await asyncio.to_thread(self._render, job)
+            except Exception as exc:
+                logger.exception('Job %s failed.', job.id)
+                job.error = str(exc)
+            job.state = JobState.FAILED if job.error else JobState.DONE
+            job.finished_at = time.time()
+
+    async def _scrape(self, job: DaemonJob) -> str | None:
+        """Run a scrape job; return its error, as `run_course_job` reports failures itself."""
+        browser = await self._ensure_browser()
+        job.output_path = job.spec.output_path
+        result = await run_course_job(browser, job.spec, self.session, progress=job.progress)
+        return None if result.ok else result.error or 'Scrape failed.'
+
+    def _render(self, job: DaemonJob) -> None:
+        spec: RenderJob = job.spec
+        settings = get_config()
+        with CourseSnapshot(spec.snapshot) as snapshot:
+            course = snapshot.to_course()
+            job.lessons_total = sum(len(s.lessons) for s in course.sections)
+            job.output_path = spec.output_path or f'./output/{normalize_course_name(course.title)}'
+            write_course(
+                course,
+                job.output_path,
+                output_formats=spec.output_formats or settings.output_formats,
+                pdf_theme=spec.pdf_theme or settings.pdf_theme,
+            )
+            job.lessons_done = job.lessons_total
+
+    def health(self) -> dict[str, Any]:
+        counts = {state.value: 0 for state in JobState}
+        for job in self.jobs.values():
+            counts[job.state.value] += 1
+        return {'browser': bool(self._browser and self._browser.is_connected()), 'jobs': counts}
+
+    def route(self, method: str, path: str, body: bytes) -> tuple[HTTPStatus, Any]:
+        parts = [part for part in path.split('?', 1)[0].split('/') if part]
+        if method == 'GET' and parts == ['health']:
+            return HTTPStatus.OK, self.health()
+        if parts == ['jobs'] and method == 'GET':
+            return HTTPStatus.OK, [job.to_dict() for job in self.jobs.values()]
+        if parts == ['jobs'] and method == 'POST':
+            try:
+                raw = json.loads(body or b'{}')
+                if not isinstance(raw, dict):
+                    raise ValueError('Expected a JSON object.')
+                job = self.submit(raw)
+            except (ValueError, KeyError, TypeError, AttributeError) as exc:
+                # A body of the wrong shape, e.g. `formats` that is neither a list nor a string.
+                logger.warning('Rejected job %r: %s', body[:200], exc)
+                return HTTPStatus.BAD_REQUEST, {'error': str(exc) or type(exc).__name__}
+            return HTTPStatus.ACCEPTED, job.to_dict()
+        if len(parts) == 2 and parts[0] == 'jobs' and method == 'GET':
+            job = self.jobs.get(int(parts[1])) if parts[1].isdigit() else None
+            if job is None:
+                return HTTPStatus.NOT_FOUND, {'error': f'No job {parts[1]}.'}
+            return HTTPStatus.OK, job.to_dict()
+        return HTTPStatus.NOT_FOUND, {'error': f'No route for {method} {path}.'}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one HTTP request per connection."""
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            headers: dict[str, str] = {}
+            while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get('content-length') or 0)
+            if len(request_line) < 2:
+                status, payload = HTTPStatus.BAD_REQUEST, {'error': 'Malformed request line.'}
+            elif length > MAX_REQUEST_BYTES:
+                status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': 'Request body too large.'}
+            else:
+                body = await reader.readexactly(length) if length else b''
+                status, payload = self.route(request_line[0].upper(), request_line[1], body)
+        except (ValueError, asyncio.IncompleteReadError) as exc:
+            status, payload = HTTPStatus.BAD_REQUEST, {'error': str(exc)}
+        except Exception as exc:  # Answer every request, even one that trips a bug.
+            logger.exception('Failed to handle a request.')
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(exc)}
+
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (
+            f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+            'Content-Type: application/json\r\n'
+            f'Content-Length: {len(data)}\r\n'
+            'Connection: close\r\n\r\n'
+        )
+        writer.write(head.encode('latin-1') + data)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+async def serve(
+    session: SavedSession,
+    *,
+    host: str = DEFAULT_DAEMON_HOST,
+    port: int = DEFAULT_DAEMON_PORT,
+    socket_path: str | None = None,
+    concurrency: int = 2,
+    headless: bool = True,
+) -> None:
+    """Run the daemon until cancelled, on `socket_path` if given, otherwise on `host:port`."""
+    daemon = ScraperDaemon(session, concurrency=concurrency, headless=headless)
+    await daemon.start()
+    if socket_path:
+        Path(socket_path).unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(daemon.handle, path=socket_path)
+        logger.info('Scraper daemon listening on %s', socket_path)
+    else:
+        server = await asyncio.start_server(daemon.handle, host=host, port=port)
+        logger.info('Scraper daemon listening on http://%s:%s', host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await daemon.close()
+        if socket_path:
+            Path(socket_path).unlink(missing_ok=True)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from playwright.async_api import BrowserContext, Frame, Page
+
+from scraper.config import get_config
+from scraper.extractors.async_lesson import extract_lesson_async
+from scraper.extractors.course import (
+    COURSE_TITLE_SELECTOR,
+    LESSON_CONTENT_SELECTOR,
+    SIDEBAR_SELECTOR,
+    checkpoint_store,
+)
+from scraper.extractors.course_data import read_course_data_async
+from scraper.extractors.frame import (
+    COVER_PAGE_SELECTOR,
+    COVER_START_COURSE_BUTTON_SELECTOR,
+    resolve_scorm_frame_async,
+)
+from scraper.extractors.retry import LESSON_ERRORS, LessonQueue
+from scraper.models.course_scheme import CourseScheme, CourseSchemeSection
+from scraper.network import ResponseCapture, extraction_blocker
+from scraper.parsers.blocks import LessonBlock
+from scraper.parsers.sidebar import SIDEBAR_LESSON_LINKS_SELECTOR, parse_sidebar
+from scraper.selection import configured_lessons
+from scraper.utils.assets import prefetch_assets
+from scraper.utils.text import html_to_text
+
+logger = logging.getLogger(__name__)
+
+# Called with (lessons finished, total lessons) once the lessons are known and after each one.
+LessonProgress = Callable[[int, int], None]
+
+
+async def start_course_async(scorm_frame: Frame) -> None:
+    if await scorm_frame.locator(f'div{COVER_PAGE_SELECTOR}').count() > 0:
+        await scorm_frame.locator(f'a{COVER_START_COURSE_BUTTON_SELECTOR}').click()
+
+
+async def _get_course_title_async(scorm_frame: Frame) -> str:
+    title_locator = scorm_frame.locator(COURSE_TITLE_SELECTOR)
+    if await title_locator.count() > 0:
+        if get_config().layout_free_text:
+            text = html_to_text(await title_locator.first.inner_html())
+        else:
+            text = await title_locator.first.inner_text()
+        return text.strip() or 'Course'
+    return 'Course'
+
+
+async def _get_course_scheme_async(scorm_frame: Frame) -> list[CourseSchemeSection]:
+    sidebar = scorm_frame.locator(SIDEBAR_SELECTOR)
+    await sidebar.wait_for(state='visible')
+    sidebar_html = await sidebar.inner_html()
+    return parse_sidebar(f'<div id="nav-content-sidebar">{sidebar_html}</div>')
+
+
+async def _open_worker_async(context: BrowserContext, url: str) -> tuple[Page, Frame]:
+    page = await context.new_page()
+    await page.goto(url)
+    await page.wait_for_load_state()
+
+    frame = await resolve_scorm_frame_async(page)
+    await start_course_async(frame)
+    await frame.locator(SIDEBAR_SELECTOR).wait_for(state='attached')
+    return page, frame
+
+
+async def extract_course_async(
+    scorm_page: Page,
+    *,
+    progress: LessonProgress | None = None,
+    capture: ResponseCapture | None = None,
+) -> CourseScheme:
+    settings = get_config()
+    blocker = extraction_blocker(settings)
+    if blocker:
+        await blocker.install_async(scorm_page.context)
+    if capture:
+        capture.install_async(scorm_page.context)
+    try:
+        return await _extract_course_async(scorm_page, progress)
+    finally:
+        if capture:
+            capture.uninstall_async()
+        if blocker:
+            await blocker.uninstall_async()
+
+
+async def _extract_course_async(scorm_page: Page, progress: LessonProgress | None) -> CourseScheme:
+    scorm_frame = await resolve_scorm_frame_async(scorm_page)
+    await start_course_async(scorm_frame)
+
+    settings = get_config()
+    course_data = await read_course_data_async(scorm_frame) if settings.use_course_data else None
+    if course_data:
+        course_scheme, course_title = course_data.sections, course_data.title
+        lessons = course_data.pending
+        total_lessons = sum(len(section.lessons) for section in course_scheme)
+    else:
+        logger.info('Parsing course scheme...')
+        course_scheme, course_title = await asyncio.gather(
+            _get_course_scheme_async(scorm_frame),
+            _get_course_title_async(scorm_frame),
+        )
+
+        if not course_scheme:
+            logger.warning('No course scheme sections/lessons found.')
+            return CourseScheme(title=course_title, sections=[])
+
+        lessons = [lesson for section in course_scheme for lesson in section.lessons]
+        total_lessons = len(lessons)
+        logger.info(
+            'Found %s course scheme sections with %s total lessons.',
+            len(course_scheme),
+            total_lessons,
+        )
+
+    lessons = configured_lessons(settings, course_scheme, lessons)
+    store = checkpoint_store(course_title)
+    reuse = partial(store.reuse, page=scorm_page) if store and settings.incremental else None
+    if store:
+        since = store.begin_run()
+        if settings.incremental:  # Otherwise every lesson is extracted again, as in the sync engine.
+            lessons = await asyncio.to_thread(store.restore, lessons, page=scorm_page, since=since)
+    finished = total_lessons - len(lessons)
+    if progress:
+        progress(finished, total_lessons)
+    if not lessons:
+        if store:
+            store.finish_run()
+        return CourseScheme(title=course_title, sections=course_scheme)
+    if course_data:
+        await scorm_frame.locator(SIDEBAR_SELECTOR).wait_for(state='visible')
+    queue = LessonQueue(lessons, retries=settings.lesson_retries)
+
+    workers: list[tuple[Page, Frame]] = [(scorm_page, scorm_frame)]
+    pool_size = max(1, settings.lesson_workers)
+    if pool_size > 1:
+        opened = await asyncio.gather(
+            *(_open_worker_async(scorm_page.context, scorm_page.url) for _ in range(pool_size - 1)),
+            return_exceptions=True,
+        )
+        for result in opened:
+            if isinstance(result, BaseException):
+                logger.warning('Could not open lesson worker page: %s', result)
+            else:
+                workers.append(result)
+        logger.info('Extracting lessons with %s worker pages.', len(workers))
+
+    results: dict[int, list[LessonBlock]] = {}
+
+    async def run_worker(page: Page, frame: Frame) -> None:
+        nonlocal finished
+        while queue:
+            lesson_ref = queue.popleft()
+            try:
+                frame, blocks = await extract_lesson_async(
+                    scorm_page=page,
+                    scorm_frame=frame,
+                    item=lesson_ref,
+                    total_items=total_lessons,
+                    sidebar_lesson_links_selector=SIDEBAR_LESSON_LINKS_SELECTOR,
+                    lesson_content_selector=LESSON_CONTENT_SELECTOR,
+                    timeout_ms=5000,
+                    reuse=reuse,
+                )
+            except LESSON_ERRORS as exc:
+                queue.fail(lesson_ref, exc)
+                if frame.is_detached():
+                    frame = await resolve_scorm_frame_async(page)
+                continue
+            queue.done(lesson_ref)
+            results[lesson_ref.index] = blocks
+            finished += 1
+            if progress:
+                progress(finished, total_lessons)
+            if store:
+                await asyncio.to_thread(store.save, lesson_ref, blocks)
+
+    try:
+        await asyncio.gather(*(run_worker(page, frame) for page, frame in workers))
+    finally:
+        for page, _frame in workers[1:]:
+            await page.close()
+
+    queue.log_summary()
+    if store:
+        store.finish_run()
+    for section in course_scheme:
+        for lesson_ref in section.lessons:
+            if lesson_ref.index in results:
+                lesson_ref.blocks = results[lesson_ref.index]
+
+    return CourseScheme(title=course_title, sections=course_scheme)
+
+
+async def download_course_assets_async(scorm_page: Page, course: CourseScheme, assets_dir: Path) -> None:
+    """Fetch every asset the course's blocks will render, ahead of `write_course`."""
+    files = [
+        asset
+        for section in course.sections
+        for lesson_ref in section.lessons
+        for block in lesson_ref.blocks
+        for asset in block.asset_files()
+    ]
+    logger.info('Downloading %s assets...', len(files))
+    await prefetch_assets(scorm_page, files, assets_dir)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from playwright.async_api import Frame, Page, TimeoutError
+
+from scraper.config import get_config
+from scraper.extractors.frame import frame_tracker_async
+from scraper.extractors.lesson import (
+    LESSON_FINGERPRINT_JS,
+    SET_LESSON_HASH_JS,
+    LessonReuse,
+    lesson_route,
+    target_lesson_selector,
+)
+from scraper.extractors.readiness import remaining_ms, wait_for_lesson_ready_async
+from scraper.models.course_scheme import CourseSchemeLesson
+from scraper.parsers.blocks import LessonBlock
+from scraper.parsers.lesson import parse_lesson_content
+from scraper.parsers.static import SNAPSHOT_JS, StaticLocator
+
+logger = logging.getLogger(__name__)
+
+
+async def find_frame_with_matching_element_async(page: Page, selector: str) -> Frame | None:
+    for frame in page.frames:
+        try:
+            if await frame.locator(selector).count() > 0:
+                return frame
+        except Exception:
+            continue
+    return None
+
+
+async def open_lesson_async(
+    *,
+    scorm_frame: Frame,
+    item: CourseSchemeLesson,
+    sidebar_lesson_links_selector: str,
+    lesson_content_selector: str,
+) -> str:
+    route = lesson_route(item)
+    if route:
+        await scorm_frame.evaluate(SET_LESSON_HASH_JS, route)
+        return target_lesson_selector(lesson_content_selector, item)
+
+    link = scorm_frame.locator(sidebar_lesson_links_selector).nth(item.index)
+    await link.click()
+    return lesson_content_selector
+
+
+async def _wait_for_lesson_or_refresh_async(
+    *,
+    scorm_page: Page,
+    scorm_frame: Frame,
+    lesson_content_selector: str,
+    timeout_ms: int,
+) -> Frame:
+    try:
+        return await frame_tracker_async(scorm_page).wait_for_selector(
+            lesson_content_selector, timeout_ms=timeout_ms
+        )
+    except TimeoutError:
+        logger.warning('Lesson content not found in the SCORM content frame, searching other frames...')
+
+        refreshed = await find_frame_with_matching_element_async(scorm_page, lesson_content_selector)
+        if not refreshed:
+            raise RuntimeError('Could not resolve SCORM content frame.')
+
+        scorm_frame = refreshed
+        logger.info('Found lesson content in another frame.')
+
+        await scorm_frame.wait_for_selector(lesson_content_selector, state='visible', timeout=timeout_ms)
+        logger.info('Lesson content found after refresh.')
+    return scorm_frame
+
+
+async def read_lesson_async(
+    *,
+    scorm_page: Page,
+    scorm_frame: Frame,
+    lesson_content_selector: str,
+    timeout_ms: int = 5000,
+    item: CourseSchemeLesson | None = None,
+    reuse: LessonReuse | None = None,
+) -> tuple[Frame, list[LessonBlock]]:
+    if scorm_frame.is_detached():
+        scorm_frame = await frame_tracker_async(scorm_page).current()
+    started = time.monotonic()
+    ready = get_config().event_readiness and await wait_for_lesson_ready_async(
+        scorm_frame, lesson_content_selector, timeout_ms=timeout_ms
+    )
+    if not ready:
+        scorm_frame = await _wait_for_lesson_or_refresh_async(
+            scorm_page=scorm_page,
+            scorm_frame=scorm_frame,
+            lesson_content_selector=lesson_content_selector,
+            timeout_ms=remaining_ms(started, timeout_ms),
+        )
+
+    # The async engine always snapshots: block parsing then needs no further browser calls,
+    # and runs in a worker thread so other pages keep progressing meanwhile.
+    lesson_el = scorm_frame.locator(lesson_content_selector).first
+    if item is not None and reuse is not None:
+        try:
+            item.fingerprint = await lesson_el.evaluate(LESSON_FINGERPRINT_JS)
+        except Exception:
+            item.fingerprint = None
+        stored = await asyncio.to_thread(reuse, item) if item.fingerprint else None
+        if stored is not None:
+            logger.info('Lesson unchanged since the last run: %s', item.title)
+            return scorm_frame, stored
+
+    html = await lesson_el.evaluate(SNAPSHOT_JS)
+    parsed_blocks: list[LessonBlock] = await asyncio.to_thread(
+        parse_lesson_content, StaticLocator.from_html(html)
+    )
+    return scorm_frame, parsed_blocks
+
+
+async def extract_lesson_async(
+    *,
+    scorm_page: Page,
+    scorm_frame: Frame,
+    item: CourseSchemeLesson,
+    total_items: int,
+    sidebar_lesson_links_selector: str,
+    lesson_content_selector: str,
+    timeout_ms: int = 5000,
+    reuse: LessonReuse | None = None,
+) -> tuple[Frame, list[LessonBlock]]:
+    logger.info('Parsing lesson %s/%s: %s', item.index + 1, total_items, item.title)
+
+    content_selector = await open_lesson_async(
+        scorm_frame=scorm_frame,
+        item=item,
+        sidebar_lesson_links_selector=sidebar_lesson_links_selector,
+        lesson_content_selector=lesson_content_selector,
+    )
+    scorm_frame, parsed_blocks = await read_lesson_async(
+        scorm_page=scorm_page,
+        scorm_frame=scorm_frame,
+        lesson_content_selector=content_selector,
+        timeout_ms=timeout_ms,
+        item=item,
+        reuse=reuse,
+    )
+
+    logger.info('Scraped %s/%s: %s', item.index + 1, total_items, item.title)
+    return scorm_frame, parsed_blocks
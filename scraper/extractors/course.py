@@ -1,34 +1,35 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 
 from playwright.sync_api import Frame, Locator, Page
 
+from scraper.checkpoint import CheckpointStore
+from scraper.config import get_config
+from scraper.extractors.course_data import read_course_data
+from scraper.extractors.frame import resolve_scorm_frame, start_course
 from scraper.extractors.lesson import extract_lesson
-from scraper.models.course_scheme import CourseScheme, CourseSchemeSection
+from scraper.extractors.pool import extract_lessons_pooled
+from scraper.extractors.retry import LESSON_ERRORS, LessonQueue
+from scraper.extractors.shard import extract_lessons_sharded
+from scraper.models.course_scheme import CourseScheme, CourseSchemeLesson, CourseSchemeSection
+from scraper.network import ResponseCapture, extraction_blocker
 from scraper.parsers.sidebar import SIDEBAR_LESSON_LINKS_SELECTOR, parse_sidebar
+from scraper.selection import configured_lessons
+from scraper.utils.text import read_text
 
 logger = logging.getLogger(__name__)
 
-CONTENT_FRAME = '#content-frame'
-COVER_PAGE_SELECTOR = '#cover'
 COURSE_TITLE_SELECTOR = '.nav-sidebar-header__title'
-COVER_START_COURSE_BUTTON_SELECTOR = '.cover__header-content-action-link'
 LESSON_CONTENT_SELECTOR = '[data-lesson-id]'
 SIDEBAR_SELECTOR = '#nav-content-sidebar'
 
 
-def _frame_from_iframe(page: Page, iframe_query_selector: str) -> Frame | None:
-    iframe = page.query_selector(iframe_query_selector)
-    if not iframe:
-        return None
-    return iframe.content_frame()
-
-
 def _get_course_title(scorm_frame: Frame) -> str:
     title_locator = scorm_frame.locator(COURSE_TITLE_SELECTOR)
     if title_locator.count() > 0:
-        return title_locator.first.inner_text().strip() or 'Course'
+        return read_text(title_locator.first).strip() or 'Course'
     return 'Course'
 
 
@@ -41,42 +42,146 @@ def _get_course_scheme(scorm_frame: Locator) -> list[CourseSchemeSection]:
     return course_scheme
 
 
-def extract_course(scorm_page: Page) -> CourseScheme:
-
-    scorm_frame: Frame | None = _frame_from_iframe(scorm_page, f'iframe{CONTENT_FRAME}')
-
-    if not scorm_frame:
-        scorm_frame = _frame_from_iframe(scorm_page, 'iframe')
-
-    if not scorm_frame:
-        raise RuntimeError('Could not resolve SCORM content frame.')
+def extract_course(scorm_page: Page, *, capture: ResponseCapture | None = None) -> CourseScheme:
+    """Scrape the course open in `scorm_page`; `capture` keeps the asset bodies it loads."""
+    settings = get_config()
+    blocker = extraction_blocker(settings)
+    if blocker:
+        blocker.install(scorm_page.context)
+    if capture:
+        capture.install(scorm_page.context)
+    try:
+        return _extract_course(scorm_page)
+    finally:
+        if capture:
+            capture.uninstall()
+        if blocker:
+            blocker.uninstall()
+
+
+def _extract_course(scorm_page: Page) -> CourseScheme:
+    scorm_frame: Frame = resolve_scorm_frame(scorm_page)
+    start_course(scorm_frame)
+
+    settings = get_config()
+    course_data = read_course_data(scorm_frame) if settings.use_course_data else None
+    if course_data:
+        course_scheme = course_data.sections
+        course_title = course_data.title
+        lessons = course_data.pending
     else:
-        logger.info('Resolved SCORM content frame.')
-
-    if scorm_frame.locator(f'div{COVER_PAGE_SELECTOR}').count() > 0:
-        start_course_button = scorm_frame.locator(f'a{COVER_START_COURSE_BUTTON_SELECTOR}')
-        start_course_button.click()
+        logger.info('Parsing course scheme...')
+        course_scheme = _get_course_scheme(scorm_frame)
+        course_title = _get_course_title(scorm_frame)
+
+        if not course_scheme:
+            logger.warning('No course scheme sections/lessons found.')
+            return CourseScheme(title=course_title, sections=[])
+        else:
+            total_items = sum(len(s.lessons) for s in course_scheme)
+            logger.info(
+                'Found %s course scheme sections with %s total lessons.',
+                len(course_scheme),
+                total_items,
+            )
+        lessons = [lesson for section in course_scheme for lesson in section.lessons]
+    lessons = configured_lessons(settings, course_scheme, lessons)
+
+    store = checkpoint_store(course_title)
+    since = store.begin_run() if store else None
+    # Incremental runs only trust lessons saved during this run; older ones are fingerprinted.
+    # Other runs extract every lesson again and overwrite its checkpoint.
+    pending = (
+        store.restore(lessons, page=scorm_page, since=since) if store and settings.incremental else lessons
+    )
+    if pending:
+        if course_data:
+            scorm_frame.locator(SIDEBAR_SELECTOR).wait_for(state='visible')
+        _extract_lessons(
+            scorm_page,
+            scorm_frame,
+            _only_lessons(course_scheme, pending),
+            total_lessons=sum(len(s.lessons) for s in course_scheme),
+            store=store,
+        )
+    if store:
+        store.finish_run()
+    return CourseScheme(title=course_title, sections=course_scheme)
 
-    logger.info('Parsing course scheme...')
-    course_scheme = _get_course_scheme(scorm_frame)
-    course_title = _get_course_title(scorm_frame)
 
-    if not course_scheme:
-        logger.warning('No course scheme sections/lessons found.')
-        return CourseScheme(title=course_title, sections=[])
-    else:
-        total_items = sum(len(s.lessons) for s in course_scheme)
-        logger.info(
-            'Found %s course scheme sections with %s total lessons.',
-            len(course_scheme),
-            total_items,
+def checkpoint_store(course_title: str) -> CheckpointStore | None:
+    checkpoint_dir = get_config().checkpoint_dir
+    return CheckpointStore(checkpoint_dir, course_title) if checkpoint_dir else None
+
+
+def _only_lessons(
+    sections: list[CourseSchemeSection], lessons: list[CourseSchemeLesson]
+) -> list[CourseSchemeSection]:
+    """Views of `sections` holding only `lessons`, sharing the same lesson objects."""
+    wanted = {id(lesson) for lesson in lessons}
+    views = [
+        CourseSchemeSection(title=s.title, lessons=[lesson for lesson in s.lessons if id(lesson) in wanted])
+        for s in sections
+    ]
+    return [view for view in views if view.lessons]
+
+
+def _extract_lessons(
+    scorm_page: Page,
+    scorm_frame: Frame,
+    course_scheme: list[CourseSchemeSection],
+    *,
+    total_lessons: int | None = None,
+    store: CheckpointStore | None = None,
+) -> None:
+    """Open every lesson of `course_scheme` in the player and store its blocks on the lesson.
+
+    Each finished lesson is checkpointed to `store`; a failing one is retried after the rest
+    and, once out of retries, left empty instead of ending the run.
+    """
+    settings = get_config()
+    if settings.lesson_processes > 1:
+        extract_lessons_sharded(
+            scorm_page=scorm_page,
+            sections=course_scheme,
+            processes=settings.lesson_processes,
+            sidebar_selector=SIDEBAR_SELECTOR,
+            sidebar_lesson_links_selector=SIDEBAR_LESSON_LINKS_SELECTOR,
+            lesson_content_selector=LESSON_CONTENT_SELECTOR,
+            total_lessons=total_lessons,
+            timeout_ms=5000,
+            retries=settings.lesson_retries,
+            store=store,
         )
+        return
+
+    reuse = partial(store.reuse, page=scorm_page) if store and settings.incremental else None
+    pool_size = max(1, settings.lesson_workers)
+    if pool_size > 1:
+        extract_lessons_pooled(
+            scorm_page=scorm_page,
+            scorm_frame=scorm_frame,
+            sections=course_scheme,
+            pool_size=pool_size,
+            sidebar_selector=SIDEBAR_SELECTOR,
+            sidebar_lesson_links_selector=SIDEBAR_LESSON_LINKS_SELECTOR,
+            lesson_content_selector=LESSON_CONTENT_SELECTOR,
+            timeout_ms=5000,
+            retries=settings.lesson_retries,
+            on_lesson=store.save if store else None,
+            reuse=reuse,
+        )
+        return
 
-    flat_lessons = [lesson for section in course_scheme for lesson in section.lessons]
-    total_lessons = len(flat_lessons)
+    queue = LessonQueue(
+        (lesson for section in course_scheme for lesson in section.lessons), retries=settings.lesson_retries
+    )
+    if total_lessons is None:
+        total_lessons = len(queue)
 
-    for section in course_scheme:
-        for lesson_ref in section.lessons:
+    while queue:
+        lesson_ref = queue.popleft()
+        try:
             scorm_frame, blocks = extract_lesson(
                 scorm_page=scorm_page,
                 scorm_frame=scorm_frame,
@@ -85,7 +190,15 @@ def extract_course(scorm_page: Page) -> CourseScheme:
                 sidebar_lesson_links_selector=SIDEBAR_LESSON_LINKS_SELECTOR,
                 lesson_content_selector=LESSON_CONTENT_SELECTOR,
                 timeout_ms=5000,
+                reuse=reuse,
             )
-            lesson_ref.blocks = blocks
-
-    return CourseScheme(title=course_title, sections=course_scheme)
+        except LESSON_ERRORS as exc:
+            queue.fail(lesson_ref, exc)
+            if scorm_frame.is_detached():
+                scorm_frame = resolve_scorm_frame(scorm_page)
+            continue
+        queue.done(lesson_ref)
+        lesson_ref.blocks = blocks
+        if store:
+            store.save(lesson_ref, blocks)
+    queue.log_summary()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from playwright.async_api import Frame as AsyncFrame
+from playwright.sync_api import Frame
+
+from scraper.parsers.course_data import CourseData, parse_course_data
+
+logger = logging.getLogger(__name__)
+
+# Rise exports embed the whole course as `window.courseData`, a base64-encoded UTF-8 JSON string.
+COURSE_DATA_JS = r"""
+    () => {
+        const raw = window.courseData;
+        if (!raw) return null;
+        if (typeof raw !== 'string') return raw;
+        try {
+            const bytes = Uint8Array.from(atob(raw), (c) => c.charCodeAt(0));
+            return JSON.parse(new TextDecoder().decode(bytes));
+        } catch (e) {}
+        try {
+            return JSON.parse(raw);
+        } catch (e) {
+            return null;
+        }
+    }
+"""
+
+
+def _parse(payload: object, frame: Frame | AsyncFrame) -> CourseData | None:
+    if not isinstance(payload, dict):
+        logger.info('No embedded course data found; reading lessons from the page.')
+        return None
+    try:
+        course = parse_course_data(payload, base_url=frame.url, page=frame.page)
+    except Exception as e:
+        logger.warning('Could not read the embedded course data (%s); reading lessons from the page.', e)
+        return None
+    if not course.sections:
+        return None
+
+    total = sum(len(s.lessons) for s in course.sections)
+    logger.info(
+        'Read %s of %s lessons from the embedded course data.',
+        total - len(course.pending),
+        total,
+    )
+    return course
+
+
+def read_course_data(scorm_frame: Frame) -> CourseData | None:
+    """Build the course from the payload Rise embeds in the content frame, if there is one."""
+    try:
+        payload = scorm_frame.evaluate(COURSE_DATA_JS)
+    except Exception:
+        payload = None
+    return _parse(payload, scorm_frame)
+
+
+async def read_course_data_async(scorm_frame: AsyncFrame) -> CourseData | None:
+    try:
+        payload = await scorm_frame.evaluate(COURSE_DATA_JS)
+    except Exception:
+        payload = None
+    return await asyncio.to_thread(_parse, payload, scorm_frame)
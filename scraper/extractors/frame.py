@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import logging
+import time
+from weakref import WeakKeyDictionary, ref
+
+from playwright.async_api import Frame as AsyncFrame
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Frame, Page
+
+logger = logging.getLogger(__name__)
+
+CONTENT_FRAME = '#content-frame'
+COVER_PAGE_SELECTOR = '#cover'
+COVER_START_COURSE_BUTTON_SELECTOR = '.cover__header-content-action-link'
+
+
+def _frame_from_iframe(page: Page, iframe_query_selector: str) -> Frame | None:
+    iframe = page.query_selector(iframe_query_selector)
+    if not iframe:
+        return None
+    return iframe.content_frame()
+
+
+def _query_scorm_frame(scorm_page: Page) -> Frame:
+    scorm_frame: Frame | None = _frame_from_iframe(scorm_page, f'iframe{CONTENT_FRAME}')
+
+    if not scorm_frame:
+        scorm_frame = _frame_from_iframe(scorm_page, 'iframe')
+
+    if not scorm_frame:
+        raise RuntimeError('Could not resolve SCORM content frame.')
+
+    logger.info('Resolved SCORM content frame.')
+    return scorm_frame
+
+
+async def _frame_from_iframe_async(page: AsyncPage, iframe_query_selector: str) -> AsyncFrame | None:
+    iframe = await page.query_selector(iframe_query_selector)
+    if not iframe:
+        return None
+    return await iframe.content_frame()
+
+
+async def _query_scorm_frame_async(scorm_page: AsyncPage) -> AsyncFrame:
+    scorm_frame = await _frame_from_iframe_async(scorm_page, f'iframe{CONTENT_FRAME}')
+
+    if not scorm_frame:
+        scorm_frame = await _frame_from_iframe_async(scorm_page, 'iframe')
+
+    if not scorm_frame:
+        raise RuntimeError('Could not resolve SCORM content frame.')
+
+    logger.info('Resolved SCORM content frame.')
+    return scorm_frame
+
+
+class _FrameEvents:
+    """Frame bookkeeping shared by the sync and async trackers; handlers never call the browser.
+
+    The page is held weakly: `_TRACKERS` keeps each tracker alive for as long as its page, so a
+    strong reference back would keep every page a long-running batch or daemon ever opened.
+    """
+
+    def __init__(self, page: Page | AsyncPage) -> None:
+        self._page = ref(page)
+        self._frame: Frame | AsyncFrame | None = None
+        self._candidates: list[Frame | AsyncFrame] = []  # Child frames attached or navigated since.
+        page.on('frameattached', self._on_frame_changed)
+        page.on('framenavigated', self._on_frame_changed)
+        page.on('framedetached', self._on_frame_detached)
+        page.on('close', self._on_close)
+
+    @property
+    def page(self) -> Page | AsyncPage:
+        page = self._page()
+        if page is None:
+            raise RuntimeError('The SCORM page was closed.')
+        return page
+
+    def _on_close(self, page: Page | AsyncPage) -> None:
+        _TRACKERS.pop(page, None)
+        self._frame = None
+        self._candidates.clear()
+
+    def _on_frame_changed(self, frame: Frame | AsyncFrame) -> None:
+        if frame.parent_frame is not None and frame is not self._frame and frame not in self._candidates:
+            self._candidates.append(frame)
+
+    def _on_frame_detached(self, frame: Frame | AsyncFrame) -> None:
+        if frame in self._candidates:
+            self._candidates.remove(frame)
+        if frame is self._frame:
+            logger.info('SCORM content frame detached; switching to its replacement.')
+            self._frame = None
+
+    def _tracked(self) -> Frame | AsyncFrame | None:
+        if self._frame is not None and not self._frame.is_detached():
+            return self._frame
+        return None
+
+    def _take_candidates(self) -> list[Frame | AsyncFrame]:
+        # Newest first: after a reload the replacement iframe is the last one attached.
+        candidates = [frame for frame in reversed(self._candidates) if not frame.is_detached()]
+        self._candidates.clear()
+        return candidates
+
+
+class FrameTracker(_FrameEvents):
+    """Follows the SCORM content frame through the page's frame events.
+
+    The player replaces `#content-frame` when the SCORM runtime reloads. The tracker learns
+    about that from `framedetached`/`frameattached` as it happens, so `current()` only looks
+    at the frames attached since, and waits switch to the new frame instead of timing out.
+    """
+
+    def current(self) -> Frame:
+        frame = self._tracked()
+        if frame is not None:
+            return frame
+        for candidate in self._take_candidates():
+            try:
+                element = candidate.frame_element()
+            except PlaywrightError:
+                continue
+            if element.get_attribute('id') == CONTENT_FRAME.lstrip('#'):
+                self._frame = candidate
+                logger.info('Tracking the new SCORM content frame.')
+                return candidate
+        self._frame = _query_scorm_frame(self.page)
+        return self._frame
+
+    def wait_for_selector(self, selector: str, *, timeout_ms: int) -> Frame:
+        """Wait for `selector` in the content frame, following it if it is replaced meanwhile."""
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            frame = self.current()
+            remaining_ms = max((deadline - time.monotonic()) * 1000, 1)
+            try:
+                frame.wait_for_selector(selector, state='visible', timeout=remaining_ms)
+                return frame
+            except PlaywrightError:
+                # Also covers TimeoutError; only a frame swap is worth waiting out.
+                if not frame.is_detached() or time.monotonic() >= deadline:
+                    raise
+
+
+class AsyncFrameTracker(_FrameEvents):
+    """Async counterpart of `FrameTracker`."""
+
+    async def current(self) -> AsyncFrame:
+        frame = self._tracked()
+        if frame is not None:
+            return frame
+        for candidate in self._take_candidates():
+            try:
+                element = await candidate.frame_element()
+                frame_id = await element.get_attribute('id')
+            except PlaywrightError:
+                continue
+            if frame_id == CONTENT_FRAME.lstrip('#'):
+                self._frame = candidate
+                logger.info('Tracking the new SCORM content frame.')
+                return candidate
+        self._frame = await _query_scorm_frame_async(self.page)
+        return self._frame
+
+    async def wait_for_selector(self, selector: str, *, timeout_ms: int) -> AsyncFrame:
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            frame = await self.current()
+            remaining_ms = max((deadline - time.monotonic()) * 1000, 1)
+            try:
+                await frame.wait_for_selector(selector, state='visible', timeout=remaining_ms)
+                return frame
+            except PlaywrightError:
+                if not frame.is_detached() or time.monotonic() >= deadline:
+                    raise
+
+
+_TRACKERS: WeakKeyDictionary[object, _FrameEvents] = WeakKeyDictionary()
+
+
+def frame_tracker(page: Page) -> FrameTracker:
+    """Return the page's frame tracker, subscribing it to frame events on first use."""
+    tracker = _TRACKERS.get(page)
+    if tracker is None:
+        tracker = _TRACKERS[page] = FrameTracker(page)
+    return tracker
+
+
+def frame_tracker_async(page: AsyncPage) -> AsyncFrameTracker:
+    tracker = _TRACKERS.get(page)
+    if tracker is None:
+        tracker = _TRACKERS[page] = AsyncFrameTracker(page)
+    return tracker
+
+
+def resolve_scorm_frame(scorm_page: Page) -> Frame:
+    return frame_tracker(scorm_page).current()
+
+
+async def resolve_scorm_frame_async(scorm_page: AsyncPage) -> AsyncFrame:
+    return await frame_tracker_async(scorm_page).current()
+
+
+def start_course(scorm_frame: Frame) -> None:
+    if scorm_frame.locator(f'div{COVER_PAGE_SELECTOR}').count() > 0:
+        start_course_button = scorm_frame.locator(f'a{COVER_START_COURSE_BUTTON_SELECTOR}')
+        start_course_button.click()
@@ -1,15 +1,45 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Callable
+from typing import Any
 
 from playwright.sync_api import Frame, Page, TimeoutError
 
+from scraper.config import ExtractionMode, LessonNavigation, get_config
+from scraper.extractors.frame import frame_tracker
+from scraper.extractors.readiness import remaining_ms, wait_for_lesson_ready
 from scraper.models.course_scheme import CourseSchemeLesson
 from scraper.parsers.blocks import LessonBlock
 from scraper.parsers.lesson import parse_lesson_content
+from scraper.parsers.static import snapshot_locator
 
 logger = logging.getLogger(__name__)
 
+# Returns stored blocks for a lesson whose `fingerprint` matches the previous run, else None.
+LessonReuse = Callable[[CourseSchemeLesson], 'list[LessonBlock] | None']
+
+SET_LESSON_HASH_JS = r"""
+    (hash) => {
+        if (window.location.hash !== hash) window.location.hash = hash;
+    }
+"""
+
+# SHA-256 of the lesson's HTML with inline styles and inter-tag whitespace removed, so animation
+# state does not change it. Resolves `null` where SubtleCrypto is unavailable (insecure origins).
+LESSON_FINGERPRINT_JS = r"""
+    async (root) => {
+        if (!window.crypto || !window.crypto.subtle) return null;
+        const clone = root.cloneNode(true);
+        clone.removeAttribute('style');
+        clone.querySelectorAll('[style]').forEach((el) => el.removeAttribute('style'));
+        const html = clone.outerHTML.replace(/>\s+</g, '><').replace(/\s+/g, ' ');
+        const digest = await window.crypto.subtle.digest('SHA-256', new TextEncoder().encode(html));
+        return Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, '0')).join('');
+    }
+"""
+
 
 def find_frame_with_matching_element(page: Page, selector: str) -> Frame | None:
     for frame in page.frames:
@@ -21,38 +51,143 @@ def find_frame_with_matching_element(page: Page, selector: str) -> Frame | None:
     return None
 
 
-def extract_lesson(
+def lesson_route(item: CourseSchemeLesson) -> str | None:
+    """Return the `#/lessons/<id>` hash that opens `item` when navigating through the router."""
+    if get_config().lesson_navigation != LessonNavigation.HASH:
+        return None
+    if not (item.lesson_id and item.href and '#' in item.href):
+        return None
+    return '#' + item.href.split('#', 1)[1]
+
+
+def target_lesson_selector(lesson_content_selector: str, item: CourseSchemeLesson) -> str:
+    lesson_id = (item.lesson_id or '').replace('"', r'\"')
+    return f'{lesson_content_selector}[data-lesson-id="{lesson_id}"]'
+
+
+def open_lesson(
     *,
-    scorm_page: Page,
     scorm_frame: Frame,
     item: CourseSchemeLesson,
-    total_items: int,
     sidebar_lesson_links_selector: str,
     lesson_content_selector: str,
-    timeout_ms: int = 5000,
-) -> tuple[Frame, list[LessonBlock]]:
-    logger.info('Parsing lesson %s/%s: %s', item.index + 1, total_items, item.title)
+) -> str:
+    """Navigate to `item` and return the selector its rendered content will match."""
+    route = lesson_route(item)
+    if route:
+        scorm_frame.evaluate(SET_LESSON_HASH_JS, route)
+        return target_lesson_selector(lesson_content_selector, item)
 
     link = scorm_frame.locator(sidebar_lesson_links_selector).nth(item.index)
     link.click()
+    return lesson_content_selector
+
 
+def _wait_for_lesson_or_refresh(
+    *,
+    scorm_page: Page,
+    scorm_frame: Frame,
+    lesson_content_selector: str,
+    timeout_ms: int,
+) -> Frame:
     try:
-        scorm_frame.wait_for_selector(lesson_content_selector, state='visible', timeout=timeout_ms)
+        return frame_tracker(scorm_page).wait_for_selector(lesson_content_selector, timeout_ms=timeout_ms)
     except TimeoutError:
-        logger.warning('Lesson content not found, refreshing frame...')
+        # Frame swaps are followed above; this only runs if the lesson rendered somewhere else.
+        logger.warning('Lesson content not found in the SCORM content frame, searching other frames...')
 
         refreshed = find_frame_with_matching_element(scorm_page, lesson_content_selector)
         if not refreshed:
             raise RuntimeError('Could not resolve SCORM content frame.')
 
         scorm_frame = refreshed
-        logger.info('Refreshed SCORM content frame.')
+        logger.info('Found lesson content in another frame.')
 
         scorm_frame.wait_for_selector(lesson_content_selector, state='visible', timeout=timeout_ms)
         logger.info('Lesson content found after refresh.')
+    return scorm_frame
+
+
+def fingerprint_lesson(lesson_el: Any) -> str | None:
+    try:
+        return lesson_el.evaluate(LESSON_FINGERPRINT_JS)
+    except Exception:
+        return None
+
+
+def read_lesson(
+    *,
+    scorm_page: Page,
+    scorm_frame: Frame,
+    lesson_content_selector: str,
+    timeout_ms: int = 5000,
+    item: CourseSchemeLesson | None = None,
+    reuse: LessonReuse | None = None,
+) -> tuple[Frame, list[LessonBlock]]:
+    """Wait for the open lesson and parse its blocks.
+
+    With `item` and `reuse`, the rendered lesson is fingerprinted first and the stored blocks
+    are returned when it is unchanged.
+    """
+    if scorm_frame.is_detached():
+        scorm_frame = frame_tracker(scorm_page).current()
+    started = time.monotonic()
+    ready = get_config().event_readiness and wait_for_lesson_ready(
+        scorm_frame, lesson_content_selector, timeout_ms=timeout_ms
+    )
+    if not ready:
+        scorm_frame = _wait_for_lesson_or_refresh(
+            scorm_page=scorm_page,
+            scorm_frame=scorm_frame,
+            lesson_content_selector=lesson_content_selector,
+            timeout_ms=remaining_ms(started, timeout_ms),
+        )
 
     lesson_el = scorm_frame.locator(lesson_content_selector).first
-    parsed_blocks: list[LessonBlock] = parse_lesson_content(lesson_el)
+    if item is not None and reuse is not None:
+        item.fingerprint = fingerprint_lesson(lesson_el)
+        stored = reuse(item) if item.fingerprint else None
+        if stored is not None:
+            logger.info('Lesson unchanged since the last run: %s', item.title)
+            return scorm_frame, stored
+
+    settings = get_config()
+    live = settings.extraction_mode != ExtractionMode.SNAPSHOT
+    if not live:
+        lesson_el = snapshot_locator(lesson_el)
+    # Live blocks are serialized after their lesson closes only for the snapshot and checkpoints.
+    keep_html = live and (settings.write_snapshot or bool(settings.checkpoint_dir))
+    parsed_blocks: list[LessonBlock] = parse_lesson_content(lesson_el, keep_html=keep_html)
+    return scorm_frame, parsed_blocks
+
+
+def extract_lesson(
+    *,
+    scorm_page: Page,
+    scorm_frame: Frame,
+    item: CourseSchemeLesson,
+    total_items: int,
+    sidebar_lesson_links_selector: str,
+    lesson_content_selector: str,
+    timeout_ms: int = 5000,
+    reuse: LessonReuse | None = None,
+) -> tuple[Frame, list[LessonBlock]]:
+    logger.info('Parsing lesson %s/%s: %s', item.index + 1, total_items, item.title)
+
+    content_selector = open_lesson(
+        scorm_frame=scorm_frame,
+        item=item,
+        sidebar_lesson_links_selector=sidebar_lesson_links_selector,
+        lesson_content_selector=lesson_content_selector,
+    )
+    scorm_frame, parsed_blocks = read_lesson(
+        scorm_page=scorm_page,
+        scorm_frame=scorm_frame,
+        lesson_content_selector=content_selector,
+        timeout_ms=timeout_ms,
+        item=item,
+        reuse=reuse,
+    )
 
     logger.info('Scraped %s/%s: %s', item.index + 1, total_items, item.title)
     return scorm_frame, parsed_blocks
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from playwright.sync_api import BrowserContext, Frame, Page
+
+from scraper.extractors.frame import resolve_scorm_frame, start_course
+from scraper.extractors.lesson import LessonReuse, open_lesson, read_lesson
+from scraper.extractors.retry import LESSON_ERRORS, LessonQueue
+from scraper.models.course_scheme import CourseSchemeLesson, CourseSchemeSection
+from scraper.parsers.blocks import LessonBlock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LessonWorker:
+    page: Page
+    frame: Frame
+    owns_page: bool = False
+    lesson: CourseSchemeLesson | None = None
+    content_selector: str = ''
+
+
+def open_worker(context: BrowserContext, url: str, *, sidebar_selector: str) -> LessonWorker:
+    """Open another copy of the SCORM player in `context`, sharing its logged-in session."""
+    page = context.new_page()
+    page.goto(url)
+    page.wait_for_load_state()
+
+    frame = resolve_scorm_frame(page)
+    start_course(frame)
+    frame.locator(sidebar_selector).wait_for(state='attached')
+    return LessonWorker(page=page, frame=frame, owns_page=True)
+
+
+def extract_lessons_pooled(
+    *,
+    scorm_page: Page,
+    scorm_frame: Frame,
+    sections: list[CourseSchemeSection],
+    pool_size: int,
+    sidebar_selector: str,
+    sidebar_lesson_links_selector: str,
+    lesson_content_selector: str,
+    timeout_ms: int = 5000,
+    retries: int = 0,
+    on_lesson: Callable[[CourseSchemeLesson, list[LessonBlock]], None] | None = None,
+    reuse: LessonReuse | None = None,
+) -> None:
+    """Extract every lesson of `sections` across `pool_size` pages of one browser context.
+
+    The sync API drives one page at a time, so workers are scheduled in rounds: each idle
+    worker is sent to its next lesson first, then results are read back in turn. Lessons
+    render concurrently in the browser while Python reads the earlier ones. A lesson that
+    fails is retried up to `retries` times; `on_lesson` is called with each finished one.
+    """
+    workers = [LessonWorker(page=scorm_page, frame=scorm_frame)]
+    for _ in range(pool_size - 1):
+        try:
+            workers.append(open_worker(scorm_page.context, scorm_page.url, sidebar_selector=sidebar_selector))
+        except Exception as exc:
+            logger.warning('Could not open lesson worker page: %s', exc)
+            break
+    logger.info('Extracting lessons with %s worker pages.', len(workers))
+
+    queue = LessonQueue((lesson for section in sections for lesson in section.lessons), retries=retries)
+    total_lessons = len(queue)
+    results: dict[int, list[LessonBlock]] = {}
+
+    try:
+        while queue:
+            busy: list[LessonWorker] = []
+            for worker in workers:
+                if not queue:
+                    break
+                worker.lesson = queue.popleft()
+                logger.info(
+                    'Parsing lesson %s/%s: %s', worker.lesson.index + 1, total_lessons, worker.lesson.title
+                )
+                try:
+                    worker.content_selector = open_lesson(
+                        scorm_frame=worker.frame,
+                        item=worker.lesson,
+                        sidebar_lesson_links_selector=sidebar_lesson_links_selector,
+                        lesson_content_selector=lesson_content_selector,
+                    )
+                except LESSON_ERRORS as exc:
+                    _recover(worker, queue, exc)
+                    continue
+                busy.append(worker)
+
+            for worker in busy:
+                try:
+                    worker.frame, blocks = read_lesson(
+                        scorm_page=worker.page,
+                        scorm_frame=worker.frame,
+                        lesson_content_selector=worker.content_selector,
+                        timeout_ms=timeout_ms,
+                        item=worker.lesson,
+                        reuse=reuse,
+                    )
+                except LESSON_ERRORS as exc:
+                    _recover(worker, queue, exc)
+                    continue
+                queue.done(worker.lesson)
+                results[worker.lesson.index] = blocks
+                if on_lesson:
+                    on_lesson(worker.lesson, blocks)
+                logger.info('Scraped %s/%s: %s', worker.lesson.index + 1, total_lessons, worker.lesson.title)
+    finally:
+        for worker in workers:
+            if worker.owns_page:
+                worker.page.close()
+
+    queue.log_summary()
+    for section in sections:
+        for lesson_ref in section.lessons:
+            lesson_ref.blocks = results.get(lesson_ref.index, [])
+
+
+def _recover(worker: LessonWorker, queue: LessonQueue, exc: BaseException) -> None:
+    """Requeue the worker's lesson and re-resolve its frame if the player replaced it."""
+    queue.fail(worker.lesson, exc)
+    if worker.frame.is_detached():
+        worker.frame = resolve_scorm_frame(worker.page)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from playwright.async_api import Frame as AsyncFrame
+from playwright.sync_api import Frame
+
+from scraper.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Resolves `true` once `selector` matches and that element's subtree, and the fetch/XHR
+# requests started since the call, have been quiet for `quietMs`; `false` after `timeoutMs`.
+# Only the lesson's own container is observed, so ongoing changes elsewhere in the frame
+# (sidebar, progress UI, carousels, polling) do not hold the lesson back. The request
+# tracker is installed once per document and records when each request started.
+LESSON_READY_JS = r"""
+    ({ selector, quietMs, timeoutMs }) => new Promise((resolve) => {
+        const network = window.__scraperNetwork || (window.__scraperNetwork = (() => {
+            const tracker = { pending: new Set() };
+            const track = () => {
+                const request = { started: performance.now() };
+                tracker.pending.add(request);
+                return () => tracker.pending.delete(request);
+            };
+            const originalFetch = window.fetch;
+            if (originalFetch) {
+                window.fetch = function (...args) {
+                    const done = track();
+                    return originalFetch.apply(this, args).finally(done);
+                };
+            }
+            const originalSend = XMLHttpRequest.prototype.send;
+            XMLHttpRequest.prototype.send = function (...args) {
+                this.addEventListener('loadend', track(), { once: true });
+                return originalSend.apply(this, args);
+            };
+            return tracker;
+        })());
+
+        const started = performance.now();
+        let lastChange = started;
+        let target = null;
+        const observer = new MutationObserver(() => { lastChange = performance.now(); });
+        const busy = () => [...network.pending].some((request) => request.started >= started);
+
+        const check = () => {
+            const now = performance.now();
+            const el = document.querySelector(selector);
+            if (el !== target) {
+                // The container appeared or was replaced: watch the new one from now on.
+                observer.disconnect();
+                target = el;
+                if (el) observer.observe(el, { childList: true, subtree: true, characterData: true });
+                lastChange = now;
+            }
+            const ready = !!target && !busy() && now - lastChange >= quietMs;
+            if (ready || now - started >= timeoutMs) {
+                observer.disconnect();
+                resolve(ready);
+                return;
+            }
+            setTimeout(check, Math.min(quietMs, 50));
+        };
+        check();
+    })
+"""
+
+# Least time left to the fallback wait; Playwright reads a timeout of 0 as "no timeout".
+MIN_FALLBACK_MS = 250
+
+
+def _ready_args(selector: str, timeout_ms: int) -> dict:
+    return {'selector': selector, 'quietMs': get_config().readiness_quiet_ms, 'timeoutMs': timeout_ms}
+
+
+def remaining_ms(started: float, timeout_ms: int) -> int:
+    """Time left of `timeout_ms` since `started` (a `time.monotonic()` reading), for fallbacks."""
+    return max(MIN_FALLBACK_MS, timeout_ms - int((time.monotonic() - started) * 1000))
+
+
+def wait_for_lesson_ready(frame: Frame, selector: str, *, timeout_ms: int) -> bool:
+    """Wait until the lesson matching `selector` has rendered and settled; False if it did not."""
+    try:
+        return bool(frame.evaluate(LESSON_READY_JS, _ready_args(selector, timeout_ms)))
+    except Exception as exc:  # Frame detached or navigated while waiting.
+        logger.debug('Readiness detector failed: %s', exc)
+        return False
+
+
+async def wait_for_lesson_ready_async(frame: AsyncFrame, selector: str, *, timeout_ms: int) -> bool:
+    try:
+        return bool(await frame.evaluate(LESSON_READY_JS, _ready_args(selector, timeout_ms)))
+    except Exception as exc:
+        logger.debug('Readiness detector failed: %s', exc)
+        return False
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import logging
+import statistics
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable
+
+from playwright.sync_api import Error as PlaywrightError
+
+from scraper.models.course_scheme import CourseSchemeLesson
+
+logger = logging.getLogger(__name__)
+
+# Per-lesson failures that are retried instead of ending the run.
+LESSON_ERRORS = (RuntimeError, PlaywrightError)
+
+
+def latency_stats(latencies: list[float]) -> tuple[float, float, float]:
+    """Return the median, 90th percentile and maximum of a non-empty list of latencies."""
+    p90 = statistics.quantiles(latencies, n=10)[-1] if len(latencies) > 1 else latencies[0]
+    return statistics.median(latencies), p90, max(latencies)
+
+
+class LessonQueue:
+    """Lessons left to extract. A failed lesson goes back to the end of the queue until it has
+    used up its retries; after that it is recorded in `failed` and the course carries on.
+
+    The time from taking a lesson to `done` is recorded per lesson for the end-of-run report."""
+
+    def __init__(self, lessons: Iterable[CourseSchemeLesson], *, retries: int) -> None:
+        self._queue: deque[CourseSchemeLesson] = deque(lessons)
+        self._attempts: dict[int, int] = defaultdict(int)
+        self.retries = retries
+        self.failed: list[CourseSchemeLesson] = []
+        self.latencies: list[float] = []
+        self._started: dict[int, float] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._queue)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def popleft(self) -> CourseSchemeLesson:
+        lesson = self._queue.popleft()
+        self._started[lesson.index] = time.perf_counter()
+        return lesson
+
+    def done(self, lesson: CourseSchemeLesson) -> None:
+        started = self._started.pop(lesson.index, None)
+        if started is not None:
+            self.latencies.append(time.perf_counter() - started)
+
+    def fail(self, lesson: CourseSchemeLesson, exc: BaseException) -> None:
+        self._attempts[lesson.index] += 1
+        if self._attempts[lesson.index] <= self.retries:
+            logger.warning('Lesson %s failed (%s); queued for retry.', lesson.title, exc)
+            self._queue.append(lesson)
+            return
+        logger.error(
+            'Giving up on lesson %s after %s attempts: %s', lesson.title, self._attempts[lesson.index], exc
+        )
+        self.failed.append(lesson)
+
+    def log_summary(self) -> None:
+        if self.latencies:
+            logger.info(
+                'Per-lesson latency over %s lessons: median %.2fs, p90 %.2fs, max %.2fs',
+                len(self.latencies),
+                *latency_stats(self.latencies),
+            )
+        if self.failed:
+            logger.error(
+                '%s lessons could not be extracted and are left empty: %s',
+                len(self.failed),
+                ', '.join(lesson.title for lesson in self.failed),
+            )
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import sqlite3
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from playwright.sync_api import Page, sync_playwright
+
+from scraper.browser import apply_profile, context_options, launch_options
+from scraper.checkpoint import CheckpointStore
+from scraper.config import get_config
+from scraper.extractors.frame import resolve_scorm_frame, start_course
+from scraper.extractors.lesson import extract_lesson
+from scraper.extractors.retry import LESSON_ERRORS, latency_stats
+from scraper.har import replay_har
+from scraper.models.course_scheme import CourseSchemeLesson, CourseSchemeSection
+from scraper.network import extraction_blocker
+from scraper.parsers.serialize import pack_blocks, unpack_blocks
+from scraper.session import open_scorm_page
+
+logger = logging.getLogger(__name__)
+
+QUEUE_FILENAME = 'lessons.sqlite'
+STORAGE_STATE_FILENAME = 'storage_state.json'
+
+# Settings a worker process copies from the parent; the rest only matter for rendering.
+SHARD_SETTINGS = (
+    'viewport_width',
+    'viewport_height',
+    'extraction_mode',
+    'layout_free_text',
+    'html_parser',
+    'lesson_navigation',
+    'event_readiness',
+    'readiness_quiet_ms',
+    'block_resources',
+    'lean_profile',
+    'lean_viewport_width',
+    'lean_viewport_height',
+    'headless',
+    'incremental',
+    'har_replay',
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lessons (
+    idx INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    href TEXT,
+    lesson_id TEXT,
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker INTEGER,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    claimed_at REAL,
+    latency REAL,
+    fingerprint TEXT,
+    blocks BLOB
+)
+"""
+
+
+class ShardQueue:
+    """Lessons of one run in an SQLite file shared by the worker processes.
+
+    A lesson row is `pending` until a worker claims it, then `done` with its packed blocks,
+    or back to `pending` after a failure until it has used up its retries (`failed`).
+    Claims run in an immediate transaction, so two workers never take the same row.
+    """
+
+    def __init__(self, path: str | Path, *, timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self._conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+        self._conn.execute('COMMIT')
+
+    def add(self, lessons: list[CourseSchemeLesson]) -> None:
+        with self._transaction() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO lessons (idx, title, href, lesson_id) VALUES (?, ?, ?, ?)',
+                [(lesson.index, lesson.title, lesson.href, lesson.lesson_id) for lesson in lessons],
+            )
+
+    def claim(self, worker: int) -> CourseSchemeLesson | None:
+        """Take the next pending lesson for `worker`, fresh lessons before retried ones."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT idx, title, href, lesson_id FROM lessons WHERE state = 'pending' "
+                'ORDER BY attempts, idx LIMIT 1'
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE lessons SET state = 'claimed', worker = ?, claimed_at = ? WHERE idx = ?",
+                (worker, time.time(), row[0]),
+            )
+        return CourseSchemeLesson(index=row[0], title=row[1], href=row[2], lesson_id=row[3])
+
+    def complete(self, lesson: CourseSchemeLesson, blocks: bytes) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE lessons SET state = 'done', error = NULL, latency = ? - claimed_at, "
+                'fingerprint = ?, blocks = ? WHERE idx = ?',
+                (time.time(), lesson.fingerprint, blocks, lesson.index),
+            )
+
+    def fail(self, lesson: CourseSchemeLesson, exc: BaseException, *, retries: int) -> None:
+        with self._transaction() as conn:
+            (attempts,) = conn.execute(
+                'SELECT attempts + 1 FROM lessons WHERE idx = ?', (lesson.index,)
+            ).fetchone()
+            state = 'pending' if attempts <= retries else 'failed'
+            conn.execute(
+                'UPDATE lessons SET state = ?, worker = NULL, attempts = ?, error = ? WHERE idx = ?',
+                (state, attempts, str(exc), lesson.index),
+            )
+        if state == 'pending':
+            logger.warning('Lesson %s failed (%s); queued for retry.', lesson.title, exc)
+        else:
+            logger.error('Giving up on lesson %s after %s attempts: %s', lesson.title, attempts, exc)
+
+    def release(self, worker: int, *, retries: int) -> int:
+        """Requeue the lessons a dead `worker` had claimed, counting an attempt; return how many."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE lessons SET state = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, "
+                "worker = NULL, attempts = attempts + 1, error = 'worker exited' "
+                "WHERE state = 'claimed' AND worker = ?",
+                (retries, worker),
+            )
+        return cursor.rowcount
+
+    def pending(self) -> int:
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM lessons WHERE state IN ('pending', 'claimed')"
+        ).fetchone()
+        return count
+
+    def results(self) -> dict[int, tuple[str | None, bytes]]:
+        """Fingerprint and packed blocks of every finished lesson, by lesson index."""
+        rows = self._conn.execute("SELECT idx, fingerprint, blocks FROM lessons WHERE state = 'done'")
+        return {idx: (fingerprint, blocks) for idx, fingerprint, blocks in rows}
+
+    def failed(self) -> list[str]:
+        rows = self._conn.execute("SELECT title FROM lessons WHERE state != 'done' ORDER BY idx")
+        return [title for (title,) in rows]
+
+    def latencies(self) -> list[float]:
+        rows = self._conn.execute("SELECT latency FROM lessons WHERE state = 'done' AND latency IS NOT NULL")
+        return [latency for (latency,) in rows]
+
+
+@dataclass
+class ShardJob:
+    """Everything a worker process needs; pickled to it by `multiprocessing`."""
+
+    worker: int
+    queue_path: str
+    storage_state_path: str
+    scorm_url: str
+    sidebar_selector: str
+    sidebar_lesson_links_selector: str
+    lesson_content_selector: str
+    total_lessons: int
+    retries: int
+    timeout_ms: int = 5000
+    store: CheckpointStore | None = None
+    settings: dict[str, Any] = field(default_factory=dict)
+
+
+def run_shard(job: ShardJob) -> None:
+    """Worker process entry: open the course in a browser of its own and drain the queue."""
+    logging.basicConfig(
+        level=logging.INFO, format=f'%(levelname)s: [shard {job.worker}] %(message)s', force=True
+    )
+    settings = get_config()
+    for name, value in job.settings.items():
+        setattr(settings, name, value)
+    settings.capture_assets = False  # Assets are fetched by the parent, which keeps the blocks.
+
+    queue = ShardQueue(job.queue_path)
+    reuse = job.store.reuse if job.store and settings.incremental else None
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(**launch_options(settings))
+            context = browser.new_context(storage_state=job.storage_state_path, **context_options(settings))
+            apply_profile(context, settings)
+            if settings.har_replay:
+                replay_har(context, settings.har_replay)
+            blocker = extraction_blocker(settings)
+            if blocker:
+                blocker.install(context)
+
+            page = open_scorm_page(context, job.scorm_url)
+            frame = resolve_scorm_frame(page)
+            start_course(frame)
+            frame.locator(job.sidebar_selector).wait_for(state='attached')
+
+            while (lesson := queue.claim(job.worker)) is not None:
+                try:
+                    frame, blocks = extract_lesson(
+                        scorm_page=page,
+                        scorm_frame=frame,
+                        item=lesson,
+                        total_items=job.total_lessons,
+                        sidebar_lesson_links_selector=job.sidebar_lesson_links_selector,
+                        lesson_content_selector=job.lesson_content_selector,
+                        timeout_ms=job.timeout_ms,
+                        reuse=reuse,
+                    )
+                except LESSON_ERRORS as exc:
+                    queue.fail(lesson, exc, retries=job.retries)
+                    if frame.is_detached():
+                        frame = resolve_scorm_frame(page)
+                    continue
+                if job.store:
+                    job.store.save(lesson, blocks)
+                queue.complete(lesson, pack_blocks(blocks))
+            browser.close()
+    finally:
+        queue.close()
+
+
+def extract_lessons_sharded(
+    *,
+    scorm_page: Page,
+    sections: list[CourseSchemeSection],
+    processes: int,
+    sidebar_selector: str,
+    sidebar_lesson_links_selector: str,
+    lesson_content_selector: str,
+    total_lessons: int | None = None,
+    timeout_ms: int = 5000,
+    retries: int = 0,
+    store: CheckpointStore | None = None,
+) -> None:
+    """Extract every lesson of `sections` across `processes` worker processes.
+
+    Each worker runs its own Playwright and browser, logged in with the storage state of
+    `scorm_page`'s context, and claims lessons from a `ShardQueue`; parsing then runs on as
+    many cores as there are workers. Once every worker has exited, the blocks are put on the
+    lessons in `sections` order. A worker that dies has its claimed lessons requeued and is
+    replaced while lessons are left, up to `processes` replacements in total.
+    """
+    lessons = [lesson for section in sections for lesson in section.lessons]
+    if total_lessons is None:
+        total_lessons = len(lessons)
+    settings = get_config()
+    spawn = multiprocessing.get_context('spawn')
+
+    with tempfile.TemporaryDirectory(prefix='scraper-shards-') as tmp:
+        queue = ShardQueue(Path(tmp) / QUEUE_FILENAME)
+        queue.add(lessons)
+        state_path = Path(tmp) / STORAGE_STATE_FILENAME
+        scorm_page.context.storage_state(path=state_path)
+
+        def start(worker: int) -> multiprocessing.process.BaseProcess:
+            job = ShardJob(
+                worker=worker,
+                queue_path=str(queue.path),
+                storage_state_path=str(state_path),
+                scorm_url=scorm_page.url,
+                sidebar_selector=sidebar_selector,
+                sidebar_lesson_links_selector=sidebar_lesson_links_selector,
+                lesson_content_selector=lesson_content_selector,
+                total_lessons=total_lessons,
+                retries=retries,
+                timeout_ms=timeout_ms,
+                store=store,
+                settings={name: getattr(settings, name) for name in SHARD_SETTINGS},
+            )
+            process = spawn.Process(target=run_shard, args=(job,), name=f'shard-{worker}', daemon=True)
+            process.start()
+            return process
+
+        count = min(processes, len(lessons))
+        logger.info('Extracting %s lessons in %s worker processes...', len(lessons), count)
+        running = {worker: start(worker) for worker in range(count)}
+        next_worker, replacements = count, processes
+        try:
+            while running:
+                time.sleep(0.2)
+                for worker, process in list(running.items()):
+                    if process.is_alive():
+                        continue
+                    del running[worker]
+                    if process.exitcode == 0:
+                        continue
+                    released = queue.release(worker, retries=retries)
+                    logger.warning(
+                        'Worker %s exited with code %s; released %s claimed lessons.',
+                        worker,
+                        process.exitcode,
+                        released,
+                    )
+                    if replacements and queue.pending():
+                        replacements -= 1
+                        running[next_worker] = start(next_worker)
+                        next_worker += 1
+        finally:
+            for process in running.values():
+                process.terminate()
+
+        results = queue.results()
+        latencies = queue.latencies()
+        failed = queue.failed()
+        queue.close()
+
+    for lesson in lessons:
+        if lesson.index in results:
+            lesson.fingerprint, packed = results[lesson.index]
+            lesson.blocks = unpack_blocks(packed, page=scorm_page)
+
+    if latencies:
+        logger.info(
+            'Per-lesson latency over %s lessons: median %.2fs, p90 %.2fs, max %.2fs',
+            len(latencies),
+            *latency_stats(latencies),
+        )
+    if failed:
+        logger.error(
+            '%s lessons could not be extracted and are left empty: %s', len(failed), ', '.join(failed)
+        )
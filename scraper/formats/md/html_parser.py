@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
 from bs4.element import NavigableString, Tag
 
+from scraper.utils.html import parse_html
+
 
 def html_to_markdown(html: str) -> str:
-    soup = BeautifulSoup(html or '', 'html.parser')
+    soup = parse_html(html)
     parts: list[str] = []
     for child in soup.contents:
         out = _render_node_as_blocks(child)
@@ -3,9 +3,10 @@ from __future__ import annotations
 import html
 from pathlib import Path
 
-from bs4 import BeautifulSoup
 from reportlab.platypus import Paragraph
 
+from scraper.utils.html import parse_html
+
 from .builder import PDFBuilder
 from .config import PDF_FONT_JETBRAINS
 from .utils import link_tag
@@ -57,7 +58,7 @@ def html_to_flowables(
     *,
     assets_dir: Path | None = None,
 ) -> list:
-    soup = BeautifulSoup(html_text or '', 'html.parser')
+    soup = parse_html(html_text)
     flowables: list = []
 
     def render_inline(node) -> str:
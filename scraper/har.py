@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import zipfile
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.sync_api import BrowserContext
+
+from scraper.utils.assets import get_asset_store
+
+logger = logging.getLogger(__name__)
+
+
+def record_options(path: str | Path) -> dict:
+    """Keyword arguments for `browser.new_context` that record its traffic to `path`.
+
+    A `.zip` path stores bodies as archive members, any other path embeds them in the HAR.
+    Only what `route_from_har` needs is recorded; the file is written when the context closes.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    return {'record_har_path': str(path), 'record_har_mode': 'minimal'}
+
+
+def replay_har(context: BrowserContext, path: str | Path) -> None:
+    """Serve every request of `context` from the archive; anything not in it is aborted."""
+    context.route_from_har(path, not_found='abort')
+    logger.info('Replaying network traffic from %s', path)
+
+
+async def replay_har_async(context: AsyncBrowserContext, path: str | Path) -> None:
+    await context.route_from_har(path, not_found='abort')
+    logger.info('Replaying network traffic from %s', path)
+
+
+class HarArchive:
+    """Response bodies of a recorded HAR archive (`.har` or Playwright's `.zip`).
+
+    Assets are downloaded through the API request context, which `route_from_har` does not
+    intercept, so while open the archive serves them to `ensure_asset` by URL instead.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path) if zipfile.is_zipfile(self.path) else None
+        if self._zip:
+            member = next((name for name in self._zip.namelist() if name.endswith('.har')), None)
+            if member is None:
+                self._zip.close()
+                raise ValueError(f'{self.path} is a zip archive without a .har member.')
+            log = json.loads(self._zip.read(member))['log']
+        else:
+            log = json.loads(self.path.read_text(encoding='utf-8'))['log']
+
+        self._contents: dict[str, dict[str, Any]] = {}
+        self.documents: list[str] = []  # URLs of the HTML pages, in request order.
+        for entry in log.get('entries', []):
+            url = entry['request']['url']
+            response = entry.get('response') or {}
+            content = response.get('content') or {}
+            if response.get('status') != 200:
+                continue
+            self._contents[url] = content
+            if (content.get('mimeType') or '').startswith('text/html'):
+                self.documents.append(url)
+        get_asset_store().add_url_source(self._contents, self.read)
+
+    def __enter__(self) -> HarArchive:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        get_asset_store().remove_source(self.read)
+        if self._zip:
+            self._zip.close()
+
+    def read(self, url: str) -> bytes | None:
+        content = self._contents.get(url)
+        if content is None:
+            return None
+        if content.get('_file'):
+            try:
+                if self._zip:
+                    return self._zip.read(content['_file'])
+                return (self.path.parent / content['_file']).read_bytes()
+            except (KeyError, OSError):
+                return None
+        text = content.get('text')
+        if text is None:
+            return None
+        return base64.b64decode(text) if content.get('encoding') == 'base64' else text.encode('utf-8')
@@ -12,6 +12,7 @@ class CourseSchemeLesson:
     href: str | None = None
     lesson_id: str | None = None
     blocks: list[LessonBlock] = field(default_factory=list)
+    fingerprint: str | None = None  # Hash of the rendered lesson, for incremental runs.
 
 
 @dataclass
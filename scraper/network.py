@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from scraper.config import Config
+from scraper.utils.assets import AssetStore, get_asset_store
+
+logger = logging.getLogger(__name__)
+
+URL_MATCH_ALL = '**/*'
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+# Third-party analytics and beacons: aborted outright.
+DEFAULT_ABORTED_URL_PATTERNS = (
+    r'google-analytics\.com',
+    r'googletagmanager\.com',
+    r'doubleclick\.net',
+    r'hotjar\.(com|io)',
+    r'segment\.(io|com)',
+    r'sentry\.io',
+    r'/collect\?',
+)
+# LMS progress tracking: answered with an empty success so the player does not retry or warn.
+DEFAULT_STUBBED_URL_PATTERNS = (
+    r'/xapi/',
+    r'/statements(\?|$)',
+    r'scormengine.*/(commit|runtime|terminate)',
+)
+
+
+@dataclass
+class ResourceBlocker:
+    """`page.route` policy that skips requests extraction does not need.
+
+    Assets are downloaded separately (`ensure_asset` uses the API request context, which
+    routes do not intercept), and an element's `src`/`currentSrc` is resolved before its
+    request is made, so blocked media still resolves to the same URLs. Skipped URLs are
+    recorded per resource type.
+    """
+
+    blocked_resource_types: frozenset[str] = DEFAULT_BLOCKED_RESOURCE_TYPES
+    aborted_url_patterns: tuple[str, ...] = DEFAULT_ABORTED_URL_PATTERNS
+    stubbed_url_patterns: tuple[str, ...] = DEFAULT_STUBBED_URL_PATTERNS
+    skipped: dict[str, list[str]] = field(default_factory=lambda: defaultdict(list))
+
+    def __post_init__(self) -> None:
+        self._aborted = [re.compile(p, re.IGNORECASE) for p in self.aborted_url_patterns]
+        self._stubbed = [re.compile(p, re.IGNORECASE) for p in self.stubbed_url_patterns]
+        self._target: Any = None
+
+    def decide(self, resource_type: str, url: str) -> str:
+        """Return 'abort', 'stub' or 'continue' for a request."""
+        if any(p.search(url) for p in self._stubbed):
+            return 'stub'
+        if any(p.search(url) for p in self._aborted):
+            return 'abort'
+        if resource_type in self.blocked_resource_types:
+            return 'abort'
+        return 'continue'
+
+    def _action_for(self, request: Any) -> str:
+        action = self.decide(request.resource_type, request.url)
+        if action != 'continue':
+            self.skipped[request.resource_type].append(request.url)
+        return action
+
+    def _handle(self, route: Any) -> None:
+        action = self._action_for(route.request)
+        if action == 'abort':
+            route.abort('blockedbyclient')
+        elif action == 'stub':
+            route.fulfill(status=204, body='')
+        else:
+            route.fallback()
+
+    async def _handle_async(self, route: Any) -> None:
+        action = self._action_for(route.request)
+        if action == 'abort':
+            await route.abort('blockedbyclient')
+        elif action == 'stub':
+            await route.fulfill(status=204, body='')
+        else:
+            await route.fallback()
+
+    def install(self, target: Any) -> None:
+        """Route every request of a sync `BrowserContext` or `Page` through this policy."""
+        self._target = target
+        target.route(URL_MATCH_ALL, self._handle)
+
+    def uninstall(self) -> None:
+        if self._target is not None:
+            self._target.unroute(URL_MATCH_ALL, self._handle)
+            self._target = None
+        self._log_summary()
+
+    async def install_async(self, target: Any) -> None:
+        self._target = target
+        await target.route(URL_MATCH_ALL, self._handle_async)
+
+    async def uninstall_async(self) -> None:
+        if self._target is not None:
+            await self._target.unroute(URL_MATCH_ALL, self._handle_async)
+            self._target = None
+        self._log_summary()
+
+    def _log_summary(self) -> None:
+        if self.skipped:
+            counts = ', '.join(f'{kind}: {len(urls)}' for kind, urls in sorted(self.skipped.items()))
+            logger.info('Skipped %s requests during extraction (%s).', self.total_skipped, counts)
+
+    @property
+    def total_skipped(self) -> int:
+        return sum(len(urls) for urls in self.skipped.values())
+
+
+def extraction_blocker(config: Config) -> ResourceBlocker | None:
+    """Blocker for an extraction run; images load when their responses are being captured."""
+    if not config.block_resources:
+        return None
+    if config.capture_assets:
+        return ResourceBlocker(blocked_resource_types=DEFAULT_BLOCKED_RESOURCE_TYPES - {'image'})
+    return ResourceBlocker()
+
+
+@dataclass
+class ResponseCapture:
+    """Keep the bodies of image/media responses the page loads, for `ensure_asset` to reuse.
+
+    Bodies are stored under the final URL and every URL of its redirect chain, so a block's
+    `currentSrc` finds them. Partial (206) media responses are ignored. The store is shared by
+    every course of a batch or daemon, so the scrape that owns a capture calls `release` once
+    its assets are written.
+    """
+
+    resource_types: frozenset[str] = frozenset({'image', 'media'})
+    store: AssetStore = field(default_factory=get_asset_store)
+    captured: int = 0
+
+    def __post_init__(self) -> None:
+        self._target: Any = None
+        self._stored: list[str] = []
+
+    def _should_capture(self, response: Any) -> bool:
+        return response.status == 200 and response.request.resource_type in self.resource_types
+
+    @staticmethod
+    def _urls(response: Any) -> list[str]:
+        urls = [response.url]
+        request = response.request
+        while request is not None:
+            urls.append(request.url)
+            request = request.redirected_from
+        return [u for u in urls if not u.startswith('data:')]
+
+    def _store(self, response: Any, body: bytes) -> None:
+        stored = self.store.put(self._urls(response), body)
+        if stored:
+            self.captured += 1
+            self._stored.extend(stored)
+
+    def _on_response(self, response: Any) -> None:
+        if not self._should_capture(response):
+            return
+        try:
+            body = response.body()
+        except Exception:
+            return
+        self._store(response, body)
+
+    async def _on_response_async(self, response: Any) -> None:
+        if not self._should_capture(response):
+            return
+        try:
+            body = await response.body()
+        except Exception:
+            return
+        self._store(response, body)
+
+    def install(self, target: Any) -> None:
+        """Listen to responses of a sync `BrowserContext` or `Page`."""
+        self._target = target
+        target.on('response', self._on_response)
+
+    def uninstall(self) -> None:
+        if self._target is not None:
+            self._target.remove_listener('response', self._on_response)
+            self._target = None
+        logger.info('Captured %s asset responses from the browser.', self.captured)
+
+    def install_async(self, target: Any) -> None:
+        self._target = target
+        target.on('response', self._on_response_async)
+
+    def uninstall_async(self) -> None:
+        if self._target is not None:
+            self._target.remove_listener('response', self._on_response_async)
+            self._target = None
+        logger.info('Captured %s asset responses from the browser.', self.captured)
+
+    def release(self) -> None:
+        """Drop the bodies this capture stored from the store."""
+        self.store.discard(self._stored)
+        self._stored.clear()
+
+
+def asset_capture(config: Config) -> ResponseCapture | None:
+    """Capture for one scrape; its owner calls `release` after writing the course's assets."""
+    return ResponseCapture() if config.capture_assets else None
@@ -9,6 +9,12 @@ from scraper.models.course_scheme import CourseScheme
 
 logger = logging.getLogger(__name__)
 
+ASSETS_DIRNAME = 'assets'
+
+
+def assets_dir_for(path: str | Path) -> Path:
+    return Path(path) / ASSETS_DIRNAME
+
 
 def write_course(
     course: CourseScheme,
@@ -20,7 +26,7 @@ def write_course(
 ) -> None:
     output_dir = Path(path)
     output_dir.mkdir(parents=True, exist_ok=True)
-    assets_dir = output_dir / 'assets'
+    assets_dir = assets_dir_for(output_dir)
 
     if output_formats:
         fmts = output_formats
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import posixpath
+import re
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import unquote, urljoin
+from xml.etree import ElementTree
+
+from scraper.models.course_scheme import CourseScheme, CourseSchemeLesson, CourseSchemeSection
+from scraper.parsers.blocks import LessonBlock, TextBlock
+from scraper.parsers.course_data import parse_course_data
+from scraper.parsers.lesson import parse_lesson_content
+from scraper.parsers.static import StaticLocator
+from scraper.utils.assets import get_asset_store, safe_filename
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'imsmanifest.xml'
+# Reserved TLD: never resolves, only used so packaged files get absolute, joinable URLs.
+PACKAGE_URL_ROOT = 'https://scorm-package.invalid/'
+RISE_CONTENT_FILENAME = 'scormcontent/index.html'
+
+_COURSE_DATA_RE = re.compile(r'courseData\s*=\s*(["\'])([^"\']*)\1')
+
+
+@dataclass
+class ManifestItem:
+    title: str
+    href: str | None = None  # Package path of the item's SCO, if it launches one.
+    children: list[ManifestItem] = field(default_factory=list)
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _child(el: ElementTree.Element, name: str) -> ElementTree.Element | None:
+    return next((c for c in el if _local(c.tag) == name), None)
+
+
+def _xml_base(el: ElementTree.Element) -> str:
+    return el.get('{http://www.w3.org/XML/1998/namespace}base') or ''
+
+
+class ScormPackage:
+    """A SCORM `.zip` export opened for reading; members are read only when asked for.
+
+    While open, asset URLs under `base_url` are served straight from the archive, so blocks
+    built from the package render their images without a browser.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path)
+        self._names = set(self._zip.namelist())
+        self.base_url = f'{PACKAGE_URL_ROOT}{safe_filename(self.path.stem)}/'
+        get_asset_store().add_source(self.base_url, self.read)
+
+    def __enter__(self) -> ScormPackage:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        get_asset_store().remove_source(self.read)
+        self._zip.close()
+
+    def read(self, name: str) -> bytes | None:
+        member = posixpath.normpath(unquote(name.split('?', 1)[0].split('#', 1)[0])).lstrip('/')
+        if member not in self._names:
+            return None
+        return self._zip.read(member)
+
+    def read_text(self, name: str) -> str | None:
+        data = self.read(name)
+        return data.decode('utf-8', errors='replace') if data is not None else None
+
+    def url_for(self, name: str) -> str:
+        return urljoin(self.base_url, name)
+
+    def read_manifest(self) -> tuple[str, list[ManifestItem]]:
+        """Return the default organization's title and item tree, with SCO hrefs resolved."""
+        raw = self.read(MANIFEST_FILENAME)
+        if raw is None:
+            raise FileNotFoundError(f'{MANIFEST_FILENAME} not found in {self.path}')
+        root = ElementTree.fromstring(raw)
+
+        resources: dict[str, str] = {}
+        resources_el = _child(root, 'resources')
+        for res in resources_el if resources_el is not None else []:
+            if _local(res.tag) == 'resource' and res.get('href'):
+                base = _xml_base(root) + _xml_base(resources_el) + _xml_base(res)
+                resources[res.get('identifier', '')] = posixpath.normpath(base + res.get('href'))
+
+        organizations = _child(root, 'organizations')
+        if organizations is None:
+            return self.path.stem, []
+        orgs = [o for o in organizations if _local(o.tag) == 'organization']
+        default = organizations.get('default')
+        org = next((o for o in orgs if o.get('identifier') == default), orgs[0] if orgs else None)
+        if org is None:
+            return self.path.stem, []
+
+        def build(el: ElementTree.Element) -> ManifestItem:
+            title_el = _child(el, 'title')
+            return ManifestItem(
+                title=(title_el.text or '').strip() if title_el is not None else '',
+                href=resources.get(el.get('identifierref', '')),
+                children=[build(c) for c in el if _local(c.tag) == 'item'],
+            )
+
+        title_el = _child(org, 'title')
+        title = (title_el.text or '').strip() if title_el is not None else ''
+        return title or self.path.stem, [build(c) for c in org if _local(c.tag) == 'item']
+
+    def _read_course_data(self, candidates: list[str]) -> dict | None:
+        for name in dict.fromkeys(candidates):
+            match = _COURSE_DATA_RE.search(self.read_text(name) or '')
+            if not match:
+                continue
+            raw = match.group(2)
+            try:
+                return json.loads(base64.b64decode(raw).decode('utf-8'))
+            except ValueError:
+                try:
+                    return json.loads(raw)
+                except ValueError:
+                    continue
+        return None
+
+    def _sco_blocks(self, href: str) -> list[LessonBlock]:
+        html = self.read_text(href) or ''
+        page = StaticLocator.from_html(html)
+        lesson = page.locator('[data-lesson-id]').first
+        if lesson.count():
+            return parse_lesson_content(lesson)
+
+        body = page.locator('body').first
+        content = body.inner_html() if body.count() else html
+        return [TextBlock(block_id=None, locator=StaticLocator.from_html(f'<div>{content}</div>'))]
+
+    def to_course(self) -> CourseScheme:
+        """Build the course from Rise's packaged course data, or from each SCO's HTML."""
+        title, items = self.read_manifest()
+        hrefs = [i.href for i in items if i.href] + [c.href for i in items for c in i.children if c.href]
+        logger.info('Found %s SCOs in %s', len(hrefs), self.path.name)
+
+        payload = self._read_course_data(hrefs + [RISE_CONTENT_FILENAME])
+        if isinstance(payload, dict):
+            course = parse_course_data(
+                payload, base_url=self.url_for(RISE_CONTENT_FILENAME), keep_unmapped=True
+            )
+            if course.pending:
+                logger.warning(
+                    '%s lessons have no packaged block content: %s',
+                    len(course.pending),
+                    ', '.join(lesson.title for lesson in course.pending),
+                )
+            return CourseScheme(title=course.title, sections=course.sections)
+
+        # Plain SCORM: top-level items with children are sections, each launchable item a lesson.
+        sections: list[CourseSchemeSection] = []
+        loose: CourseSchemeSection | None = None
+        for item in items:
+            if item.children:
+                loose = None
+                sections.append(CourseSchemeSection(title=item.title or 'Lessons', lessons=[]))
+                for child in item.children:
+                    self._add_lesson(sections[-1], child)
+                continue
+            if loose is None:
+                loose = CourseSchemeSection(title='Lessons', lessons=[])
+                sections.append(loose)
+            self._add_lesson(loose, item)
+
+        for index, lesson in enumerate(lesson for section in sections for lesson in section.lessons):
+            lesson.index = index
+        return CourseScheme(title=title, sections=[s for s in sections if s.lessons])
+
+    def _add_lesson(self, section: CourseSchemeSection, item: ManifestItem) -> None:
+        if not item.href:
+            return
+        lesson = CourseSchemeLesson(index=0, title=item.title or item.href, href=item.href)
+        lesson.blocks = self._sco_blocks(item.href)
+        section.lessons.append(lesson)
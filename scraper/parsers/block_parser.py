@@ -21,31 +21,68 @@ from scraper.parsers.blocks import (
     UnknownBlock,
     VideoBlock,
 )
+from scraper.parsers.static import SNAPSHOT_JS, StaticLocator
+
+# Order matters
+BLOCK_CLASSES: tuple[type[LessonBlock], ...] = (
+    EndOfLessonBlock,
+    CodeBlock,
+    TitleBlock,
+    AccordionBlock,
+    ButtonStackBlock,
+    ButtonBlock,
+    LabeledImageBlock,
+    GalleryCarouselBlock,
+    ImageBlock,
+    FlashcardsBlock,
+    NumberedListBlock,
+    SlideshowBlock,
+    TabsBlock,
+    VideoBlock,
+    TextBlock,
+)
+
+# With `withHtml`, each wrapper's snapshot HTML comes back in the same call.
+CLASSIFY_WRAPPERS_JS = r"""
+    (wrappers, [selectors, withHtml]) => {
+        const snapshot = %(snapshot)s;
+        return wrappers.map((el) => [
+            el.getAttribute('data-block-id'),
+            selectors.findIndex((selector) => !!selector && el.querySelector(selector) !== null),
+            withHtml ? snapshot(el) : null,
+        ]);
+    }
+""" % {'snapshot': SNAPSHOT_JS.strip()}
 
 
 class BlockParser:
-    def __init__(self, wrapper: Locator) -> None:
+    def __init__(
+        self,
+        wrapper: Locator | StaticLocator,
+        block_cls: type[LessonBlock] | None = None,
+    ) -> None:
         self.wrapper = wrapper
+        self.block_cls = block_cls
 
-    def _identify_block(self) -> type[LessonBlock]:
-        # Order matters
-        for block_cls in (
-            EndOfLessonBlock,
-            CodeBlock,
-            TitleBlock,
-            AccordionBlock,
-            ButtonStackBlock,
-            ButtonBlock,
-            LabeledImageBlock,
-            GalleryCarouselBlock,
-            ImageBlock,
-            FlashcardsBlock,
-            NumberedListBlock,
-            SlideshowBlock,
-            TabsBlock,
-            VideoBlock,
-            TextBlock,
+    @staticmethod
+    def classify_wrappers(
+        wrappers: Locator, *, with_html: bool = False
+    ) -> list[tuple[str | None, type[LessonBlock], str | None]]:
+        """Resolve the block id, class and (`with_html`) snapshot HTML of every wrapper in one call."""
+        selectors = [getattr(block_cls, 'query_selector', '') or '' for block_cls in BLOCK_CLASSES]
+        classified: list[tuple[str | None, type[LessonBlock], str | None]] = []
+        for block_id, class_index, html in wrappers.evaluate_all(
+            CLASSIFY_WRAPPERS_JS, [selectors, with_html]
         ):
+            block_cls = BLOCK_CLASSES[class_index] if class_index >= 0 else UnknownBlock
+            classified.append((block_id, block_cls, html))
+        return classified
+
+    def _identify_block(self) -> type[LessonBlock]:
+        if self.block_cls is not None:
+            return self.block_cls
+
+        for block_cls in BLOCK_CLASSES:
             selector = getattr(block_cls, 'query_selector', '') or ''
             if selector and self.wrapper.locator(selector).count():
                 return block_cls
@@ -5,32 +5,28 @@ from dataclasses import dataclass, field
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import html_to_flowables
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Items
 
 
 @dataclass
 class AccordionBlock(LessonBlock):
     query_selector = '.blocks-accordion'
 
+    schema = BlockSchema(
+        items=Items(
+            '.blocks-accordion__item',
+            {
+                'title': Field('.blocks-accordion__title .fr-view', normalize='collapse'),
+                'body': Field('.blocks-accordion__description .fr-view', read='html'),
+            },
+            required=('title',),
+        ),
+    )
+
     items: list[tuple[str, str]] = field(default_factory=list)  # (title, body_html)
 
     def _scrape(self) -> None:
-        items: list[tuple[str, str]] = []
-
-        accordion_items = self.locator.locator('.blocks-accordion__item')
-        for i in range(accordion_items.count()):
-            item = accordion_items.nth(i)
-
-            title_fr = item.locator('.blocks-accordion__title .fr-view').first
-            title = (title_fr.text_content() or '').strip() if title_fr.count() else ''
-            title = ' '.join(title.split())
-            if not title:
-                continue
-
-            desc_fr = item.locator('.blocks-accordion__description .fr-view').first
-            desc_html = desc_fr.inner_html() if desc_fr.count() else ''
-            items.append((title, (desc_html or '').strip()))
-
-        self.items = items
+        self.items = [(item['title'], item['body']) for item in self._extract()['items']]
 
     def _render_md(self, builder, assets_dir=None) -> str:
         if not self.items:
@@ -11,24 +11,37 @@ from scraper.config import OutputFormat
 from scraper.formats.base import CourseBuilder
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import PDFBuilder
+from scraper.parsers.schema import BlockSchema
+from scraper.parsers.static import StaticLocator
 
 
 @dataclass
 class LessonBlock(ABC):
     query_selector: ClassVar[str] = ''
     skip: ClassVar[bool] = False
+    schema: ClassVar[BlockSchema | None] = None  # Fields read in one call by `_extract()`.
 
     block_id: str | None
-    locator: Locator
+    locator: Locator | StaticLocator
 
     def __post_init__(self) -> None:
+        # Wrapper HTML of a block on a live locator, read by `parse_lesson_content` while its lesson is open.
+        self.html_snapshot: str | None = None
         self._scrape()
 
     @abstractmethod
     def _scrape(self) -> None:
-        """Extract and store structured data from the live locator."""
+        """Extract and store structured data from the locator (live or snapshot)."""
         raise NotImplementedError
 
+    def _extract(self) -> dict[str, Any]:
+        """Read every field of `schema` from the locator in a single call."""
+        return self.schema.extract(self.locator)
+
+    def asset_files(self) -> list[tuple[str, str]]:
+        """Return the (asset_filename, url) pairs this block downloads when rendered."""
+        return []
+
     @abstractmethod
     def _render_md(self, builder: MarkdownBuilder, assets_dir: Path | None = None) -> str:
         """Render this block as Markdown."""
@@ -5,30 +5,29 @@ from dataclasses import dataclass
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import html_to_flowables
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field
 
 
 @dataclass
 class ButtonBlock(LessonBlock):
     query_selector = '.blocks-button'
 
+    schema = BlockSchema(
+        description_html=Field('.blocks-button__description .fr-view', read='html'),
+        description_text=Field('.blocks-button__description .fr-view'),
+        href=Field('a.blocks-button__button[href]', read='attr', attribute='href'),
+        text=Field(),
+    )
+
     href: str | None = None
     description_html: str = ''
     description_text: str = ''
 
     def _scrape(self) -> None:
-        desc_fr = self.locator.locator('.blocks-button__description .fr-view').first
-        self.description_html = desc_fr.inner_html() if desc_fr.count() else ''
-        self.description_text = (desc_fr.text_content() or '').strip() if desc_fr.count() else ''
-
-        button = self.locator.locator('a.blocks-button__button[href]').first
-        self.href = (button.get_attribute('href') or '').strip() if button.count() else None
-        if not self.href:
-            self.href = None
-
-        self.description_html = (self.description_html or '').strip()
-        self.description_text = (self.description_text or '').strip() or (
-            self.locator.text_content() or ''
-        ).strip()
+        data = self._extract()
+        self.href = data['href'] or None
+        self.description_html = data['description_html']
+        self.description_text = data['description_text'] or data['text']
 
     def _render_md(self, builder, assets_dir=None) -> str:
         desc_md = MarkdownBuilder.build_html(self.description_html)
@@ -5,35 +5,28 @@ from dataclasses import dataclass, field
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import html_to_flowables
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Items
 
 
 @dataclass
 class ButtonStackBlock(LessonBlock):
     query_selector = '.blocks-buttonstack'
 
+    schema = BlockSchema(
+        entries=Items(
+            f'{query_selector} .blocks-button__container',
+            {
+                'description': Field('.blocks-button__description .fr-view', read='html'),
+                'href': Field('a.blocks-button__button[href]', read='attr', attribute='href'),
+            },
+            required=('description', 'href'),
+        ),
+    )
+
     entries: list[tuple[str, str | None]] = field(default_factory=list)  # (desc_html, href)
 
     def _scrape(self) -> None:
-        containers = self.locator.locator(f'{self.query_selector} .blocks-button__container')
-
-        entries: list[tuple[str, str | None]] = []
-        for i in range(containers.count()):
-            container = containers.nth(i)
-
-            desc_fr = container.locator('.blocks-button__description .fr-view').first
-            desc_html = desc_fr.inner_html() if desc_fr.count() else ''
-
-            button = container.locator('a.blocks-button__button[href]').first
-            href = (button.get_attribute('href') or '').strip() if button.count() else None
-            if not href:
-                href = None
-
-            if not desc_html.strip() and not href:
-                continue
-
-            entries.append((desc_html.strip(), href))
-
-        self.entries = entries
+        self.entries = [(entry['description'], entry['href'] or None) for entry in self._extract()['entries']]
 
     def _render_md(self, builder, assets_dir=None) -> str:
         if not self.entries:
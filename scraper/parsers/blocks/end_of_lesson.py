@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from scraper.utils.text import read_text
+
 from .base import LessonBlock
 
 
@@ -13,7 +15,7 @@ class EndOfLessonBlock(LessonBlock):
     text: str = ''
 
     def _scrape(self) -> None:
-        self.text = (self.locator.inner_text() or '').strip()
+        self.text = read_text(self.locator).strip()
 
     def _render_md(self, builder, assets_dir=None) -> str:
         return self.text
@@ -5,32 +5,28 @@ from dataclasses import dataclass, field
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import html_to_flowables
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Items
 
 
 @dataclass
 class FlashcardsBlock(LessonBlock):
     query_selector = '.block-flashcards'
 
+    schema = BlockSchema(
+        cards=Items(
+            'li.flashcard',
+            {
+                'front': Field('.flashcard-side--front .fr-view', normalize='collapse'),
+                'back': Field('.flashcard-side--back .fr-view', read='html'),
+            },
+            required=('front',),
+        ),
+    )
+
     cards: list[tuple[str, str]] = field(default_factory=list)  # (front_title, back_html)
 
     def _scrape(self) -> None:
-        cards: list[tuple[str, str]] = []
-
-        flashcards = self.locator.locator('li.flashcard')
-        for i in range(flashcards.count()):
-            li = flashcards.nth(i)
-
-            front_fr = li.locator('.flashcard-side--front .fr-view').first
-            front_text = (front_fr.text_content() or '').strip() if front_fr.count() else ''
-            front_text = ' '.join(front_text.split())
-            if not front_text:
-                continue
-
-            back_fr = li.locator('.flashcard-side--back .fr-view').first
-            back_html = back_fr.inner_html() if back_fr.count() else ''
-            cards.append((front_text, (back_html or '').strip()))
-
-        self.cards = cards
+        self.cards = [(card['front'], card['back']) for card in self._extract()['cards']]
 
     def _render_md(self, builder, assets_dir=None) -> str:
         if not self.cards:
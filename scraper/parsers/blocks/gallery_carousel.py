@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Items
 from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_filename
 
 
@@ -11,25 +12,22 @@ from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_file
 class GalleryCarouselBlock(LessonBlock):
     query_selector = '.block-gallery-carousel'
 
+    schema = BlockSchema(
+        images=Items(
+            f'{query_selector} img', {'alt': Field(read='attr', attribute='alt'), 'src': Field(read='src')}
+        ),
+    )
+
     images: list[tuple[str, str, str]] = field(default_factory=list)
     # (asset_filename, alt, url)
 
     def _scrape(self) -> None:
-        imgs = self.locator.locator(f'{self.query_selector} img')
-
         images: list[tuple[str, str, str]] = []
         prefix = (self.block_id or 'block').strip()
 
-        for i in range(imgs.count()):
-            img = imgs.nth(i)
-            alt = (img.get_attribute('alt') or '').strip()
-
-            try:
-                url = img.evaluate('el => el.currentSrc || el.src')
-            except Exception:
-                url = img.get_attribute('src')
-            url = (url or '').strip()
-
+        for i, img in enumerate(self._extract()['images']):
+            alt = img['alt']
+            url = img['src']
             if not url:
                 continue
 
@@ -39,6 +37,9 @@ class GalleryCarouselBlock(LessonBlock):
 
         self.images = images
 
+    def asset_files(self) -> list[tuple[str, str]]:
+        return [(filename, url) for filename, _alt, url in self.images]
+
     def _render_md(self, builder, assets_dir=None) -> str:
         if not self.images:
             return (self.locator.text_content() or '').strip()
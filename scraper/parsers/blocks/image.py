@@ -5,6 +5,7 @@ from pathlib import Path
 
 from scraper.formats.md import MarkdownBuilder
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Group
 from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_filename
 
 
@@ -12,18 +13,21 @@ from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_file
 class ImageBlock(LessonBlock):
     query_selector = '.block-image'
 
+    schema = BlockSchema(
+        image=Group(
+            f'{query_selector} img', {'alt': Field(read='attr', attribute='alt'), 'src': Field(read='src')}
+        ),
+    )
+
     image_url: str | None = None
     image_alt: str = ''
     asset_filename: str | None = None
 
     def _scrape(self) -> None:
-        img = self.locator.locator(f'{self.query_selector} img').first
-        if img.count():
-            self.image_alt = (img.get_attribute('alt') or '').strip()
-            try:
-                self.image_url = img.evaluate('el => el.currentSrc || el.src')
-            except Exception:
-                self.image_url = img.get_attribute('src')
+        img = self._extract()['image']
+        if img:
+            self.image_alt = img['alt']
+            self.image_url = img['src']
 
             basename = safe_basename_from_url(self.image_url) or 'image'
             prefix = (self.block_id or 'block').strip()
@@ -33,6 +37,11 @@ class ImageBlock(LessonBlock):
         self.asset_filename = (self.asset_filename or '').strip() or None
         self.image_alt = (self.image_alt or '').strip()
 
+    def asset_files(self) -> list[tuple[str, str]]:
+        if self.image_url and self.asset_filename:
+            return [(self.asset_filename, self.image_url)]
+        return []
+
     def _render_md(self, builder, assets_dir=None) -> str:
         if self.image_url and self.asset_filename and assets_dir:
             ensure_asset(
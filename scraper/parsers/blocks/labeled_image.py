@@ -6,6 +6,7 @@ from pathlib import Path
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import html_to_flowables
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Group, Items
 from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_filename
 
 
@@ -13,44 +14,48 @@ from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_file
 class LabeledImageBlock(LessonBlock):
     query_selector = '.block-labeled-graphic'
 
+    schema = BlockSchema(
+        image=Group(
+            'img.labeled-graphic-canvas__image',
+            {'alt': Field(read='attr', attribute='alt'), 'src': Field(read='src')},
+        ),
+        items=Items(
+            'li.map-item',
+            {
+                'title': Field('h2.bubble__title'),
+                'description': Field('.bubble__description .fr-view', read='html'),
+            },
+            required=('title',),
+        ),
+    )
+
     image_url: str | None = None
     image_alt: str = ''
     asset_filename: str | None = None
     items: list[tuple[str, str]] = field(default_factory=list)  # (title, desc_html)
 
     def _scrape(self) -> None:
-        img = self.locator.locator('img.labeled-graphic-canvas__image').first
-        if img.count():
-            self.image_alt = (img.get_attribute('alt') or '').strip()
-            try:
-                self.image_url = img.evaluate('el => el.currentSrc || el.src')
-            except Exception:
-                self.image_url = img.get_attribute('src')
+        data = self._extract()
+        img = data['image']
+        if img:
+            self.image_alt = img['alt']
+            self.image_url = img['src']
 
             basename = safe_basename_from_url(self.image_url) or 'image'
             prefix = (self.block_id or 'block').strip()
             self.asset_filename = safe_filename(f'{prefix}-{basename}')
 
-        items: list[tuple[str, str]] = []
-        map_items = self.locator.locator('li.map-item')
-        for i in range(map_items.count()):
-            li = map_items.nth(i)
-            title_el = li.locator('h2.bubble__title').first
-
-            title = (title_el.text_content() or '').strip() if title_el.count() else ''
-            if not title:
-                continue
-
-            desc_fr = li.locator('.bubble__description .fr-view').first
-            desc_html = desc_fr.inner_html() if desc_fr.count() else ''
-            items.append((title, (desc_html or '').strip()))
-
-        self.items = items
+        self.items = [(item['title'], item['description']) for item in data['items']]
 
         self.image_url = (self.image_url or '').strip() or None
         self.asset_filename = (self.asset_filename or '').strip() or None
         self.image_alt = (self.image_alt or '').strip()
 
+    def asset_files(self) -> list[tuple[str, str]]:
+        if self.image_url and self.asset_filename:
+            return [(self.asset_filename, self.image_url)]
+        return []
+
     def _render_md(self, builder, assets_dir=None) -> str:
         if assets_dir and self.image_url and self.asset_filename:
             ensure_asset(
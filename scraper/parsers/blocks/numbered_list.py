@@ -5,34 +5,33 @@ from dataclasses import dataclass, field
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import html_to_flowables
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Items
 
 
 @dataclass
 class NumberedListBlock(LessonBlock):
     query_selector = '.block-list.block-list--numbered'
 
+    schema = BlockSchema(
+        items=Items(
+            (
+                'ol.block-list__list > li.block-list__item--numbered',
+                '.block-list--numbered li.block-list__item--numbered',
+            ),
+            {
+                'num': Field('.block-list__number'),
+                'html': Field('.block-list__content .fr-view', read='html'),
+            },
+        ),
+    )
+
     items: list[tuple[str, str]] = field(default_factory=list)  # (num, item_html)
 
     def _scrape(self) -> None:
-        items: list[tuple[str, str]] = []
-
-        lis = self.locator.locator('ol.block-list__list > li.block-list__item--numbered')
-        if not lis.count():
-            lis = self.locator.locator('.block-list--numbered li.block-list__item--numbered')
-
-        for i in range(lis.count()):
-            li = lis.nth(i)
-
-            num_el = li.locator('.block-list__number').first
-            num = (num_el.text_content() or '').strip() if num_el.count() else ''
-            if not num.isdigit():
-                num = str(i + 1)
-
-            fr = li.locator('.block-list__content .fr-view').first
-            html = fr.inner_html() if fr.count() else ''
-            items.append((num, (html or '').strip()))
-
-        self.items = items
+        self.items = [
+            (item['num'] if item['num'].isdigit() else str(i + 1), item['html'])
+            for i, item in enumerate(self._extract()['items'])
+        ]
 
     def _render_md(self, builder, assets_dir=None) -> str:
         if not self.items:
@@ -6,6 +6,7 @@ from pathlib import Path
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import html_to_flowables
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Group, Items
 from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_filename
 
 
@@ -13,6 +14,29 @@ from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_file
 class SlideshowBlock(LessonBlock):
     query_selector = '.block-process'
 
+    schema = BlockSchema(
+        intro=Group(
+            '.process-card--intro',
+            {
+                'title': Field('.process-card__title .fr-view', normalize='collapse'),
+                'body_html': Field('.process-card__description .fr-view', read='html'),
+                'body_text': Field('.process-card__description .fr-view'),
+            },
+        ),
+        steps=Items(
+            '.process-card[data-slide]:not(.process-card--intro)',
+            {
+                'num': Field('.process-card__number p'),
+                'body_html': Field('.process-card__description .fr-view', read='html'),
+                'body_text': Field('.process-card__description .fr-view'),
+                'image': Group(
+                    '.process-card__media img',
+                    {'alt': Field(read='attr', attribute='alt'), 'src': Field(read='src')},
+                ),
+            },
+        ),
+    )
+
     intro_title: str = ''
     intro_body_html: str = ''
     intro_body_text: str = ''
@@ -23,68 +47,40 @@ class SlideshowBlock(LessonBlock):
     image_url_by_filename: dict[str, str] = field(default_factory=dict)  # filename -> url
 
     def _scrape(self) -> None:
-        def _compact(text: str) -> str:
-            return (' '.join((text or '').split())).strip()
-
-        def _safe_text_content(el) -> str:
-            try:
-                if not el.count():
-                    return ''
-                return (el.text_content(timeout=1000) or '').strip()
-            except Exception:
-                return ''
-
-        intro = self.locator.locator('.process-card--intro').first
-        if intro.count():
-            title_el = intro.locator('.process-card__title .fr-view').first
-            self.intro_title = _compact(_safe_text_content(title_el))
-
-            desc_fr = intro.locator('.process-card__description .fr-view').first
-            self.intro_body_html = (desc_fr.inner_html() if desc_fr.count() else '') or ''
-            self.intro_body_text = _safe_text_content(desc_fr) if desc_fr.count() else ''
+        data = self._extract()
+
+        intro = data['intro']
+        if intro:
+            self.intro_title = intro['title']
+            self.intro_body_html = intro['body_html']
+            self.intro_body_text = intro['body_text']
 
         steps: list[tuple[str, str, str, str | None, str]] = []
         image_url_by_filename: dict[str, str] = {}
 
-        cards = self.locator.locator('.process-card[data-slide]')
-
-        for i in range(cards.count()):
-            card = cards.nth(i)
-            if 'process-card--intro' in (card.get_attribute('class') or ''):
-                continue
-
-            num_el = card.locator('.process-card__number p').first
-            step_num = _safe_text_content(num_el) if num_el.count() else ''
-            step_num = ''.join(ch for ch in step_num if ch.isdigit()) or str(len(steps) + 1)
-
-            # Description
-            desc_fr = card.locator('.process-card__description .fr-view').first
-            body_html = (desc_fr.inner_html() if desc_fr.count() else '') or ''
-            body_text = _safe_text_content(desc_fr) if desc_fr.count() else ''
+        for card in data['steps']:
+            step_num = ''.join(ch for ch in card['num'] if ch.isdigit()) or str(len(steps) + 1)
 
             # Image (optional)
-            img = card.locator('.process-card__media img').first
+            img = card['image']
             asset_filename: str | None = None
             alt = ''
-            if img.count():
-                alt = (img.get_attribute('alt') or '').strip() or 'image'
-                try:
-                    url = img.evaluate('el => el.currentSrc || el.src')
-                except Exception:
-                    url = img.get_attribute('src')
-
+            if img:
+                alt = img['alt'] or 'image'
+                url = img['src']
                 if url:
                     basename = safe_basename_from_url(url) or 'image'
                     prefix = (self.block_id or 'block').strip()
                     asset_filename = safe_filename(f'{prefix}-step{step_num}-{basename}')
                     image_url_by_filename[asset_filename] = url
 
-            steps.append((step_num, body_html.strip(), body_text.strip(), asset_filename, alt))
+            steps.append((step_num, card['body_html'], card['body_text'], asset_filename, alt))
 
         self.steps = steps
         self.image_url_by_filename = image_url_by_filename
-        self.intro_body_html = (self.intro_body_html or '').strip()
-        self.intro_body_text = (self.intro_body_text or '').strip()
+
+    def asset_files(self) -> list[tuple[str, str]]:
+        return list(self.image_url_by_filename.items())
 
     def _render_md(self, builder, assets_dir=None) -> str:
         if assets_dir and self.image_url_by_filename:
@@ -6,6 +6,7 @@ from pathlib import Path
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import html_to_flowables
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Items
 from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_filename
 
 
@@ -13,6 +14,23 @@ from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_file
 class TabsBlock(LessonBlock):
     query_selector = '.blocks-tabs'
 
+    schema = BlockSchema(
+        headers=Items(
+            f'{query_selector} .blocks-tabs__header-item',
+            {'title': Field('.fr-view', normalize='collapse', fallback=Field(normalize='collapse'))},
+        ),
+        contents=Items(
+            f'{query_selector} .blocks-tabs__content-item',
+            {
+                'body_html': Field('.blocks-tabs__description .fr-view', read='html'),
+                'body_text': Field('.blocks-tabs__description .fr-view'),
+                'images': Items(
+                    'img', {'alt': Field(read='attr', attribute='alt'), 'src': Field(read='src')}
+                ),
+            },
+        ),
+    )
+
     tabs: list[tuple[str, str, str]] = field(default_factory=list)
     # (title, body_html, body_text)
 
@@ -23,43 +41,20 @@ class TabsBlock(LessonBlock):
     # tab_index -> [(asset_filename, alt)]
 
     def _scrape(self) -> None:
-        headers = self.locator.locator(f'{self.query_selector} .blocks-tabs__header-item')
-        contents = self.locator.locator(f'{self.query_selector} .blocks-tabs__content-item')
+        data = self._extract()
 
-        tab_count = min(headers.count(), contents.count())
         tabs: list[tuple[str, str, str]] = []
         images: dict[str, str] = {}
         images_by_tab_index: dict[int, list[tuple[str, str]]] = {}
 
         prefix = (self.block_id or 'block').strip()
 
-        for i in range(tab_count):
-            header = headers.nth(i)
-            content = contents.nth(i)
-
-            title_el = header.locator('.fr-view').first
-            title = (
-                (title_el.text_content() or '').strip()
-                if title_el.count()
-                else (header.text_content() or '').strip()
-            )
-            title = ' '.join(title.split())
-
-            desc_fr = content.locator('.blocks-tabs__description .fr-view').first
-            body_html = (desc_fr.inner_html() if desc_fr.count() else '') or ''
-            body_text = (desc_fr.text_content() or '').strip() if desc_fr.count() else ''
-
-            tabs.append((title, body_html.strip(), body_text.strip()))
-
-            imgs = content.locator('img')
-            for j in range(imgs.count()):
-                img = imgs.nth(j)
-                alt = (img.get_attribute('alt') or '').strip() or 'image'
-                try:
-                    url = img.evaluate('el => el.currentSrc || el.src')
-                except Exception:
-                    url = img.get_attribute('src')
-                url = (url or '').strip()
+        for i, (header, content) in enumerate(zip(data['headers'], data['contents'])):
+            tabs.append((header['title'], content['body_html'], content['body_text']))
+
+            for j, img in enumerate(content['images']):
+                alt = img['alt'] or 'image'
+                url = img['src']
                 if not url:
                     continue
 
@@ -72,6 +67,9 @@ class TabsBlock(LessonBlock):
         self.images = images
         self.images_by_tab_index = images_by_tab_index
 
+    def asset_files(self) -> list[tuple[str, str]]:
+        return list(self.images.items())
+
     def _render_md(self, builder, assets_dir=None) -> str:
         if not self.tabs:
             return (self.locator.text_content() or '').strip()
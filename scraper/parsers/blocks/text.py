@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from scraper.config import get_config
 from scraper.formats.md import MarkdownBuilder
 from scraper.formats.pdf import html_to_flowables
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.utils.text import html_to_text
 
 
 @dataclass
@@ -16,12 +18,12 @@ class TextBlock(LessonBlock):
 
     def _scrape(self) -> None:
         fr = self.locator.locator('.block-text .fr-view').first
-        if fr.count():
-            self.html = fr.inner_html() or ''
-            self.text = fr.inner_text() or ''
+        target = fr if fr.count() else self.locator
+        self.html = target.inner_html() or ''
+        if get_config().layout_free_text:
+            self.text = html_to_text(self.html)
         else:
-            self.html = self.locator.inner_html() or ''
-            self.text = self.locator.inner_text() or ''
+            self.text = target.inner_text() or ''
 
         self.html = (self.html or '').strip()
         self.text = (self.text or '').strip()
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from scraper.formats.md import MarkdownBuilder
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.utils.text import read_text
 
 
 @dataclass
@@ -20,7 +21,7 @@ class TitleBlock(LessonBlock):
             if heading.locator(f'h{i}').count():
                 level = i
                 break
-        text = heading.inner_text() if heading.count() else self.locator.inner_text()
+        text = read_text(heading if heading.count() else self.locator)
         self.title = (text or '').strip()
         self.level = level
 
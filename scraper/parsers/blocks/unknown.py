@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.utils.text import read_text
 
 
 @dataclass()
@@ -12,7 +13,7 @@ class UnknownBlock(LessonBlock):
     text: str = ''
 
     def _scrape(self) -> None:
-        self.text = (self.locator.inner_text() or '').strip()
+        self.text = read_text(self.locator).strip()
 
     def _render_md(self, builder, assets_dir=None) -> str:
         return self.text
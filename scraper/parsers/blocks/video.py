@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from scraper.config import get_config
 from scraper.parsers.blocks.base import LessonBlock
+from scraper.parsers.schema import BlockSchema, Field, Group
 from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_filename
 
 
@@ -11,6 +12,15 @@ from scraper.utils.assets import ensure_asset, safe_basename_from_url, safe_file
 class VideoBlock(LessonBlock):
     query_selector = '.block-video'
 
+    schema = BlockSchema(
+        video=Group(
+            f'{query_selector} video',
+            {'src': Field(read='src'), 'poster': Field(read='attr', attribute='poster')},
+        ),
+        source_src=Field(f'{query_selector} video source', read='attr', attribute='src'),
+        image_src=Field(f'{query_selector} img', read='attr', attribute='src'),
+    )
+
     video_url: str | None = None
     video_asset_filename: str | None = None
 
@@ -18,32 +28,13 @@ class VideoBlock(LessonBlock):
     poster_asset_filename: str | None = None
 
     def _scrape(self) -> None:
+        data = self._extract()
+        video = data['video'] or {}
+
         # Try <video src>, then <source src>.
-        video = self.locator.locator(f'{self.query_selector} video').first
-        source = self.locator.locator(f'{self.query_selector} video source').first
-
-        url: str | None = None
-        if video.count():
-            try:
-                url = video.evaluate('el => el.currentSrc || el.src')
-            except Exception:
-                url = video.get_attribute('src')
-
-        if (not url) and source.count():
-            url = source.get_attribute('src')
-
-        url = (url or '').strip() or None
-        self.video_url = url
-
-        poster: str | None = None
-        if video.count():
-            poster = (video.get_attribute('poster') or '').strip() or None
-        if not poster:
-            # Some variants include <img> inside poster container.
-            img = self.locator.locator(f'{self.query_selector} img').first
-            if img.count():
-                poster = (img.get_attribute('src') or '').strip() or None
-        self.poster_url = poster
+        self.video_url = video.get('src') or data['source_src'] or None
+        # Some variants include <img> inside poster container.
+        self.poster_url = video.get('poster') or data['image_src'] or None
 
         prefix = (self.block_id or 'block').strip()
         if self.video_url:
@@ -53,6 +44,14 @@ class VideoBlock(LessonBlock):
             base = safe_basename_from_url(self.poster_url) or 'poster.jpg'
             self.poster_asset_filename = safe_filename(f'{prefix}-{base}')
 
+    def asset_files(self) -> list[tuple[str, str]]:
+        if not (get_config().download_videos and self.video_url and self.video_asset_filename):
+            return []
+        files = [(self.video_asset_filename, self.video_url)]
+        if self.poster_url and self.poster_asset_filename:
+            files.append((self.poster_asset_filename, self.poster_url))
+        return files
+
     def _render_video_unavailable(self) -> str:
         msg = 'Video is not available in this output.'
         if self.video_url:
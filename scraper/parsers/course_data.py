@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from html import escape
+from typing import Any
+from urllib.parse import urljoin
+
+from scraper.models.course_scheme import CourseSchemeLesson, CourseSchemeSection
+from scraper.parsers.block_parser import BlockParser
+from scraper.parsers.blocks import (
+    AccordionBlock,
+    ImageBlock,
+    LessonBlock,
+    NumberedListBlock,
+    TextBlock,
+    TitleBlock,
+    UnknownBlock,
+)
+from scraper.parsers.static import CURRENT_SRC_ATTRIBUTE, StaticLocator
+from scraper.utils.text import html_to_text
+
+# Rise blocks that carry nothing to render.
+_SKIPPED_FAMILIES = {'divider', 'continue'}
+# Fields holding a Rise block's authored HTML, in reading order.
+_CONTENT_KEYS = ('heading', 'title', 'paragraph', 'description', 'front', 'back', 'caption')
+
+
+class UnmappedBlock(Exception):
+    """A Rise block the course-data path cannot build; its lesson goes through the DOM."""
+
+
+@dataclass
+class CourseData:
+    title: str
+    sections: list[CourseSchemeSection]
+    pending: list[CourseSchemeLesson] = field(default_factory=list)  # Lessons left to the DOM path.
+
+
+def _items(block: dict) -> list[dict]:
+    return [item for item in block.get('items') or [] if isinstance(item, dict)]
+
+
+def _fr_view(html: str) -> str:
+    return f'<div class="fr-view">{html or ""}</div>'
+
+
+def _text_html(block: dict) -> list[tuple[type[LessonBlock], str]]:
+    variant = block.get('variant') or 'paragraph'
+    item = (_items(block) or [{}])[0]
+    parts: list[tuple[type[LessonBlock], str]] = []
+    if variant in ('heading', 'heading paragraph', 'subheading', 'subheading paragraph'):
+        tag = 'h3' if variant.startswith('subheading') else 'h2'
+        heading = f'<div class="block-text__heading"><{tag}>{item.get("heading") or ""}</{tag}></div>'
+        parts.append((TitleBlock, heading))
+    if variant in ('paragraph', 'heading paragraph', 'subheading paragraph'):
+        parts.append((TextBlock, f'<div class="block-text">{_fr_view(item.get("paragraph"))}</div>'))
+    if not parts:
+        raise UnmappedBlock(f'text/{variant}')
+    return parts
+
+
+def _numbered_list_html(block: dict) -> list[tuple[type[LessonBlock], str]]:
+    lis = ''.join(
+        '<li class="block-list__item--numbered">'
+        f'<div class="block-list__number">{i}</div>'
+        f'<div class="block-list__content">{_fr_view(item.get("paragraph"))}</div>'
+        '</li>'
+        for i, item in enumerate(_items(block), start=1)
+    )
+    html = f'<div class="block-list block-list--numbered"><ol class="block-list__list">{lis}</ol></div>'
+    return [(NumberedListBlock, html)]
+
+
+def _accordion_html(block: dict) -> list[tuple[type[LessonBlock], str]]:
+    items = ''.join(
+        '<div class="blocks-accordion__item">'
+        f'<div class="blocks-accordion__title">{_fr_view(item.get("title"))}</div>'
+        f'<div class="blocks-accordion__description">{_fr_view(item.get("description"))}</div>'
+        '</div>'
+        for item in _items(block)
+    )
+    return [(AccordionBlock, f'<div class="blocks-accordion">{items}</div>')]
+
+
+def _image_html(block: dict, base_url: str) -> list[tuple[type[LessonBlock], str]]:
+    item = (_items(block) or [{}])[0]
+    image = ((item.get('media') or {}).get('image')) or {}
+    key = image.get('src') or image.get('url') or (image.get('key') and f'assets/{image["key"]}')
+    if block.get('variant') not in ('full', 'hero', 'centered') or not key:
+        raise UnmappedBlock(f'image/{block.get("variant")}')
+    src = escape(urljoin(base_url, key))
+    alt = escape(image.get('altText') or '')
+    img = f'<img src="{src}" {CURRENT_SRC_ATTRIBUTE}="{src}" alt="{alt}">'
+    return [(ImageBlock, f'<div class="block-image">{img}</div>')]
+
+
+def _content_html(value: Any) -> str:
+    """Concatenate every authored HTML field found in a Rise block, at any depth."""
+    if isinstance(value, list):
+        return ''.join(_content_html(v) for v in value)
+    if not isinstance(value, dict):
+        return ''
+    own = ''.join(f'<div>{value[key]}</div>' for key in _CONTENT_KEYS if isinstance(value.get(key), str))
+    nested = ''.join(_content_html(v) for v in value.values() if isinstance(v, (dict, list)))
+    return own + nested
+
+
+def _block_html(block: dict, base_url: str) -> list[tuple[type[LessonBlock], str]]:
+    family = block.get('family') or block.get('type')
+    variant = block.get('variant')
+    if family in _SKIPPED_FAMILIES:
+        return []
+    if family == 'text':
+        return _text_html(block)
+    if family == 'list' and variant == 'numbered':
+        return _numbered_list_html(block)
+    if family == 'interactive' and variant == 'accordion':
+        return _accordion_html(block)
+    if family == 'image':
+        return _image_html(block, base_url)
+    raise UnmappedBlock(f'{family}/{variant}')
+
+
+def parse_lesson_blocks(
+    lesson: dict, *, base_url: str, page: Any = None, keep_unmapped: bool = False
+) -> list[LessonBlock]:
+    """Build typed blocks for one Rise lesson, or raise `UnmappedBlock`.
+
+    Each Rise block is written out as the minimal DOM its block class reads, so the same
+    `_scrape` code runs here as on a live lesson. With `keep_unmapped`, a block with no
+    mapping becomes an `UnknownBlock` holding its text instead.
+    """
+    blocks: list[LessonBlock] = []
+    for raw in lesson.get('items') or []:
+        block_id = raw.get('id')
+        try:
+            parts = _block_html(raw, base_url)
+        except UnmappedBlock:
+            if not keep_unmapped:
+                raise
+            parts = [(UnknownBlock, _content_html(raw.get('items')))]
+        for block_cls, html in parts:
+            wrapper = f'<div class="noOutline" data-block-id="{escape(block_id or "")}">{html}</div>'
+            locator = StaticLocator.from_html(wrapper, page=page)
+            blocks.append(BlockParser(locator, block_cls=block_cls).parse_block(block_id=block_id))
+    return blocks
+
+
+def parse_course_data(
+    payload: dict, *, base_url: str, page: Any = None, keep_unmapped: bool = False
+) -> CourseData:
+    """Build the course scheme and lesson blocks from Rise's embedded course payload.
+
+    Lessons that are not block lessons, or that hold a block type with no mapping (unless
+    `keep_unmapped`), keep an empty block list and are returned in `pending` for the DOM path.
+    """
+    course = payload.get('course', payload)
+    title = html_to_text(course.get('title') or '') or 'Course'
+
+    sections: list[CourseSchemeSection] = []
+    pending: list[CourseSchemeLesson] = []
+    current: CourseSchemeSection | None = None
+    global_lesson_index = 0
+
+    for lesson in course.get('lessons') or []:
+        lesson_title = html_to_text(lesson.get('title') or '')
+        if lesson.get('type') == 'section':
+            current = CourseSchemeSection(title=(lesson_title or 'Lessons').title().strip(), lessons=[])
+            sections.append(current)
+            continue
+        if not lesson_title:
+            continue
+
+        if current is None:
+            current = CourseSchemeSection(title='Lessons', lessons=[])
+            sections.append(current)
+
+        lesson_id = lesson.get('id')
+        lesson_ref = CourseSchemeLesson(
+            index=global_lesson_index,
+            title=lesson_title,
+            href=f'#/lessons/{lesson_id}' if lesson_id else None,
+            lesson_id=lesson_id,
+        )
+        global_lesson_index += 1
+        current.lessons.append(lesson_ref)
+
+        if lesson.get('type', 'blocks') != 'blocks':
+            pending.append(lesson_ref)
+            continue
+        try:
+            lesson_ref.blocks = parse_lesson_blocks(
+                lesson, base_url=base_url, page=page, keep_unmapped=keep_unmapped
+            )
+        except UnmappedBlock:
+            pending.append(lesson_ref)
+
+    return CourseData(
+        title=title,
+        sections=[section for section in sections if section.lessons],
+        pending=pending,
+    )
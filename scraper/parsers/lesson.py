@@ -1,21 +1,37 @@
+from __future__ import annotations
+
 from playwright.sync_api import Locator
 
 from scraper.parsers.block_parser import BlockParser
 from scraper.parsers.blocks import LessonBlock
+from scraper.parsers.static import StaticLocator
+
 
+def parse_lesson_content(lesson_el: Locator | StaticLocator, *, keep_html: bool = False) -> list[LessonBlock]:
+    """Parse the lesson's blocks; with `keep_html`, live blocks also keep their wrapper HTML.
 
-def parse_lesson_content(lesson_el: Locator) -> list[LessonBlock]:
+    That HTML is read in the call that classifies the wrappers, for the snapshot and the
+    checkpoints to serialize once the lesson is no longer open.
+    """
     blocks = lesson_el.locator('section.blocks-lesson > div.noOutline[data-block-id]')
     if not blocks.count():
         blocks = lesson_el.locator('section.blocks-lesson div.noOutline[data-block-id]')
 
+    if isinstance(blocks, StaticLocator):
+        # Offline lookups are free, so each wrapper is classified in Python.
+        classified = [
+            (blocks.nth(i).get_attribute('data-block-id'), None, None) for i in range(blocks.count())
+        ]
+    else:
+        classified = BlockParser.classify_wrappers(blocks, with_html=keep_html)
+
     parts: list[LessonBlock] = []
-    for i in range(blocks.count()):
+    for i, (block_id, block_cls, html) in enumerate(classified):
         wrapper = blocks.nth(i)
-        block_id = wrapper.get_attribute('data-block-id')
 
-        block_scraper = BlockParser(wrapper)
+        block_scraper = BlockParser(wrapper, block_cls=block_cls)
         block = block_scraper.parse_block(block_id=block_id)
+        block.html_snapshot = html
 
         parts.append(block)
 
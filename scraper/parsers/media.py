@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import re
+
+from bs4.element import Tag
+
+# Resolved URL of every media element, stamped on the snapshot clone.
+CURRENT_SRC_ATTRIBUTE = 'data-scraper-src'
+
+MEDIA_SELECTOR = 'img, video, source'
+
+# Attributes lazy-loading libraries keep the real URL in until the element scrolls into view.
+LAZY_SRC_ATTRIBUTES = ('data-src', 'data-lazy-src', 'data-original', 'data-url')
+LAZY_SRCSET_ATTRIBUTES = ('data-srcset', 'data-lazy-srcset')
+
+_PLACEHOLDER_RE = re.compile(r'^about:|/(?:blank|spacer|placeholder|transparent|pixel)\.\w+$', re.I)
+# Groups: media type, `;base64`, payload. Only empty payloads and single-pixel GIF/PNG
+# placeholders are skipped; any other inline image is real content.
+_DATA_URI_RE = re.compile(r'^data:([^,]*?)(;base64)?,(.*)$', re.I | re.S)
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# `(el) => url`: the URL a media element shows, or will show once loaded. A loaded, real
+# `currentSrc` wins (it is also the body the page already fetched); otherwise lazy-load
+# attributes, then the largest `srcset` candidate, then `src`, then a <picture>/<video>'s
+# first <source>. Placeholders (blank data: URIs, 1x1 pixels, spacer images) are skipped.
+# Mirrors `media_url`.
+MEDIA_URL_JS = r"""
+    (el) => {
+        const placeholder = /%(placeholder)s/i;
+        const dataUri = /%(data_uri)s/is;
+        const pixel = (head) => {
+            const byte = (i) => head.charCodeAt(i);
+            if (head.startsWith('GIF8') && head.length >= 10) {
+                return byte(6) + 256 * byte(7) <= 1 && byte(8) + 256 * byte(9) <= 1;
+            }
+            if (head.startsWith('\x89PNG') && head.length >= 24) {
+                const size = (i) => ((byte(i) * 256 + byte(i + 1)) * 256 + byte(i + 2)) * 256 + byte(i + 3);
+                return size(16) <= 1 && size(20) <= 1;
+            }
+            return false;
+        };
+        const isPlaceholder = (url) => {
+            const data = dataUri.exec(url);
+            if (!data) return /^data:/i.test(url) || placeholder.test(url);
+            const payload = data[3].trim();
+            if (!payload) return true;
+            if (!data[2]) return false;
+            try { return pixel(atob(payload.slice(0, 32))); } catch (e) { return false; }
+        };
+        const real = (url) => (url && !isPlaceholder(url.trim()) ? url.trim() : '');
+        const absolute = (url) => {
+            try { return new URL(url, el.baseURI).href; } catch (e) { return url; }
+        };
+        const bestOfSrcset = (srcset) => {
+            let best = '', bestSize = -1;
+            for (const part of (srcset || '').split(/,\s+/)) {
+                const [url, descriptor] = part.trim().split(/\s+/);
+                const size = descriptor ? parseFloat(descriptor) || 0 : 1;
+                if (real(url) && size > bestSize) { best = url; bestSize = size; }
+            }
+            return best;
+        };
+        const own = (node) => {
+            for (const name of %(lazy_src)s) {
+                if (real(node.getAttribute(name))) return node.getAttribute(name).trim();
+            }
+            for (const name of [...%(lazy_srcset)s, 'srcset']) {
+                const url = bestOfSrcset(node.getAttribute(name));
+                if (url) return url;
+            }
+            return real(node.getAttribute('src'));
+        };
+        const current = real(el.currentSrc || '');
+        if (current) return current;
+        let url = own(el);
+        if (!url && el.parentElement && ['PICTURE', 'VIDEO', 'AUDIO'].includes(el.parentElement.tagName)) {
+            for (const source of el.parentElement.querySelectorAll(':scope > source')) {
+                if ((url = own(source))) break;
+            }
+        }
+        if (!url && el.tagName !== 'SOURCE') {
+            for (const source of el.querySelectorAll(':scope > source')) {
+                if ((url = own(source))) break;
+            }
+        }
+        return url ? absolute(url) : '';
+    }
+""" % {
+    'placeholder': _PLACEHOLDER_RE.pattern.replace('/', r'\/'),
+    'data_uri': _DATA_URI_RE.pattern,
+    'lazy_src': list(LAZY_SRC_ATTRIBUTES),
+    'lazy_srcset': list(LAZY_SRCSET_ATTRIBUTES),
+}
+
+
+def _is_pixel(head: bytes) -> bool:
+    """Whether `head`, the start of a GIF or PNG, is an image of at most one pixel."""
+    if head.startswith(b'GIF8') and len(head) >= 10:
+        return int.from_bytes(head[6:8], 'little') <= 1 and int.from_bytes(head[8:10], 'little') <= 1
+    if head.startswith(_PNG_SIGNATURE) and len(head) >= 24:
+        return int.from_bytes(head[16:20], 'big') <= 1 and int.from_bytes(head[20:24], 'big') <= 1
+    return False
+
+
+def _is_placeholder(url: str) -> bool:
+    data = _DATA_URI_RE.match(url)
+    if data is None:
+        return url[:5].lower() == 'data:' or bool(_PLACEHOLDER_RE.search(url))
+    _media_type, is_base64, payload = data.groups()
+    payload = payload.strip()
+    if not payload:
+        return True
+    if not is_base64:
+        return False
+    head = payload[:32]
+    try:
+        return _is_pixel(base64.b64decode(head + '=' * (-len(head) % 4)))
+    except (binascii.Error, ValueError):
+        return False
+
+
+def _real(url: str | None) -> str:
+    url = (url or '').strip()
+    return '' if not url or _is_placeholder(url) else url
+
+
+def _best_of_srcset(srcset: str | None) -> str:
+    best, best_size = '', -1.0
+    for part in re.split(r',\s+', srcset or ''):
+        pieces = part.split()
+        if not pieces or not _real(pieces[0]):
+            continue
+        try:
+            size = float(pieces[1][:-1]) if len(pieces) > 1 else 1.0
+        except ValueError:
+            size = 0.0
+        if size > best_size:
+            best, best_size = pieces[0], size
+    return best
+
+
+def _own_url(el: Tag) -> str:
+    for name in LAZY_SRC_ATTRIBUTES:
+        if _real(el.get(name)):
+            return el.get(name).strip()
+    for name in (*LAZY_SRCSET_ATTRIBUTES, 'srcset'):
+        url = _best_of_srcset(el.get(name))
+        if url:
+            return url
+    return _real(el.get('src'))
+
+
+def media_url(el: Tag) -> str:
+    """Offline twin of `MEDIA_URL_JS` for parsed HTML; the stamped URL stands in for `currentSrc`.
+
+    Relative URLs are returned as written, since there is no document to resolve them against.
+    """
+    url = _real(el.get(CURRENT_SRC_ATTRIBUTE)) or _own_url(el)
+    parent = el.parent
+    if not url and parent is not None and parent.name in ('picture', 'video', 'audio'):
+        url = next(filter(None, (_own_url(s) for s in parent.find_all('source', recursive=False))), '')
+    if not url and el.name != 'source':
+        url = next(filter(None, (_own_url(s) for s in el.find_all('source', recursive=False))), '')
+    return url
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Union
+
+from bs4.element import Tag
+
+from scraper.parsers.media import MEDIA_URL_JS, media_url
+from scraper.parsers.static import StaticLocator
+
+# Runs a compiled schema against a live element in one call. Mirrors `_extract_offline` below.
+EXTRACT_JS = r"""
+    (root, schema) => {
+        const mediaUrl = %s;
+        const normalize = (value, mode) => {
+            if (value == null) return '';
+            if (mode === 'raw') return value;
+            if (mode === 'collapse') return value.split(/\s+/).filter(Boolean).join(' ');
+            return value.trim();
+        };
+        const read = (el, spec) => {
+            const target = spec.selector ? el.querySelector(spec.selector) : el;
+            if (!target) return spec.fallback ? read(el, spec.fallback) : '';
+            let value;
+            if (spec.read === 'html') value = target.innerHTML;
+            else if (spec.read === 'attr') value = target.getAttribute(spec.attribute);
+            else if (spec.read === 'src') value = mediaUrl(target);
+            else value = target.textContent;
+            return normalize(value, spec.normalize);
+        };
+        const extract = (el, fields) => {
+            const out = {};
+            for (const [name, spec] of Object.entries(fields)) {
+                if (spec.kind === 'items') {
+                    let nodes = [];
+                    for (const selector of spec.selectors) {
+                        nodes = Array.from(el.querySelectorAll(selector));
+                        if (nodes.length) break;
+                    }
+                    out[name] = nodes
+                        .map((node) => extract(node, spec.fields))
+                        .filter((item) => !spec.required.length || spec.required.some((key) => item[key]));
+                } else if (spec.kind === 'group') {
+                    const node = el.querySelector(spec.selector);
+                    out[name] = node ? extract(node, spec.fields) : null;
+                } else {
+                    out[name] = read(el, spec);
+                }
+            }
+            return out;
+        };
+        return extract(root, schema);
+    }
+""" % MEDIA_URL_JS.strip()
+
+
+@dataclass(frozen=True)
+class Field:
+    """One value read from the first match of `selector` (or the scope element itself).
+
+    `read` is 'text' (textContent), 'html' (innerHTML), 'attr' (`attribute`) or 'src' (the
+    media URL, resolving lazy-load attributes and `srcset`). `normalize` is 'strip', 'collapse'
+    (single spaces) or 'raw'. A missing element yields `fallback`'s value, or ''.
+    """
+
+    selector: str | None = None
+    read: str = 'text'
+    attribute: str | None = None
+    normalize: str = 'strip'
+    fallback: Field | None = None
+
+
+@dataclass(frozen=True)
+class Items:
+    """A list of records, one per element matching `selector`.
+
+    A tuple of selectors is tried in order and the first with matches wins. With `required`,
+    records whose required text fields are all empty are dropped.
+    """
+
+    selector: str | tuple[str, ...]
+    fields: dict[str, Spec]
+    required: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Group:
+    """A nested record read from the first match of `selector`, or None if there is none."""
+
+    selector: str
+    fields: dict[str, Spec]
+
+
+Spec = Union[Field, Items, Group]
+
+
+def _compile(spec: Spec) -> dict:
+    if isinstance(spec, Items):
+        selectors = (spec.selector,) if isinstance(spec.selector, str) else spec.selector
+        return {
+            'kind': 'items',
+            'selectors': list(selectors),
+            'fields': {name: _compile(s) for name, s in spec.fields.items()},
+            'required': list(spec.required),
+        }
+    if isinstance(spec, Group):
+        return {
+            'kind': 'group',
+            'selector': spec.selector,
+            'fields': {name: _compile(s) for name, s in spec.fields.items()},
+        }
+    return {
+        'kind': 'field',
+        'selector': spec.selector,
+        'read': spec.read,
+        'attribute': spec.attribute,
+        'normalize': spec.normalize,
+        'fallback': _compile(spec.fallback) if spec.fallback else None,
+    }
+
+
+def _normalize(value: str | None, mode: str) -> str:
+    if value is None:
+        return ''
+    if mode == 'raw':
+        return value
+    if mode == 'collapse':
+        return ' '.join(value.split())
+    return value.strip()
+
+
+def _read_offline(el: Tag, spec: Field) -> str:
+    target = el.select_one(spec.selector) if spec.selector else el
+    if target is None:
+        return _read_offline(el, spec.fallback) if spec.fallback else ''
+    if spec.read == 'html':
+        value = target.decode_contents()
+    elif spec.read == 'attr':
+        value = target.get(spec.attribute or '')
+        if isinstance(value, list):
+            value = ' '.join(value)
+    elif spec.read == 'src':
+        value = media_url(target)
+    else:
+        value = target.get_text()
+    return _normalize(value, spec.normalize)
+
+
+def _extract_offline(el: Tag, fields: dict[str, Spec]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for name, spec in fields.items():
+        if isinstance(spec, Items):
+            selectors = (spec.selector,) if isinstance(spec.selector, str) else spec.selector
+            nodes: list[Tag] = []
+            for selector in selectors:
+                nodes = el.select(selector)
+                if nodes:
+                    break
+            records = [_extract_offline(node, spec.fields) for node in nodes]
+            out[name] = [r for r in records if not spec.required or any(r[key] for key in spec.required)]
+        elif isinstance(spec, Group):
+            node = el.select_one(spec.selector)
+            out[name] = _extract_offline(node, spec.fields) if node is not None else None
+        else:
+            out[name] = _read_offline(el, spec)
+    return out
+
+
+class BlockSchema:
+    """Declarative description of a block's fields, extracted in a single call.
+
+    Live locators run the compiled schema through `EXTRACT_JS` in one `evaluate`; snapshot
+    locators run the same schema over the parsed HTML in Python.
+    """
+
+    def __init__(self, **fields: Spec) -> None:
+        self.fields = fields
+        self.compiled = {name: _compile(spec) for name, spec in fields.items()}
+
+    def extract(self, locator: Any) -> dict[str, Any]:
+        if isinstance(locator, StaticLocator):
+            elements = locator.elements
+            return _extract_offline(elements[0] if elements else Tag(name='div'), self.fields)
+        return locator.evaluate(EXTRACT_JS, self.compiled)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pickle
+from typing import Any
+
+from scraper.parsers.block_parser import BLOCK_CLASSES, BlockParser
+from scraper.parsers.blocks import LessonBlock, UnknownBlock
+from scraper.parsers.static import SNAPSHOT_JS, StaticLocator
+
+_BLOCK_CLASSES_BY_NAME: dict[str, type[LessonBlock]] = {
+    block_cls.__name__: block_cls for block_cls in (*BLOCK_CLASSES, UnknownBlock)
+}
+
+
+def _block_html(block: LessonBlock) -> str:
+    if isinstance(block.locator, StaticLocator):
+        return block.locator.outer_html()
+    if block.html_snapshot is None:
+        block.html_snapshot = block.locator.evaluate(SNAPSHOT_JS)
+    return block.html_snapshot
+
+
+def serialize_blocks(blocks: list[LessonBlock]) -> list[dict]:
+    """Describe blocks as their wrapper's HTML and class name, which is all `_scrape` reads."""
+    return [
+        {'block_id': block.block_id, 'type': type(block).__name__, 'html': _block_html(block)}
+        for block in blocks
+    ]
+
+
+def deserialize_blocks(records: list[dict], *, page: Any = None) -> list[LessonBlock]:
+    """Rebuild blocks by running each block's `_scrape` over a snapshot of its stored HTML."""
+    blocks: list[LessonBlock] = []
+    for raw in records:
+        wrapper = StaticLocator.from_html(raw.get('html') or '', page=page)
+        block_cls = _BLOCK_CLASSES_BY_NAME.get(raw.get('type') or '')
+        blocks.append(BlockParser(wrapper, block_cls=block_cls).parse_block(block_id=raw.get('block_id')))
+    return blocks
+
+
+def pack_blocks(blocks: list[LessonBlock]) -> bytes:
+    """Pickle blocks with their scraped fields, for another process of the same run.
+
+    Unlike `serialize_blocks` this is not a storage format: it is only read back by
+    `unpack_blocks` from the same code, which then has nothing to scrape again.
+    """
+    records = [
+        (
+            type(block).__name__,
+            _block_html(block),
+            {name: value for name, value in vars(block).items() if name != 'locator'},
+        )
+        for block in blocks
+    ]
+    return pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def unpack_blocks(data: bytes, *, page: Any = None) -> list[LessonBlock]:
+    """Rebuild blocks packed by `pack_blocks`; their HTML is parsed only if something reads it."""
+    blocks: list[LessonBlock] = []
+    for type_name, html, state in pickle.loads(data):
+        block_cls = _BLOCK_CLASSES_BY_NAME[type_name]
+        block = block_cls.__new__(block_cls)
+        block.__dict__.update(state)
+        block.locator = StaticLocator.from_html(html, page=page, defer=True)
+        blocks.append(block)
+    return blocks
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
-
 from scraper.models.course_scheme import CourseSchemeLesson, CourseSchemeSection
+from scraper.utils.html import parse_html
 
 SIDEBAR_SECTION_TITLE_CLASS = 'nav-sidebar__outline-section-toggle-text'
 SIDEBAR_LESSON_LINKS_CLASS = 'a.nav-sidebar__outline-section-item__link'
@@ -20,7 +19,7 @@ def _lesson_id_from_href(href: str | None) -> str | None:
 
 
 def parse_sidebar(html: str) -> list[CourseSchemeSection]:
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
     sidebar = soup.select_one('#nav-content-sidebar')
     if not sidebar:
         return []
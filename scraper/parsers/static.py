@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Any
+
+from bs4.element import Tag
+
+from scraper.parsers.media import CURRENT_SRC_ATTRIBUTE, MEDIA_SELECTOR, MEDIA_URL_JS
+from scraper.utils.html import parse_html
+from scraper.utils.text import tag_to_text
+
+# Clones the element and stamps the resolved URL of every media element in it, so a whole
+# lesson's media, lazy-loaded or not, is resolved in the same call that reads its HTML.
+SNAPSHOT_JS = r"""
+    (root) => {
+        const mediaUrl = %(media_url)s;
+        const clone = root.cloneNode(true);
+        const live = root.querySelectorAll('%(selector)s');
+        const copies = clone.querySelectorAll('%(selector)s');
+        live.forEach((el, i) => {
+            const src = mediaUrl(el);
+            if (src && copies[i]) copies[i].setAttribute('%(attribute)s', src);
+        });
+        return clone.outerHTML;
+    }
+""" % {'media_url': MEDIA_URL_JS.strip(), 'selector': MEDIA_SELECTOR, 'attribute': CURRENT_SRC_ATTRIBUTE}
+
+
+class StaticLocator:
+    """Read-only stand-in for a Playwright `Locator`, backed by a parsed HTML snapshot.
+
+    Implements the subset of the `Locator` API used by the block parsers so they can run
+    unchanged against HTML pulled from the page in a single round trip.
+    """
+
+    def __init__(self, elements: list[Tag], *, page: Any = None) -> None:
+        self._parsed: list[Tag] | None = elements
+        self._html = ''
+        self.page = page  # Live page, kept for asset downloads.
+
+    @classmethod
+    def from_html(cls, html: str, *, page: Any = None, defer: bool = False) -> StaticLocator:
+        """Parse `html`; with `defer`, parsing waits until the locator is first queried."""
+        if defer:
+            locator = cls([], page=page)
+            locator._parsed, locator._html = None, html
+            return locator
+        soup = parse_html(html)
+        return cls([el for el in soup.contents if isinstance(el, Tag)], page=page)
+
+    @property
+    def _elements(self) -> list[Tag]:
+        if self._parsed is None:
+            self._parsed = [el for el in parse_html(self._html).contents if isinstance(el, Tag)]
+            self._html = ''
+        return self._parsed
+
+    @property
+    def elements(self) -> list[Tag]:
+        return self._elements
+
+    def _derive(self, elements: list[Tag]) -> StaticLocator:
+        return StaticLocator(elements, page=self.page)
+
+    def locator(self, selector: str) -> StaticLocator:
+        matches: list[Tag] = []
+        seen: set[int] = set()
+        for el in self._elements:
+            for match in el.select(selector):
+                if id(match) not in seen:
+                    seen.add(id(match))
+                    matches.append(match)
+        return self._derive(matches)
+
+    @property
+    def first(self) -> StaticLocator:
+        return self.nth(0)
+
+    @property
+    def last(self) -> StaticLocator:
+        return self.nth(-1)
+
+    def nth(self, index: int) -> StaticLocator:
+        try:
+            return self._derive([self._elements[index]])
+        except IndexError:
+            return self._derive([])
+
+    def all(self) -> list[StaticLocator]:
+        return [self._derive([el]) for el in self._elements]
+
+    def count(self) -> int:
+        return len(self._elements)
+
+    def get_attribute(self, name: str, **_kwargs: Any) -> str | None:
+        if not self._elements:
+            return None
+        value = self._elements[0].get(name)
+        if isinstance(value, list):  # Multi-valued attributes such as `class`.
+            return ' '.join(value)
+        return value
+
+    def inner_html(self, **_kwargs: Any) -> str:
+        return self._elements[0].decode_contents() if self._elements else ''
+
+    def outer_html(self) -> str:
+        return str(self._elements[0]) if self._elements else ''
+
+    def text_content(self, **_kwargs: Any) -> str:
+        return self._elements[0].get_text() if self._elements else ''
+
+    def inner_text(self, **_kwargs: Any) -> str:
+        return tag_to_text(self._elements[0]) if self._elements else ''
+
+
+def snapshot_locator(locator: Any) -> StaticLocator:
+    """Pull the element's HTML (with resolved media URLs) in one call and wrap it offline."""
+    html = locator.evaluate(SNAPSHOT_JS)
+    return StaticLocator.from_html(html, page=locator.page)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+
+from scraper.checkpoint import CheckpointStore
+from scraper.config import Config
+from scraper.models.course_scheme import CourseScheme, CourseSchemeLesson, CourseSchemeSection
+from scraper.setup import parse_range
+
+logger = logging.getLogger(__name__)
+
+
+def has_selection(settings: Config) -> bool:
+    return bool(settings.section_selection or settings.lesson_selection)
+
+
+def select_lessons(
+    sections: list[CourseSchemeSection], *, section_range: str = '', lesson_range: str = ''
+) -> list[CourseSchemeLesson]:
+    """Lessons of the sections numbered in `section_range` plus those numbered in `lesson_range`.
+
+    Both take `parse_range` selections such as '1-3, 5', counted from 1 in course order;
+    lessons are numbered across the whole course, as in the sidebar. A range that names
+    none of them raises ValueError rather than extracting nothing.
+    """
+    chosen_sections = set(parse_range(section_range, len(sections)))
+    lessons = [(number, lesson) for number, section in enumerate(sections, 1) for lesson in section.lessons]
+    chosen_lessons = set(parse_range(lesson_range, len(lessons)))
+    for kind, selection, chosen, total in (
+        ('sections', section_range, chosen_sections, len(sections)),
+        ('lessons', lesson_range, chosen_lessons, len(lessons)),
+    ):
+        if selection.strip() and not chosen:
+            raise ValueError(f"--{kind} {selection!r} matches none of the course's {total} {kind}.")
+    return [
+        lesson
+        for position, (section_number, lesson) in enumerate(lessons, 1)
+        if section_number in chosen_sections or position in chosen_lessons
+    ]
+
+
+def _selected_ids(settings: Config, sections: list[CourseSchemeSection]) -> set[int]:
+    lessons = select_lessons(
+        sections, section_range=settings.section_selection, lesson_range=settings.lesson_selection
+    )
+    return {id(lesson) for lesson in lessons}
+
+
+def configured_lessons(
+    settings: Config, sections: list[CourseSchemeSection], lessons: list[CourseSchemeLesson]
+) -> list[CourseSchemeLesson]:
+    """Narrow `lessons` to the configured selection; all of them when nothing is selected."""
+    if not has_selection(settings):
+        return lessons
+    selected = _selected_ids(settings, sections)
+    chosen = [lesson for lesson in lessons if id(lesson) in selected]
+    logger.info(
+        'Extracting the %s selected lessons; the rest are kept from the previous output.', len(chosen)
+    )
+    return chosen
+
+
+def _key(lesson: CourseSchemeLesson) -> str:
+    return lesson.lesson_id or f'{lesson.index}:{lesson.title}'
+
+
+def merge_unselected(
+    course: CourseScheme,
+    settings: Config,
+    *,
+    base: CourseScheme | None = None,
+    store: CheckpointStore | None = None,
+) -> None:
+    """Give every unselected lesson without blocks its blocks from `base`, or else from `store`.
+
+    `base` is the course as last written (its snapshot); lessons are matched by id, or by
+    position and title when they have none. Lessons that already have blocks, read fresh
+    from the course data, keep them. A lesson found in neither is left empty.
+    """
+    selected = _selected_ids(settings, course.sections)
+    previous = {
+        _key(lesson): lesson for section in (base.sections if base else []) for lesson in section.lessons
+    }
+    missing: list[str] = []
+    for section in course.sections:
+        for lesson in section.lessons:
+            if id(lesson) in selected or lesson.blocks:
+                continue
+            old = previous.get(_key(lesson))
+            if old is not None:
+                lesson.blocks, lesson.fingerprint = old.blocks, old.fingerprint
+                continue
+            blocks = store.load(lesson) if store else None
+            if blocks is not None:
+                lesson.blocks = blocks
+            else:
+                missing.append(lesson.title)
+    if missing:
+        logger.warning(
+            '%s unselected lessons have no previous output and are left empty: %s',
+            len(missing),
+            ', '.join(missing),
+        )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.async_api import Page as AsyncPage
+from playwright.async_api import TimeoutError as AsyncTimeoutError
+from playwright.sync_api import BrowserContext, Page, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+STORAGE_STATE_FILENAME = 'storage_state.json'
+SESSION_FILENAME = 'session.json'
+POPUP_TIMEOUT_MS = 5000
+
+
+@dataclass
+class SavedSession:
+    storage_state_path: Path
+    scorm_url: str | None = None
+    saved_at: str | None = None
+
+
+def save_session(context: BrowserContext, session_dir: str | Path, *, scorm_url: str | None) -> SavedSession:
+    """Persist the logged-in context's cookies/storage and the SCORM URL for unattended runs."""
+    directory = Path(session_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    state_path = directory / STORAGE_STATE_FILENAME
+    context.storage_state(path=state_path)
+    session = SavedSession(
+        storage_state_path=state_path,
+        scorm_url=scorm_url,
+        saved_at=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    )
+    (directory / SESSION_FILENAME).write_text(
+        json.dumps({'scorm_url': session.scorm_url, 'saved_at': session.saved_at}, indent=2),
+        encoding='utf-8',
+    )
+    logger.info('Saved session to %s', directory)
+    return session
+
+
+def load_session(session_dir: str | Path) -> SavedSession | None:
+    directory = Path(session_dir)
+    state_path = directory / STORAGE_STATE_FILENAME
+    if not state_path.exists():
+        return None
+
+    meta: dict = {}
+    meta_path = directory / SESSION_FILENAME
+    if meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        except ValueError:
+            logger.warning('Ignoring unreadable session metadata %s', meta_path)
+    return SavedSession(
+        storage_state_path=state_path,
+        scorm_url=meta.get('scorm_url'),
+        saved_at=meta.get('saved_at'),
+    )
+
+
+def open_scorm_page(context: BrowserContext, url: str) -> Page:
+    """Open the SCORM player at `url`; if the page launches a pop-up, the pop-up is used."""
+    page = context.new_page()
+    try:
+        with page.expect_popup(timeout=POPUP_TIMEOUT_MS) as popup_info:
+            page.goto(url)
+        scorm_page = popup_info.value
+    except TimeoutError:
+        scorm_page = page
+    scorm_page.wait_for_load_state()
+    return scorm_page
+
+
+async def open_scorm_page_async(context: AsyncBrowserContext, url: str) -> AsyncPage:
+    page = await context.new_page()
+    try:
+        async with page.expect_popup(timeout=POPUP_TIMEOUT_MS) as popup_info:
+            await page.goto(url)
+        scorm_page = await popup_info.value
+    except AsyncTimeoutError:
+        scorm_page = page
+    await scorm_page.wait_for_load_state()
+    return scorm_page
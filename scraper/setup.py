@@ -30,7 +30,7 @@ def _prompt_menu(title: str, options: list[tuple[str, str]], default_id: str) ->
     return default_id
 
 
-def _parse_range(s: str, n: int) -> list[int]:
+def parse_range(s: str, n: int) -> list[int]:
     """Parse '1', '1-3', '1, 3', '1 2' into sorted unique indices in 1..n."""
     seen: set[int] = set()
     for part in re.split(r'[,\s]+', s):
@@ -70,13 +70,13 @@ def _prompt_multi_select(
     raw = input(f'Select (e.g. 1, 1 2, 1-3, 1, 3) [{default_str}]: ').strip()
     if not raw:
         raw = default_str
-    indices = _parse_range(raw, len(options))
+    indices = parse_range(raw, len(options))
     if not indices:
         return [options[0][0]] if options else []
     return [options[i - 1][0] for i in indices]
 
 
-def _normalize_course_name(raw: str) -> str:
+def normalize_course_name(raw: str) -> str:
     name = (raw or '').strip() or 'course'
     name = re.sub(r'\s+', ' ', name).strip()
     name = name.replace('/', '-').replace('\\', '-')
@@ -88,7 +88,7 @@ def run_setup_wizard() -> Config:
 
     print('\nBlackboard SCORM Scraper setup\n')
 
-    course_name = _normalize_course_name(_prompt('Course name', current.course_name))
+    course_name = normalize_course_name(_prompt('Course name', current.course_name))
     base_url = _prompt('Blackboard URL', current.base_url)
 
     format_options = [(f.extension, f'{f.value[1]} (.{f.extension})') for f in OutputFormat]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from scraper.models.course_scheme import CourseScheme, CourseSchemeLesson, CourseSchemeSection
+from scraper.parsers.blocks import LessonBlock
+from scraper.parsers.serialize import deserialize_blocks, serialize_blocks
+from scraper.utils.assets import get_asset_store
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 'scorm-scraper-snapshot'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = 'course.snapshot'
+
+# Layout: a JSON header line, then lesson records (JSON) and asset bodies (raw bytes) back to
+# back, then the JSON index, then a fixed-width trailer holding the index's offset and length.
+_TRAILER_FORMAT = '%020d %020d\n'
+_TRAILER_SIZE = len(_TRAILER_FORMAT % (0, 0))
+
+
+def _append(out: BinaryIO, data: bytes) -> list[int]:
+    offset = out.tell()
+    out.write(data)
+    return [offset, len(data)]
+
+
+def write_snapshot(course: CourseScheme, path: str | Path, *, assets_dir: Path | None = None) -> Path:
+    """Write `course` and the asset files already in `assets_dir` to a single snapshot file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+
+    sections: list[dict] = []
+    assets: dict[str, dict] = {}
+    with tmp.open('wb') as out:
+        header = {'format': SNAPSHOT_FORMAT, 'version': SNAPSHOT_VERSION}
+        out.write(json.dumps(header).encode('utf-8') + b'\n')
+
+        for section in course.sections:
+            lessons: list[dict] = []
+            for lesson in section.lessons:
+                record = json.dumps({'blocks': serialize_blocks(lesson.blocks)}, ensure_ascii=False)
+                lessons.append(
+                    {
+                        'index': lesson.index,
+                        'title': lesson.title,
+                        'href': lesson.href,
+                        'lesson_id': lesson.lesson_id,
+                        'fingerprint': lesson.fingerprint,
+                        'span': _append(out, record.encode('utf-8')),
+                    }
+                )
+                for block in lesson.blocks:
+                    for filename, url in block.asset_files():
+                        file = assets_dir / filename if assets_dir else None
+                        if url in assets or not (file and file.exists()):
+                            continue
+                        assets[url] = {'filename': filename, 'span': _append(out, file.read_bytes())}
+            sections.append({'title': section.title, 'lessons': lessons})
+
+        index = {'title': course.title, 'sections': sections, 'assets': assets}
+        span = _append(out, json.dumps(index, ensure_ascii=False).encode('utf-8'))
+        out.write((_TRAILER_FORMAT % tuple(span)).encode('ascii'))
+    os.replace(tmp, path)
+
+    logger.info('Wrote course snapshot %s (%s assets)', path, len(assets))
+    return path
+
+
+class CourseSnapshot:
+    """Reader for a snapshot file; lessons and assets are read on demand through the index.
+
+    While open, the snapshot's assets are served to `ensure_asset` by URL, so rendering writes
+    them out without a browser.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = self.path.open('rb')
+        header = json.loads(self._file.readline() or b'{}')
+        if header.get('format') != SNAPSHOT_FORMAT:
+            self._file.close()
+            raise ValueError(f'{self.path} is not a course snapshot')
+        if header.get('version') != SNAPSHOT_VERSION:
+            self._file.close()
+            raise ValueError(f'Unsupported snapshot version {header.get("version")!r} in {self.path}')
+
+        self._file.seek(-_TRAILER_SIZE, os.SEEK_END)
+        offset, length = (int(n) for n in self._file.read(_TRAILER_SIZE).split())
+        self.index: dict[str, Any] = json.loads(self._read([offset, length]))
+        self.title: str = self.index['title']
+        get_asset_store().add_url_source(self.index['assets'], self.read_asset)
+
+    def __enter__(self) -> CourseSnapshot:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        get_asset_store().remove_source(self.read_asset)
+        self._file.close()
+
+    def _read(self, span: list[int]) -> bytes:
+        self._file.seek(span[0])
+        return self._file.read(span[1])
+
+    @property
+    def lessons(self) -> list[dict]:
+        return [lesson for section in self.index['sections'] for lesson in section['lessons']]
+
+    def load_lesson(self, index: int, *, page: Any = None) -> list[LessonBlock]:
+        """Read and rebuild the blocks of the lesson with global `index` only."""
+        entry = next((lesson for lesson in self.lessons if lesson['index'] == index), None)
+        if entry is None:
+            raise KeyError(f'No lesson {index} in {self.path}')
+        return deserialize_blocks(json.loads(self._read(entry['span']))['blocks'], page=page)
+
+    def read_asset(self, url: str) -> bytes | None:
+        asset = self.index['assets'].get(url)
+        return self._read(asset['span']) if asset else None
+
+    def to_course(self) -> CourseScheme:
+        sections: list[CourseSchemeSection] = []
+        for section in self.index['sections']:
+            lessons = [
+                CourseSchemeLesson(
+                    index=entry['index'],
+                    title=entry['title'],
+                    href=entry.get('href'),
+                    lesson_id=entry.get('lesson_id'),
+                    blocks=deserialize_blocks(json.loads(self._read(entry['span']))['blocks']),
+                    fingerprint=entry.get('fingerprint'),
+                )
+                for entry in section['lessons']
+            ]
+            sections.append(CourseSchemeSection(title=section['title'], lessons=lessons))
+        return CourseScheme(title=self.title, sections=sections)
@@ -0,0 +1,113 @@
+"""Time Markdown and PDF rendering of saved lesson HTML under each HTML parser backend.
+
+Usage: python -m scraper.tools.parser_bench fixtures/<course>/*.html [--rounds 5] [--sweep]
+
+Uses the same fragments as `parser_parity` (block wrappers and `.fr-view` contents). Each
+round parses every fragment, then renders it to Markdown and to PDF flowables; the best
+round per backend is reported, which filters out warm-up and scheduler noise. `auto` is
+the default mix: lxml for fragments of `LXML_MIN_CHARS` or more, html.parser below.
+`--sweep` instead times parsing alone at a range of fragment sizes, to place that cutoff.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from scraper.config import HtmlParser, get_config
+from scraper.formats.md.html_parser import html_to_markdown
+from scraper.formats.pdf.builder import PDFBuilder
+from scraper.formats.pdf.html_parser import html_to_flowables
+from scraper.tools.parser_parity import read_fragments
+from scraper.utils.html import HTML_PARSER, LXML, backend_available, parse_html
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('parse', 'markdown', 'flowables')
+SWEEP_SIZES = (256, 512, 1024, 2048, 4096, 8192, 16384, 65536)
+
+
+def _time(fn, htmls: list[str]) -> float:
+    started = time.perf_counter()
+    for html in htmls:
+        fn(html)
+    return time.perf_counter() - started
+
+
+def bench(backend: str, htmls: list[str], rounds: int) -> dict[str, float]:
+    """Return the best time in seconds for each stage over `rounds` rounds."""
+    settings = get_config()
+    previous = settings.html_parser
+    settings.html_parser = HtmlParser(backend)
+    builder = PDFBuilder()
+    stages = {
+        'parse': parse_html,
+        'markdown': html_to_markdown,
+        'flowables': lambda html: html_to_flowables(html, builder),
+    }
+    try:
+        return {name: min(_time(fn, htmls) for _ in range(rounds)) for name, fn in stages.items()}
+    finally:
+        settings.html_parser = previous
+
+
+def sweep(html: str, rounds: int) -> None:
+    """Log the parse time of `html`, repeated or cut to each of `SWEEP_SIZES`, per backend."""
+    for size in SWEEP_SIZES:
+        fragment = (html * (size // len(html) + 1))[:size]
+        fragment = fragment[: fragment.rfind('<')] or fragment  # End on a tag boundary.
+        htmls = [fragment] * max(3, 200_000 // size)
+        per_call = {
+            backend: min(_time(lambda h: parse_html(h, backend=backend), htmls) for _ in range(rounds))
+            / len(htmls)
+            for backend in (HTML_PARSER, LXML)
+        }
+        logger.info(
+            '%6s chars  html.parser %8.1f us  lxml %8.1f us  (%.2fx)',
+            len(fragment),
+            per_call[HTML_PARSER] * 1e6,
+            per_call[LXML] * 1e6,
+            per_call[HTML_PARSER] / per_call[LXML],
+        )
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('fixtures', nargs='+', type=Path, help='Saved lesson or course HTML files.')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--sweep', action='store_true', help='Time parsing alone across fragment sizes.')
+    args = parser.parse_args()
+
+    htmls = [html for path in args.fixtures for _label, html in read_fragments(path)]
+    if args.sweep:
+        if not backend_available(LXML):
+            logger.error('The sweep compares against lxml, which is not installed.')
+            return
+        sweep(''.join(htmls), args.rounds)
+        return
+    size_kb = sum(len(html.encode('utf-8')) for html in htmls) / 1024
+    logger.info('%s fragments, %.0f KiB of HTML, best of %s rounds', len(htmls), size_kb, args.rounds)
+
+    results: dict[str, dict[str, float]] = {}
+    for backend in (HtmlParser.HTML_PARSER.value, HtmlParser.LXML.value, HtmlParser.AUTO.value):
+        if backend != HtmlParser.AUTO.value and not backend_available(backend):
+            logger.warning('Skipping %s: not installed.', backend)
+            continue
+        results[backend] = bench(backend, htmls, args.rounds)
+
+    baseline = results.get(HtmlParser.HTML_PARSER.value)
+    for backend, timings in results.items():
+        cells = []
+        for stage in STAGES:
+            cell = f'{stage} {timings[stage] * 1000:8.1f} ms'
+            if baseline and backend != HtmlParser.HTML_PARSER.value:
+                cell += f' ({baseline[stage] / timings[stage]:.2f}x)'
+            cells.append(cell)
+        logger.info('%-12s %s', backend, '  '.join(cells))
+
+
+if __name__ == '__main__':
+    main()
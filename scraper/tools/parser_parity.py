@@ -0,0 +1,113 @@
+"""Check that every HTML parser backend renders saved lesson HTML identically.
+
+Usage: python -m scraper.tools.parser_parity fixtures/<course>/*.html [--backends lxml html.parser]
+
+Each block wrapper and each `.fr-view` fragment in the fixtures is rendered to Markdown,
+to PDF flowables and to text once per backend; any output that differs from the first
+backend's is reported as a unified diff. Flowables are compared by type, style and markup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import logging
+import sys
+from pathlib import Path
+
+from scraper.config import HtmlParser, get_config
+from scraper.formats.md.html_parser import html_to_markdown
+from scraper.formats.pdf.builder import PDFBuilder
+from scraper.formats.pdf.html_parser import html_to_flowables
+from scraper.utils.html import HTML_PARSER, backend_available, parse_html
+from scraper.utils.text import html_to_text
+
+logger = logging.getLogger(__name__)
+
+BLOCK_WRAPPER_SELECTOR = 'div.noOutline[data-block-id]'
+FRAGMENT_SELECTOR = '.fr-view'
+
+
+def read_fragments(path: Path) -> list[tuple[str, str]]:
+    """Return (label, inner HTML) for every block wrapper and `.fr-view` in a fixture."""
+    soup = parse_html(path.read_text(encoding='utf-8'), backend=HTML_PARSER)
+    fragments: list[tuple[str, str]] = []
+    for wrapper in soup.select(BLOCK_WRAPPER_SELECTOR):
+        block_id = wrapper.get('data-block-id')
+        fragments.append((f'{path.name} block {block_id}', wrapper.decode_contents()))
+        for i, view in enumerate(wrapper.select(FRAGMENT_SELECTOR)):
+            fragments.append((f'{path.name} block {block_id} fragment {i}', view.decode_contents()))
+    return fragments
+
+
+def describe_flowable(flowable: object) -> str:
+    """Type, style and markup of a flowable; flowables themselves do not compare by value."""
+    style = getattr(getattr(flowable, 'style', None), 'name', None)
+    text = getattr(flowable, 'text', None)
+    cells = getattr(flowable, '_cellvalues', None)
+    if cells is not None:
+        text = [[describe_flowable(c) if not isinstance(c, str) else c for c in row] for row in cells]
+    return f'{type(flowable).__name__} style={style!r} {text!r}'
+
+
+def render(html: str, builder: PDFBuilder) -> dict[str, list[str]]:
+    return {
+        'markdown': html_to_markdown(html).splitlines(),
+        'flowables': [describe_flowable(f) for f in html_to_flowables(html, builder)],
+        'text': html_to_text(html).splitlines(),
+    }
+
+
+def render_with(backend: str, fragments: list[tuple[str, str]], builder: PDFBuilder) -> list[dict]:
+    settings = get_config()
+    previous = settings.html_parser
+    settings.html_parser = HtmlParser(backend)
+    try:
+        return [render(html, builder) for _label, html in fragments]
+    finally:
+        settings.html_parser = previous
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('fixtures', nargs='+', type=Path, help='Saved lesson or course HTML files.')
+    parser.add_argument(
+        '--backends',
+        nargs='+',
+        default=[HtmlParser.HTML_PARSER.value, HtmlParser.LXML.value],
+        choices=[HtmlParser.HTML_PARSER.value, HtmlParser.LXML.value],
+    )
+    args = parser.parse_args()
+
+    backends = [b for b in args.backends if backend_available(b)]
+    for missing in sorted(set(args.backends) - set(backends)):
+        logger.warning('Skipping %s: not installed.', missing)
+    if len(backends) < 2:
+        logger.error('Need at least two installed backends to compare.')
+        sys.exit(2)
+
+    fragments = [fragment for path in args.fixtures for fragment in read_fragments(path)]
+    builder = PDFBuilder()
+    reference, *others = backends
+    expected = render_with(reference, fragments, builder)
+
+    mismatches = 0
+    for backend in others:
+        actual = render_with(backend, fragments, builder)
+        for (label, _html), want, got in zip(fragments, expected, actual):
+            for output, lines in want.items():
+                if got[output] == lines:
+                    continue
+                mismatches += 1
+                diff = difflib.unified_diff(lines, got[output], reference, backend, lineterm='')
+                logger.warning('%s: %s differs:\n%s', label, output, '\n'.join(diff))
+
+    logger.info('%s fragments, %s backends, %s mismatches', len(fragments), len(backends), mismatches)
+    if mismatches:
+        sys.exit(1)
+    logger.info('Every backend renders identical Markdown, flowables and text.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""Compare per-lesson latency with the full rendering profile and the lean scraping profile.
+
+Usage: python -m scraper.tools.profile_bench [--lessons 10] [--session-dir .session] [--scorm-url URL]
+       python -m scraper.tools.profile_bench --replay-har course.zip [--lessons 10]
+
+Opens the saved session's course once per profile, each in a fresh browser, and extracts
+the same first lessons with `extract_lesson` (no checkpoints, no course data), timing each
+from navigation until its blocks are parsed. Reports median and p90 per profile. With
+`--replay-har` the course is served from an archive recorded by `scrape --record-har`, so
+runs are repeatable and need neither a session nor the network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+from scraper.browser import apply_profile, context_options, launch_options
+from scraper.config import get_config
+from scraper.extractors.course import LESSON_CONTENT_SELECTOR, SIDEBAR_SELECTOR
+from scraper.extractors.frame import resolve_scorm_frame, start_course
+from scraper.extractors.lesson import extract_lesson
+from scraper.extractors.retry import LessonQueue, latency_stats
+from scraper.har import HarArchive, replay_har
+from scraper.parsers.sidebar import SIDEBAR_LESSON_LINKS_SELECTOR, parse_sidebar
+from scraper.session import load_session, open_scorm_page
+
+logger = logging.getLogger(__name__)
+
+PROFILES = {'full': False, 'lean': True}
+
+
+def measure(
+    profile: str, *, scorm_url: str, storage_state: Path | None, lessons: int, har: Path | None = None
+) -> list[float]:
+    """Return the latency in seconds of each of the first `lessons` lessons under `profile`."""
+    settings = get_config()
+    settings.lean_profile = PROFILES[profile]
+    with sync_playwright() as p:
+        browser = p.chromium.launch(**launch_options(settings, headless=True))
+        context = browser.new_context(storage_state=storage_state, **context_options(settings))
+        apply_profile(context, settings)
+        if har:
+            replay_har(context, har)
+        page = open_scorm_page(context, scorm_url)
+
+        frame = resolve_scorm_frame(page)
+        start_course(frame)
+        sidebar = frame.locator(SIDEBAR_SELECTOR)
+        sidebar.wait_for(state='visible')
+        sections = parse_sidebar(f'<div id="nav-content-sidebar">{sidebar.inner_html()}</div>')
+
+        queue = LessonQueue(
+            [lesson for section in sections for lesson in section.lessons][:lessons], retries=0
+        )
+        total = len(queue)
+        while queue:
+            lesson = queue.popleft()
+            frame, _blocks = extract_lesson(
+                scorm_page=page,
+                scorm_frame=frame,
+                item=lesson,
+                total_items=total,
+                sidebar_lesson_links_selector=SIDEBAR_LESSON_LINKS_SELECTOR,
+                lesson_content_selector=LESSON_CONTENT_SELECTOR,
+            )
+            queue.done(lesson)
+        browser.close()
+    return queue.latencies
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lessons', type=int, default=10, help='Lessons to time per profile.')
+    parser.add_argument('--session-dir', default=get_config().session_dir)
+    parser.add_argument('--scorm-url', help='SCORM launch URL (default: the saved one).')
+    parser.add_argument('--replay-har', type=Path, help='Serve the course from a recorded archive.')
+    args = parser.parse_args()
+
+    session = load_session(args.session_dir)
+    scorm_url = args.scorm_url or (session.scorm_url if session else None)
+    if args.replay_har and not scorm_url:
+        with HarArchive(args.replay_har) as archive:
+            scorm_url = next(iter(archive.documents), None)
+    if not (session or args.replay_har) or not scorm_url:
+        logger.error('Need a saved session with a SCORM URL. Run `python main.py login` first.')
+        sys.exit(1)
+
+    results = {
+        profile: measure(
+            profile,
+            scorm_url=scorm_url,
+            storage_state=session.storage_state_path if session else None,
+            lessons=args.lessons,
+            har=args.replay_har,
+        )
+        for profile in PROFILES
+    }
+    for profile, latencies in results.items():
+        if not latencies:
+            logger.warning('%s: no lessons timed.', profile)
+            continue
+        median, p90, slowest = latency_stats(latencies)
+        logger.info(
+            '%-5s %s lessons  median %6.2fs  p90 %6.2fs  max %6.2fs',
+            profile,
+            len(latencies),
+            median,
+            p90,
+            slowest,
+        )
+    if results['full'] and results['lean']:
+        speedup = latency_stats(results['full'])[0] / latency_stats(results['lean'])[0]
+        logger.info('Lean profile median speedup: %.2fx', speedup)
+
+
+if __name__ == '__main__':
+    main()
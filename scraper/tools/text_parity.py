@@ -0,0 +1,73 @@
+"""Check layout-free text extraction against `inner_text()` on saved lesson HTML.
+
+Usage: python -m scraper.tools.text_parity fixtures/<course>/*.html
+
+Each fixture is loaded into headless Chromium; for every block wrapper the browser's
+`innerText` is compared with `html_to_text` over the same element's HTML. Lines are
+compared stripped and with blank lines dropped, which is how the blocks consume the text.
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import logging
+import sys
+from pathlib import Path
+
+from playwright.sync_api import Page, sync_playwright
+
+from scraper.utils.text import html_to_text
+
+logger = logging.getLogger(__name__)
+
+BLOCK_WRAPPER_SELECTOR = 'div.noOutline[data-block-id]'
+
+_READ_WRAPPERS_JS = r"""
+    (wrappers) => wrappers.map((el) => [el.getAttribute('data-block-id'), el.innerText, el.innerHTML])
+"""
+
+
+def _normalize(text: str) -> list[str]:
+    return [line.strip() for line in (text or '').splitlines() if line.strip()]
+
+
+def check_fixture(page: Page, path: Path) -> int:
+    """Return the number of blocks in `path` whose derived text differs from `innerText`."""
+    page.set_content(path.read_text(encoding='utf-8'))
+    wrappers = page.locator(BLOCK_WRAPPER_SELECTOR).evaluate_all(_READ_WRAPPERS_JS)
+
+    mismatches = 0
+    for block_id, inner_text, inner_html in wrappers:
+        expected = _normalize(inner_text)
+        actual = _normalize(html_to_text(inner_html))
+        if expected == actual:
+            continue
+        mismatches += 1
+        diff = difflib.unified_diff(expected, actual, 'innerText', 'html_to_text', lineterm='')
+        logger.warning('%s block %s differs:\n%s', path.name, block_id, '\n'.join(diff))
+
+    logger.info('%s: %s blocks, %s mismatches', path.name, len(wrappers), mismatches)
+    return mismatches
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('fixtures', nargs='+', type=Path, help='Saved lesson or course HTML files.')
+    args = parser.parse_args()
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        total = sum(check_fixture(page, path) for path in args.fixtures)
+        browser.close()
+
+    if total:
+        logger.error('%s blocks differ from innerText.', total)
+        sys.exit(1)
+    logger.info('Layout-free text matches innerText on every block.')
+
+
+if __name__ == '__main__':
+    main()
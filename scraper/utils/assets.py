@@ -1,17 +1,115 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import unquote_to_bytes, urljoin, urlsplit
+
+from playwright.async_api import Page as AsyncPage
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_ASSET_STORE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def url_origin(url: str) -> str:
+    """`scheme://host/` of `url`, or `scheme:` for URLs without a host (such as `data:`)."""
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}/' if parts.netloc else f'{parts.scheme}:'
+
+
+class AssetStore:
+    """Asset bodies keyed by URL: captured from the browser's own responses, or read on demand
+    from a registered source (such as an opened SCORM package) for URLs under its prefix."""
+
+    def __init__(self, max_bytes: int = DEFAULT_ASSET_STORE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._bodies: dict[str, bytes] = {}
+        self._refs: dict[int, int] = {}  # id(body) -> URLs it is stored under.
+        self._size = 0
+        self._sources: list[tuple[str, Callable[[str], bytes | None], bool]] = []
+
+    def add_source(
+        self, prefix: str, loader: Callable[[str], bytes | None], *, full_url: bool = False
+    ) -> None:
+        """Serve URLs starting with `prefix` from `loader(rest_of_url)`; None falls through.
+
+        With `full_url`, the loader is passed the whole URL rather than the part after `prefix`.
+        """
+        self._sources.append((prefix, loader, full_url))
+
+    def add_url_source(self, urls: Iterable[str], loader: Callable[[str], bytes | None]) -> None:
+        """Serve `urls` from `loader(url)`, registered under their origins rather than every URL."""
+        for origin in sorted({url_origin(url) for url in urls}):
+            self.add_source(origin, loader, full_url=True)
+
+    def remove_source(self, loader: Callable[[str], bytes | None]) -> None:
+        self._sources = [source for source in self._sources if source[1] != loader]
+
+    def put(self, urls: Iterable[str], body: bytes) -> list[str]:
+        """Store `body` under those of `urls` not stored yet; return them (empty if none were)."""
+        if not body or self._size + len(body) > self.max_bytes:
+            return []
+        keys = [u for u in urls if u and u not in self._bodies]
+        if not keys:
+            return []
+        for key in keys:
+            self._bodies[key] = body
+        if id(body) not in self._refs:
+            self._size += len(body)
+        self._refs[id(body)] = self._refs.get(id(body), 0) + len(keys)
+        return keys
+
+    def discard(self, urls: Iterable[str]) -> None:
+        """Drop the bodies stored under `urls`, freeing their share of `max_bytes`."""
+        for url in urls:
+            body = self._bodies.pop(url, None)
+            if body is None:
+                continue
+            refs = self._refs.pop(id(body)) - 1
+            if refs:
+                self._refs[id(body)] = refs
+            else:
+                self._size -= len(body)
+
+    def get(self, url: str | None) -> bytes | None:
+        key = (url or '').strip()
+        body = self._bodies.get(key)
+        if body is not None:
+            return body
+        for prefix, loader, full_url in self._sources:
+            if key.startswith(prefix):
+                body = loader(key if full_url else key[len(prefix) :])
+                if body is not None:
+                    return body
+        return None
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def clear(self) -> None:
+        self._bodies.clear()
+        self._refs.clear()
+        self._size = 0
+
+
+_ASSET_STORE = AssetStore()
+
+
+def get_asset_store() -> AssetStore:
+    return _ASSET_STORE
+
 
 def safe_basename_from_url(url: str | None) -> str | None:
     if not url:
         return None
+    if url.startswith('data:'):  # Inline images: name them after their media type, not their payload.
+        media_type = url[5:].split(',', 1)[0].split(';', 1)[0]
+        subtype = media_type.rpartition('/')[2].split('+', 1)[0]
+        return f'inline.{subtype}' if subtype else 'inline'
     base = url.split('?', 1)[0].split('#', 1)[0].rstrip('/').split('/')[-1]
     return base or None
 
@@ -23,8 +121,27 @@ def safe_filename(name: str) -> str:
     return name
 
 
+def decode_data_uri(url: str) -> bytes | None:
+    """Body of a `data:` URI, or None for any other URL or a malformed one."""
+    if not url.startswith('data:') or ',' not in url:
+        return None
+    header, payload = url[5:].split(',', 1)
+    try:
+        if header.lower().endswith(';base64'):
+            return base64.b64decode(payload)
+        return unquote_to_bytes(payload)
+    except ValueError:
+        return None
+
+
 def download_via_fetch(locator: Any, url: str) -> bytes | None:
+    if isinstance(url, str) and url.strip().startswith('data:'):
+        return decode_data_uri(url.strip())
     page = getattr(locator, 'page', None)
+    if isinstance(page, AsyncPage):
+        # Blocks of async scrapes get their assets from the awaited `prefetch_assets` before
+        # rendering; this synchronous path cannot drive an async page, so a miss stays a miss.
+        return None
     if page is not None and isinstance(url, str):
         u = url.strip()
         if u and not (u.startswith('data:') or u.startswith('blob:')):
@@ -38,6 +155,9 @@ def download_via_fetch(locator: Any, url: str) -> bytes | None:
             except Exception:
                 pass
 
+    if not hasattr(locator, 'evaluate'):  # A snapshot's `StaticLocator` cannot run the in-page fetch.
+        return None
+
     js = r"""
         async (el, url) => {
         const res = await fetch(url);
@@ -75,8 +195,12 @@ def ensure_asset(*, locator: Any, url: str, assets_dir: Path, filename: str) ->
         logger.info('Asset %s already exists, skipping download.', filename)
         return True
 
-    logger.info('Downloading asset %s', filename)
-    data = download_via_fetch(locator, url)
+    data = get_asset_store().get(url)
+    if data:
+        logger.info('Using stored copy of asset %s', filename)
+    else:
+        logger.info('Downloading asset %s', filename)
+        data = download_via_fetch(locator, url)
     if not data:
         logger.warning('Failed downloading asset %s', filename)
         return False
@@ -84,3 +208,54 @@ def ensure_asset(*, locator: Any, url: str, assets_dir: Path, filename: str) ->
     target.write_bytes(data)
     logger.info('Saved asset %s (%s bytes)', filename, len(data))
     return True
+
+
+async def prefetch_assets(
+    page: Any,
+    files: Iterable[tuple[str, str]],
+    assets_dir: Path,
+    *,
+    concurrency: int = 8,
+) -> None:
+    """Download `(filename, url)` pairs concurrently through an async page's request context.
+
+    Files that already exist are skipped, so a later `ensure_asset` finds them on disk.
+    """
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(filename: str, url: str) -> None:
+        target = assets_dir / filename
+        if target.exists():
+            return
+        captured = get_asset_store().get(url)
+        if captured:
+            target.write_bytes(captured)
+            logger.info('Saved captured asset %s (%s bytes)', filename, len(captured))
+            return
+        resolved = url.strip()
+        inline = decode_data_uri(resolved)
+        if inline:
+            target.write_bytes(inline)
+            logger.info('Saved inline asset %s (%s bytes)', filename, len(inline))
+            return
+        if not resolved or resolved.startswith('data:') or resolved.startswith('blob:'):
+            return
+        if not (resolved.startswith('http://') or resolved.startswith('https://')):
+            resolved = urljoin(page.url or '', resolved)
+
+        async with semaphore:
+            try:
+                resp = await page.request.get(resolved, timeout=30_000)
+                if not resp.ok:
+                    logger.warning('Failed downloading asset %s', filename)
+                    return
+                data = await resp.body()
+            except Exception:
+                logger.warning('Failed downloading asset %s', filename)
+                return
+
+        target.write_bytes(data)
+        logger.info('Saved asset %s (%s bytes)', filename, len(data))
+
+    await asyncio.gather(*(fetch(filename, url) for filename, url in dict(files).items()))
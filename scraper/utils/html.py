@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+import re
+from functools import lru_cache
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+logger = logging.getLogger(__name__)
+
+LXML = 'lxml'
+HTML_PARSER = 'html.parser'
+# Below this size lxml's per-call setup (and moving the fragment out of its <html><body>) eats its
+# faster tokenizer. On the test fixture, `tools.parser_bench --sweep` put lxml at 0.4-1.2x the
+# speed of html.parser up to 4 KiB, varying run to run, and at 1.1-1.5x from 8 KiB up.
+LXML_MIN_CHARS = 8192
+
+# Markup that is a whole document rather than a fragment; parsed as-is by every backend.
+_DOCUMENT_RE = re.compile(r'^\s*(?:<!doctype|<html[\s>])', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def backend_available(backend: str) -> bool:
+    return builder_registry.lookup(backend) is not None
+
+
+def html_parser_backend(size: int | None = None) -> str:
+    """Return the BeautifulSoup feature name to parse `size` characters of HTML with."""
+    from scraper.config import HtmlParser, get_config  # Lazy: the config imports the formatters.
+
+    choice = get_config().html_parser
+    if choice == HtmlParser.AUTO:
+        large = size is None or size >= LXML_MIN_CHARS
+        return LXML if large and backend_available(LXML) else HTML_PARSER
+    if not backend_available(choice.value):
+        _warn_unavailable(choice.value)
+        return HTML_PARSER
+    return choice.value
+
+
+@lru_cache(maxsize=None)
+def _warn_unavailable(backend: str) -> None:
+    logger.warning('HTML parser %r is not installed; using html.parser.', backend)
+
+
+def parse_html(html: str, *, backend: str | None = None) -> BeautifulSoup:
+    """Parse an HTML fragment into a soup whose top-level nodes are the fragment's own.
+
+    `html.parser` keeps fragments as they are, while lxml wraps them in `<html><body>` and
+    puts leading text in a `<p>`. Fragments are therefore parsed inside a `<div>` and moved
+    into an empty soup, so every backend yields the same tree shape to the code walking it.
+    """
+    html = html or ''
+    backend = backend or html_parser_backend(len(html))
+    if backend == HTML_PARSER or _DOCUMENT_RE.match(html):
+        return BeautifulSoup(html, backend)
+
+    parsed = BeautifulSoup(f'<div>{html}</div>', backend)
+    wrapper = parsed.body.div if parsed.body else None
+    soup = BeautifulSoup('', HTML_PARSER)
+    for node in list(wrapper.contents) if wrapper else []:
+        soup.append(node.extract())
+    return soup
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from bs4.element import Comment, Declaration, Doctype, NavigableString, ProcessingInstruction, Tag
+
+from scraper.config import get_config
+from scraper.utils.html import parse_html
+
+# Elements rendered as blocks by the browser's default stylesheet.
+_BLOCK_TAGS = {
+    'address',
+    'article',
+    'aside',
+    'blockquote',
+    'caption',
+    'dd',
+    'details',
+    'dialog',
+    'div',
+    'dl',
+    'dt',
+    'fieldset',
+    'figcaption',
+    'figure',
+    'footer',
+    'form',
+    'h1',
+    'h2',
+    'h3',
+    'h4',
+    'h5',
+    'h6',
+    'header',
+    'hgroup',
+    'hr',
+    'li',
+    'main',
+    'nav',
+    'ol',
+    'pre',
+    'section',
+    'summary',
+    'table',
+    'tr',
+    'ul',
+}
+_SKIPPED_TAGS = {'head', 'script', 'style', 'template', 'noscript'}
+_SKIPPED_STRINGS = (Comment, Declaration, Doctype, ProcessingInstruction)
+_WHITESPACE_RE = re.compile(r'[ \t\n\r\f]+')
+
+
+class _Preformatted(str):
+    """Text emitted verbatim: `<pre>` content, `<br>` and cell separators."""
+
+
+_LINE_BREAK = _Preformatted('\n')
+_CELL_SEPARATOR = _Preformatted('\t')
+
+
+def _collect(node, items: list, *, pre: bool) -> None:
+    if isinstance(node, NavigableString):
+        if isinstance(node, _SKIPPED_STRINGS):
+            return
+        text = str(node)
+        items.append(_Preformatted(text) if pre else _WHITESPACE_RE.sub(' ', text))
+        return
+
+    if not isinstance(node, Tag):
+        return
+
+    name = (node.name or '').lower()
+    if name in _SKIPPED_TAGS or node.has_attr('hidden'):
+        return
+
+    if name == 'br':
+        items.append(_LINE_BREAK)
+        return
+
+    if name in {'td', 'th'} and node.find_previous_sibling(['td', 'th']) is not None:
+        items.append(_CELL_SEPARATOR)
+
+    # Required line breaks: paragraphs are separated by a blank line, other blocks by one.
+    breaks = 2 if name == 'p' else 1 if name in _BLOCK_TAGS else 0
+    if breaks:
+        items.append(breaks)
+    for child in node.contents:
+        _collect(child, items, pre=pre or name == 'pre')
+    if breaks:
+        items.append(breaks)
+
+
+def _join(items: list) -> str:
+    parts: list[str] = []
+    pending = 0
+
+    for item in items:
+        if isinstance(item, int):
+            pending = max(pending, item)
+            continue
+
+        text = item
+        if not isinstance(item, _Preformatted):
+            at_line_start = not parts or pending or parts[-1].endswith('\n')
+            if at_line_start or parts[-1].endswith(' '):
+                text = text.lstrip(' ')
+            if not text:
+                continue
+
+        if parts and not isinstance(parts[-1], _Preformatted) and (pending or item is _LINE_BREAK):
+            parts[-1] = parts[-1].rstrip(' ')
+        if pending and parts:
+            parts.append(_Preformatted('\n' * pending))
+        pending = 0
+        parts.append(text)
+
+    return ''.join(parts).strip()
+
+
+def tag_to_text(tag: Tag) -> str:
+    """Approximate `HTMLElement.innerText` for a parsed element, without any layout."""
+    items: list = []
+    for child in tag.contents:
+        _collect(child, items, pre=(tag.name or '').lower() == 'pre')
+    return _join(items)
+
+
+def html_to_text(html: str) -> str:
+    """Approximate the `innerText` of an element whose inner HTML is `html`."""
+    return tag_to_text(parse_html(html))
+
+
+def read_text(locator: Any) -> str:
+    """Read an element's visible text, avoiding the style/layout pass `inner_text()` forces."""
+    if get_config().layout_free_text:
+        return html_to_text(locator.inner_html() or '')
+    return locator.inner_text() or ''
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import base64
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from scraper.har import HarArchive
+from scraper.utils.assets import get_asset_store
+
+IMAGE_URL = 'https://cdn.example.com/images/a.png'
+BODY = b'\x89PNG\r\n\x1a\nnot really a png'
+
+
+def _har() -> dict:
+    entry = {
+        'request': {'url': IMAGE_URL},
+        'response': {
+            'status': 200,
+            'content': {
+                'mimeType': 'image/png',
+                'encoding': 'base64',
+                'text': base64.b64encode(BODY).decode(),
+            },
+        },
+    }
+    return {'log': {'entries': [entry]}}
+
+
+def test_zip_without_har_member_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / 'traffic.zip'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('body.bin', b'')
+    with pytest.raises(ValueError, match='without a .har member'):
+        HarArchive(path)
+
+
+def test_bodies_are_served_while_open(tmp_path: Path) -> None:
+    path = tmp_path / 'traffic.zip'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('traffic.har', json.dumps(_har()))
+    store = get_asset_store()
+    with HarArchive(path):
+        assert store.get(IMAGE_URL) == BODY
+        assert store.get('https://other.example.com/images/a.png') is None
+    assert store.get(IMAGE_URL) is None
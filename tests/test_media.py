@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import base64
+import struct
+from pathlib import Path
+
+import pytest
+from bs4.element import Tag
+
+from scraper.parsers.media import media_url
+from scraper.utils.assets import ensure_asset, safe_basename_from_url
+from scraper.utils.html import HTML_PARSER, parse_html
+
+PIXEL_GIF = 'data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7'
+PIXEL_PNG = (
+    'data:image/png;base64,'
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII='
+)
+
+
+def _png(width: int, height: int) -> bytes:
+    """A PNG signature and header chunk, enough for the size check to read."""
+    header = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + struct.pack('>I', 13) + b'IHDR' + header + b'\0\0\0\0'
+
+
+INLINE_PNG = 'data:image/png;base64,' + base64.b64encode(_png(32, 24)).decode('ascii')
+INLINE_SVG = 'data:image/svg+xml,%3Csvg%20xmlns%3D%22http%3A//www.w3.org/2000/svg%22%3E%3C/svg%3E'
+
+
+def _img(html: str) -> Tag:
+    return parse_html(html, backend=HTML_PARSER).find('img')
+
+
+@pytest.mark.parametrize('src', [INLINE_PNG, INLINE_SVG])
+def test_inline_images_are_kept(src: str) -> None:
+    assert media_url(_img(f'<img src="{src}">')) == src
+
+
+@pytest.mark.parametrize('placeholder', [PIXEL_GIF, PIXEL_PNG, 'data:,', 'data:image/gif;base64,'])
+def test_placeholders_give_way_to_the_lazy_source(placeholder: str) -> None:
+    img = _img(f'<img src="{placeholder}" data-src="https://example.com/real.png">')
+    assert media_url(img) == 'https://example.com/real.png'
+
+
+def test_inline_image_is_saved_from_its_payload(tmp_path: Path) -> None:
+    filename = f'block-{safe_basename_from_url(INLINE_PNG)}'
+    assert filename == 'block-inline.png'
+    assert ensure_asset(locator=None, url=INLINE_PNG, assets_dir=tmp_path, filename=filename)
+    assert (tmp_path / filename).read_bytes() == _png(32, 24)
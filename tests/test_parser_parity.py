@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip('lxml')
+pytest.importorskip('guesslang')  # Imported by the code block parser.
+
+from bs4.element import Tag
+
+from scraper.config import HtmlParser, OutputFormat, get_config
+from scraper.formats.md import MarkdownBuilder
+from scraper.formats.pdf import PDFBuilder
+from scraper.parsers.lesson import parse_lesson_content
+from scraper.parsers.static import StaticLocator
+from scraper.tools.parser_parity import describe_flowable, read_fragments, render_with
+from scraper.utils import html as html_utils
+from scraper.utils.html import HTML_PARSER, LXML, parse_html
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'lesson.html'
+BACKENDS = (HtmlParser.HTML_PARSER, HtmlParser.LXML, HtmlParser.AUTO)
+# The fixture's fragments are all below `LXML_MIN_CHARS`; this cutoff splits them, so `auto`
+# sends some to each backend.
+AUTO_CUTOFF = 1024
+
+
+@pytest.fixture(autouse=True)
+def _auto_cutoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(html_utils, 'LXML_MIN_CHARS', AUTO_CUTOFF)
+
+
+def _lesson(backend: str) -> Tag:
+    """The fixture's lesson element as parsed by `backend`."""
+    soup = parse_html(FIXTURE.read_text(encoding='utf-8'), backend=backend)
+    return soup.select_one('[data-lesson-id]')
+
+
+def _render_blocks(monkeypatch: pytest.MonkeyPatch, choice: HtmlParser) -> list[dict[str, Any]]:
+    """Parse and render every block of the fixture with `choice` as the configured parser."""
+    monkeypatch.setattr(get_config(), 'html_parser', choice)
+    pdf = PDFBuilder()
+    rendered = []
+    for block in parse_lesson_content(StaticLocator.from_html(FIXTURE.read_text(encoding='utf-8'))):
+        fields = {name: value for name, value in vars(block).items() if name != 'locator'}
+        rendered.append(
+            {
+                'type': type(block).__name__,
+                'fields': fields,
+                'markdown': block.render(OutputFormat.MD, builder=MarkdownBuilder()),
+                'flowables': [
+                    describe_flowable(f) for f in block.render(OutputFormat.PDF, builder=pdf) or []
+                ],
+            }
+        )
+    return rendered
+
+
+def test_fixture_exercises_both_fragment_sizes() -> None:
+    sizes = [len(html) for _label, html in read_fragments(FIXTURE)]
+    assert len(sizes) > 10
+    assert max(sizes) >= AUTO_CUTOFF > min(sizes)
+
+
+def test_backends_parse_the_same_lesson() -> None:
+    assert str(_lesson(HTML_PARSER)) == str(_lesson(LXML))
+
+
+@pytest.mark.parametrize('choice', BACKENDS[1:])
+def test_backends_render_fragments_identically(choice: HtmlParser) -> None:
+    fragments = read_fragments(FIXTURE)
+    builder = PDFBuilder()
+    expected = render_with(HtmlParser.HTML_PARSER.value, fragments, builder)
+    actual = render_with(choice.value, fragments, builder)
+    for (label, _html), want, got in zip(fragments, expected, actual):
+        assert got == want, label
+
+
+@pytest.mark.parametrize('choice', BACKENDS[1:])
+def test_backends_render_blocks_identically(monkeypatch: pytest.MonkeyPatch, choice: HtmlParser) -> None:
+    expected = _render_blocks(monkeypatch, HtmlParser.HTML_PARSER)
+    assert {block['type'] for block in expected} >= {'TabsBlock', 'AccordionBlock', 'TextBlock'}
+    actual = _render_blocks(monkeypatch, choice)
+    assert [block['type'] for block in actual] == [block['type'] for block in expected]
+    for want, got in zip(expected, actual):
+        assert got == want, want['fields'].get('block_id')